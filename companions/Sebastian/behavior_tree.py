@@ -20,30 +20,66 @@ if sys.stderr is None:
 
 # Basic
 import random as r
-from time import time
-from math import sqrt
+from time import monotonic
+from math import sqrt, inf
 from typing import TYPE_CHECKING
 
-# IO
-from pynput.mouse import Controller
-
 # Behavior
-from py_trees.blackboard import Blackboard
 from py_trees.common import Status
 from py_trees.behaviour import Behaviour
 from py_trees.decorators import Inverter
 from py_trees.composites import Sequence, Selector
 
 # Custom modules
+from modules.core.hazard import GrowingChance
 if TYPE_CHECKING:
     from modules.companion_base import Companion
+    from modules.companion_base.spatial_index import SpatialHash
+
+
+
+# Energy costs were balanced per tick of the 32 ms frame,
+# rates keep the same curve without depending on the tick rate
+TICKS_PER_S = 1000 / 32
+
+# Idle animations picked when nothing else is due: (name, weight, cycles)
+IDLES = (
+    ("idle", 0.8, (3, 8)),
+    ("idle_look_back", 0.2, (1, 1)),
+)
 
 
 
-# Typied Blackboard
-class TBoard(Blackboard):
-    companion: "Companion"
-    mouse: Controller
+# Typed blackboard, one per tree so every
+# companion's behaviours drive that companion
+class TBoard:
+    def __init__(self, companion: "Companion"):
+        self.companion = companion
+        # Positions of all companions on the screen, for
+        # proximity checks like following or avoiding others
+        self.spatial: "SpatialHash" = companion.spatial_index
+        # Activity whose energy rate is running
+        self.exerting: "Activity" = None
+
+
+
+class Activity(Behaviour):
+    """
+    Behaviour that spends (or restores) energy at `energy_rate`
+    per second while it runs. Energy is accounted by time, so
+    subclasses only call `super().initialise()`.
+    """
+    energy_rate: float = 0.0
+
+    def initialise(self):
+        self.board.exerting = self
+        self.board.companion.set_energy_rate(self.energy_rate)
+
+    def terminate(self, new_status):
+        # Interrupted activity may be stopped after the next one started
+        if self.board.exerting is self:
+            self.board.exerting = None
+            self.board.companion.set_energy_rate(0.0)
 
 
 
@@ -55,14 +91,14 @@ class Resetter(Behaviour):
         super().__init__(name=name)
 
     def initialise(self):
-        energy = TBoard.companion.get_energy()
-        energy_percent = int(TBoard.companion.get_energy_level() * 100)
-        print(f"Resetter | New tick | ⚡ {energy} ({energy_percent} %)")
+        energy = self.board.companion.get_energy()
+        energy_percent = int(self.board.companion.get_energy_level() * 100)
+        print(f"Resetter | New tick | ⚡ {energy:.0f} ({energy_percent} %)")
 
         # Stop animation from some of interactions animation
-        TBoard.companion.stop_animation()
+        self.board.companion.stop_animation()
         # Reduce interaction actions to 1 or 0
-        TBoard.companion.resolve_interactions()
+        self.board.companion.resolve_interactions()
 
     def update(self):
         return Status.SUCCESS
@@ -76,7 +112,7 @@ class IsOnGround(Behaviour):
         super().__init__(name)
 
     def update(self):
-        if TBoard.companion.get_feet_pos()[1] + 1 == TBoard.companion.get_ground_level():
+        if self.board.companion.get_feet_pos()[1] + 1 == self.board.companion.get_ground_level():
             return Status.SUCCESS
         return Status.FAILURE
 
@@ -88,7 +124,7 @@ class IsAboveGround(Behaviour):
         super().__init__(name)
 
     def update(self):
-        if TBoard.companion.get_feet_pos()[1] + 1 < TBoard.companion.get_ground_level():
+        if self.board.companion.get_feet_pos()[1] + 1 < self.board.companion.get_ground_level():
             return Status.SUCCESS
         return Status.FAILURE
 
@@ -98,45 +134,47 @@ class Fall(Behaviour):
         super().__init__(name)
 
     def update(self):
-        if TBoard.companion.fall_to_ground():
-            if TBoard.companion.get_velocities()[1] < -4:
-                TBoard.companion.start_animation('fly_upward')
-            elif TBoard.companion.get_velocities()[1] > 4:
-                TBoard.companion.start_animation('fly_downward')
+        if self.board.companion.fall_to_ground():
+            if self.board.companion.get_velocities()[1] < -4:
+                self.board.companion.start_animation('fly_upward')
+            elif self.board.companion.get_velocities()[1] > 4:
+                self.board.companion.start_animation('fly_downward')
             else:
-                TBoard.companion.start_animation('fly_apex')
+                self.board.companion.start_animation('fly_apex')
 
-            if 0 <= TBoard.companion.get_velocities()[1] <= 22:
+            if 0 <= self.board.companion.get_velocities()[1] <= 22:
                 self._catch_mouse()
             return Status.RUNNING
         self._catch_mouse()
         return Status.SUCCESS
 
     def _catch_mouse(self):
-        mouse_x, mouse_y = TBoard.mouse.position
-        x, y = TBoard.companion.get_feet_pos()
+        mouse_x, mouse_y = self.board.companion.get_cursor_pos()
+        x, y = self.board.companion.get_feet_pos()
         if x - 28 <= mouse_x <= x + 28 \
         and y - 18 <= mouse_y <= y:
-            TBoard.mouse.position = (
-                int(mouse_x + TBoard.companion.get_velocities()[0]),
-                int(y + TBoard.companion.get_velocities()[1])
+            self.board.companion.warp_cursor(
+                int(mouse_x + self.board.companion.get_velocities()[0]),
+                int(y + self.board.companion.get_velocities()[1])
             )
 
-class Landing(Behaviour):
+class Landing(Activity):
+    energy_rate = -3 * TICKS_PER_S
+
     def __init__(self, name="Land"):
         super().__init__(name)
 
     def initialise(self):
+        super().initialise()
         animation_name = 'land_recover'
 
-        if TBoard.companion.get_land_velocity() > 30:
+        if self.board.companion.get_land_velocity() > 30:
             animation_name = 'land_flat'
         
-        TBoard.companion.start_animation(name=animation_name, repeat=1)
+        self.board.companion.start_animation(name=animation_name, repeat=1)
 
     def update(self):
-        if TBoard.companion.is_animating():
-            TBoard.companion.change_energy(-3)
+        if self.board.companion.is_animating():
             return Status.RUNNING
         return Status.SUCCESS
 
@@ -147,23 +185,26 @@ class IsUnderGround(Behaviour):
         super().__init__(name)
 
     def update(self):
-        if TBoard.companion.get_feet_pos()[1] + 1 > TBoard.companion.get_ground_level():
+        if self.board.companion.get_feet_pos()[1] + 1 > self.board.companion.get_ground_level():
             return Status.SUCCESS
         return Status.FAILURE
 
 
-class JumpOutSetup(Behaviour):
+class JumpOutSetup(Activity):
+    energy_rate = -3 * TICKS_PER_S
+
     def __init__(self, name="JumpOutSetup"):
         super().__init__(name)
 
     def initialise(self):
+        super().initialise()
         # He-he, another in a hurry obscurantism
         # TODO: Rewrite velocity calculation logic
 
-        x, y = TBoard.companion.get_centers()
+        x, y = self.board.companion.get_centers()
 
-        distance_x = 30 * TBoard.companion._window.label.direction
-        distance_y = y + 80 - TBoard.companion.get_ground_level()
+        distance_x = 30 * self.board.companion.get_direction()
+        distance_y = y + 80 - self.board.companion.get_ground_level()
 
         gravity = 64
         t = sqrt(2 * abs(distance_y) / gravity)
@@ -174,12 +215,11 @@ class JumpOutSetup(Behaviour):
         vertical_velocity = min(26, (distance_y + 0.5 * gravity * t**2) / t / 4)
         vertical_velocity *= -1
 
-        TBoard.companion.set_velocities(vx=horizontal_velocity, vy=vertical_velocity)
-        TBoard.companion.start_animation(name='jump_start', repeat=1)
+        self.board.companion.set_velocities(vx=horizontal_velocity, vy=vertical_velocity)
+        self.board.companion.start_animation(name='jump_start', repeat=1)
 
     def update(self):
-        if TBoard.companion.is_animating():
-            TBoard.companion.change_energy(-3)
+        if self.board.companion.is_animating():
             return Status.RUNNING
         return Status.SUCCESS
 
@@ -189,13 +229,13 @@ class JumpOut(Behaviour):
         super().__init__(name)
 
     def update(self):
-        if TBoard.companion.fall_to_ground():
-            if TBoard.companion.get_velocities()[1] < -4:
-                TBoard.companion.start_animation('fly_upward')
-            elif TBoard.companion.get_velocities()[1] > 4:
-                TBoard.companion.start_animation('fly_downward')
+        if self.board.companion.fall_to_ground():
+            if self.board.companion.get_velocities()[1] < -4:
+                self.board.companion.start_animation('fly_upward')
+            elif self.board.companion.get_velocities()[1] > 4:
+                self.board.companion.start_animation('fly_downward')
             else:
-                TBoard.companion.start_animation('fly_apex')
+                self.board.companion.start_animation('fly_apex')
             return Status.RUNNING
         return Status.SUCCESS
 
@@ -208,8 +248,8 @@ class IsUserNotInteracting(Behaviour):
         super().__init__(name)
 
     def update(self):
-        if TBoard.companion.get_interactions():
-            TBoard.companion.stop_animation()
+        if self.board.companion.get_interactions():
+            self.board.companion.stop_animation()
             return Status.FAILURE
         return Status.SUCCESS
 
@@ -221,21 +261,24 @@ class IsEnergyLow(Behaviour):
         super().__init__(name)
 
     def update(self):
-        if TBoard.companion.get_energy_level() <= 0.15:
+        if self.board.companion.get_energy_level() <= 0.15:
             return Status.SUCCESS
         return Status.FAILURE
 
-class Sleep(Behaviour):
+class Sleep(Activity):
+    energy_rate = 40 * TICKS_PER_S
+
     def __init__(self, name="Sleep"):
         super().__init__(name)
 
     def initialise(self):
-        TBoard.companion.start_animation(name='sleep')
+        super().initialise()
+        self.board.companion.start_animation(name='sleep')
     
     def update(self):
-        TBoard.companion.change_energy(40)
-        
-        if TBoard.companion.get_energy_level() < 0.95:
+        if self.board.companion.get_energy_level() < 0.95:
+            # Nothing to do until the energy is restored
+            self.board.companion.wait(self.board.companion.get_energy_eta(0.95))
             return Status.RUNNING
         return Status.SUCCESS
 
@@ -245,38 +288,32 @@ class Sleep(Behaviour):
 class IsTimeToMove(Behaviour):
     def __init__(self, name="TimeToMove?"):
         super().__init__(name)
-        self.init_probability = 0.01
-        self.probability = self.init_probability
+        self.chance = GrowingChance(initial=0.01, growth=0.001)
         self.out_of_field = False
-
-        self.icrease_rate = 0.001
-        self.timer = time()
+        self.timer = monotonic()
 
     def initialise(self):
-        x = TBoard.companion.get_feet_pos()[0]
+        x = self.board.companion.get_feet_pos()[0]
 
-        left_x, right_x = TBoard.companion.get_walking_area_x()
+        left_x, right_x = self.board.companion.get_walking_area_x()
         if not left_x <= x <= right_x:
             self.out_of_field = True
             return
 
-        elapsed_time = time() - self.timer
-        self.probability = min(1, self.probability + (elapsed_time * self.icrease_rate))
-
-        mouse_x, mouse_y = TBoard.mouse.position
+        mouse_x, mouse_y = self.board.companion.get_cursor_pos()
 
-        ground = TBoard.companion.get_ground_level()
+        ground = self.board.companion.get_ground_level()
 
         search_sizes = [
-            TBoard.companion._window.size().width() * 1.4,
-            TBoard.companion._window.anchor[1] * 1.2
+            self.board.companion.get_size()[0] * 1.4,
+            self.board.companion.get_anchor()[1] * 1.2
         ]
         # Companion want to move to mouse
         # when mouse in the field of sight
         # but not when close to him
         if (ground - 1 - search_sizes[1] <= mouse_y < ground) \
         and not (x - search_sizes[0] <= mouse_x <= x + search_sizes[0]):
-            self.probability = min(1, self.probability + 0.35)
+            self.chance.add_bonus(0.35)
 
     def update(self):
         if self.out_of_field:
@@ -284,64 +321,65 @@ class IsTimeToMove(Behaviour):
             return Status.SUCCESS
         
         # Check if the event occurs
-        if r.random() <= self.probability:
-            self.probability = self.init_probability    # Reset probability
-            self.timer = time()                         # Reset time
+        if self.chance.roll(monotonic() - self.timer):
+            self.timer = monotonic()
             return Status.SUCCESS
         return Status.FAILURE
 
 
-class Move(Behaviour):
+class Move(Activity):
+    energy_rate = -5 * TICKS_PER_S
+
     def __init__(self, name="Move"):
         super().__init__(name)
         self.out_of_field = False
         self.desired_position_x = None
 
     def initialise(self):
-        x = TBoard.companion.get_feet_pos()[0]
+        super().initialise()
+        x = self.board.companion.get_feet_pos()[0]
 
-        left_x, right_x = TBoard.companion.get_walking_area_x()
+        left_x, right_x = self.board.companion.get_walking_area_x()
 
         if not left_x <= x <= right_x:
             dist_left = abs(x - left_x)
             dist_right = abs(x - right_x)
 
-            ratio = TBoard.companion._window.size().width() / 2
+            ratio = self.board.companion.get_size()[0] / 2
             if dist_left < dist_right:
                 self.desired_position_x = r.randint(
                     int(ratio),
-                    int(ratio + (5 * TBoard.companion._window.anchor[0]))
+                    int(ratio + (5 * self.board.companion.get_anchor()[0]))
                 )
             else:
                 self.desired_position_x = r.randint(
-                    int(right_x - ratio - (5 * TBoard.companion._window.anchor[0])),
+                    int(right_x - ratio - (5 * self.board.companion.get_anchor()[0])),
                     int(right_x - ratio)
                 )
-            TBoard.companion.resolve_gaze(self.desired_position_x)
-            TBoard.companion.start_animation(name="walk")
+            self.board.companion.resolve_gaze(self.desired_position_x)
+            self.board.companion.start_animation(name="walk")
             self.out_of_field = True
             return
 
-        mouse_x, mouse_y = TBoard.mouse.position
+        mouse_x, mouse_y = self.board.companion.get_cursor_pos()
 
-        ground = TBoard.companion.get_ground_level()
+        ground = self.board.companion.get_ground_level()
 
         search_sizes = [
-            TBoard.companion._window.size().width() * 1.4,
-            TBoard.companion._window.anchor[1] * 1.2
+            self.board.companion.get_size()[0] * 1.4,
+            self.board.companion.get_anchor()[1] * 1.2
         ]
 
         if ground - 1 - search_sizes[1] <= mouse_y <= ground:
             self.desired_position_x = mouse_x + r.randint(-120, 120)
         else:
-            self.desired_position_x = r.randint(*TBoard.companion.get_walking_area_x())
+            self.desired_position_x = r.randint(*self.board.companion.get_walking_area_x())
         
-        TBoard.companion.resolve_gaze(self.desired_position_x)
-        TBoard.companion.start_animation(name="walk")
+        self.board.companion.resolve_gaze(self.desired_position_x)
+        self.board.companion.start_animation(name="walk")
 
     def update(self):
-        if TBoard.companion.move_to_goal(x=self.desired_position_x, speed_multiplier=1.6 if self.out_of_field else 1):
-            TBoard.companion.change_energy(-5)
+        if self.board.companion.move_to_goal(x=self.desired_position_x, speed_multiplier=1.6 if self.out_of_field else 1):
             return Status.RUNNING
         self.desired_position_x = None
         self.out_of_field = False
@@ -353,53 +391,49 @@ class Move(Behaviour):
 class IsTimeToJump(Behaviour):
     def __init__(self, name="TimeToJump?"):
         super().__init__(name)
-        self.init_probability = 0.01
-        self.probability = self.init_probability
-
-        self.icrease_rate = 0.001
-        self.timer = time()
+        self.chance = GrowingChance(initial=0.01, growth=0.001 / 2)
+        self.timer = monotonic()
 
     def initialise(self):
-        elapsed_time = time() - self.timer
-        self.probability = min(1, self.probability + (elapsed_time * self.icrease_rate) / 2)
+        x = self.board.companion.get_feet_pos()[0]
+        mouse_x, mouse_y = self.board.companion.get_cursor_pos()
 
-        x = TBoard.companion.get_feet_pos()[0]
-        mouse_x, mouse_y = TBoard.mouse.position
-
-        ground = TBoard.companion.get_ground_level()
+        ground = self.board.companion.get_ground_level()
         search_sizes = [
-            TBoard.companion._window.size().width() * 1.4,
-            TBoard.companion._window.anchor[1] * 1.4
+            self.board.companion.get_size()[0] * 1.4,
+            self.board.companion.get_anchor()[1] * 1.4
         ]
 
-        center_x = TBoard.companion.get_centers()[0]
+        center_x = self.board.companion.get_centers()[0]
         
         # Add extra chance when the mouse is nearby
         # So companion totally want to catch it
         if (ground - 1 - search_sizes[1] <= mouse_y <= ground - 1) \
         and (x - search_sizes[0] <= mouse_x <= x + search_sizes[0]):
-            self.probability = min(1, self.probability + 0.65)
+            self.chance.add_bonus(0.65)
 
     def update(self):
-        if r.random() <= self.probability:
-            self.probability = self.init_probability    # Reset probability
-            self.timer = time()                         # Reset time
+        if self.chance.roll(monotonic() - self.timer):
+            self.timer = monotonic()
             return Status.SUCCESS
         return Status.FAILURE
 
 
-class JumpSetup(Behaviour):
+class JumpSetup(Activity):
+    energy_rate = -3 * TICKS_PER_S
+
     def __init__(self, name="JumpPreparing"):
         super().__init__(name)
 
     def initialise(self):
+        super().initialise()
         # He-he, another in a hurry obscurantism
         # TODO: Rewrite velocity calculation logic
         
-        mouse_x, mouse_y = TBoard.mouse.position
+        mouse_x, mouse_y = self.board.companion.get_cursor_pos()
 
-        distance_x = mouse_x - TBoard.companion.get_centers()[0]
-        distance_y = TBoard.companion.get_ground_level() - mouse_y
+        distance_x = mouse_x - self.board.companion.get_centers()[0]
+        distance_y = self.board.companion.get_ground_level() - mouse_y
 
         gravity = 64
         t = sqrt(2 * abs(distance_y) / gravity)
@@ -410,37 +444,37 @@ class JumpSetup(Behaviour):
         vertical_velocity = min(26, (distance_y + 0.5 * gravity * t**2) / t / 4)
         vertical_velocity *= -1
 
-        TBoard.companion.set_velocities(vx=horizontal_velocity, vy=vertical_velocity)
-        TBoard.companion.start_animation(name='jump_start', repeat=1)
+        self.board.companion.set_velocities(vx=horizontal_velocity, vy=vertical_velocity)
+        self.board.companion.start_animation(name='jump_start', repeat=1)
 
     def update(self):
-        if TBoard.companion.is_animating():
-            TBoard.companion.change_energy(-3)
+        if self.board.companion.is_animating():
             return Status.RUNNING
-        TBoard.companion.fall_to_ground()
+        self.board.companion.fall_to_ground()
         return Status.SUCCESS
 
 
 # ===
 # === Idling ===
-class Idle(Behaviour):
+class Idle(Activity):
+    energy_rate = -3 * TICKS_PER_S
+
     def __init__(self, name="Idle"):
         super().__init__(name)
 
     def initialise(self):
-        idle = r.choices(
-            population=['idle', 'idle_look_back'],
-            weights=[0.8, 0.2]
+        super().initialise()
+        idle, _, cycles = r.choices(
+            population=IDLES,
+            weights=[weight for _, weight, _ in IDLES]
         )[0]
 
-        if idle == 'idle':
-            TBoard.companion.start_animation(name=idle, repeat=r.randint(3, 8))
-        else:
-            TBoard.companion.start_animation(name=idle, repeat=1)
+        self.board.companion.start_animation(name=idle, repeat=r.randint(*cycles))
     
     def update(self):
-        if TBoard.companion.is_animating():
-            TBoard.companion.change_energy(-3)
+        if self.board.companion.is_animating():
+            # End of the animation wakes the tree up
+            self.board.companion.wait(inf)
             return Status.RUNNING
         return Status.SUCCESS
     
@@ -453,7 +487,7 @@ class IsOneInteraction(Behaviour):
         super().__init__(name)
 
     def update(self):
-        if len(TBoard.companion.get_interactions()) == 1:
+        if len(self.board.companion.get_interactions()) == 1:
             return Status.SUCCESS
         return Status.FAILURE
 
@@ -463,7 +497,7 @@ class IsInteraction(Behaviour):
         super().__init__(name)
 
     def update(self):
-        if self.name.startswith(TBoard.companion.get_interactions()[0]):
+        if self.name.startswith(self.board.companion.get_interactions()[0]):
             print(f"Interacting: {self.name[:-1]}")
             return Status.SUCCESS
         return Status.FAILURE
@@ -471,69 +505,68 @@ class IsInteraction(Behaviour):
 
 # ===
 # === Disturbing ===
-class Disturb(Behaviour):
+class Disturb(Activity):
+    energy_rate = -3 * TICKS_PER_S
+
     def __init__(self, name="Disturb"):
         super().__init__(name)
 
     def initialise(self):
-        TBoard.companion.start_animation(name='bristle', repeat=1)
+        super().initialise()
+        self.board.companion.start_animation(name='bristle', repeat=1)
     
     def update(self):
-        if TBoard.companion.is_animating():
-            TBoard.companion.change_energy(-3)
+        if self.board.companion.is_animating():
             return Status.RUNNING
         return Status.SUCCESS
 
 
 # ===
 # === Holding ===
-class Hold(Behaviour):
+class Hold(Activity):
+    energy_rate = -1 * TICKS_PER_S
+
     def __init__(self, name="Hold"):
         super().__init__(name)
 
     def initialise(self):
-        TBoard.companion.start_animation(name='grabbed')
+        super().initialise()
+        self.board.companion.start_animation(name='grabbed')
 
     def update(self):
-        if TBoard.companion.is_animating():
-            TBoard.companion.change_energy(-1)
+        if self.board.companion.is_animating():
             return Status.RUNNING
         return Status.SUCCESS
 
 
 # ===
 # === Assisting ===
-# class Assist(Behaviour):
-#     def __init__(self, name="Assist"):
-#         super().__init__(name)
-
-#     def initialise(self):
-#         self.result_queue = queue.Queue()
-
-#         name = 'idle_2'
-#         TBoard.companion.animation_id = TBoard.companion.after(
-#             TBoard.companion.animations[name]['duration'],
-#                             TBoard.companion.play_animation,
-#                             name)
-#         TBoard.companion.speaking_id = TBoard.companion.after(0, TBoard.companion.speaking, self.result_queue)
+class Assist(Behaviour):
+    def __init__(self, name="Assist"):
+        super().__init__(name)
+
+    def initialise(self):
+        self.board.companion.start_animation(name='idle')
+        # Reply is produced in background and
+        # streamed into the dialog by the companion
+        self.board.companion.start_reply()
         
-#     def update(self):
-#         try:
-#             result = self.result_queue.get_nowait()  # Non-blocking get from queue
-#             TBoard.companion.dialog.show_dialog(result, TBoard.companion.direction)
-#             print("Dialog endid")
-#             TBoard.companion.user_interacted = ''
-#             return Status.SUCCESS
-#         except queue.Empty:
-#             return Status.RUNNING
+    def update(self):
+        if self.board.companion.is_replying():
+            return Status.RUNNING
+        return Status.SUCCESS
+
+    def terminate(self, new_status):
+        # Interrupted by another interaction or a reset
+        if new_status == Status.INVALID:
+            self.board.companion.cancel_reply()
 
 
 # ==================================================
 #           Tree
 # ==================================================
 def create_tree(companion_api: "Companion"):
-    TBoard.companion = companion_api
-    TBoard.mouse = Controller()
+    board = TBoard(companion_api)
 
     # Creating a root of the tree
     root = Selector(name="Root", memory=True)
@@ -587,8 +620,8 @@ def create_tree(companion_api: "Companion"):
             IsInteraction(name="Disturb?"), Disturb()]),
         Sequence(name="Holding", memory=True, children=[
             IsInteraction(name="Hold?"), Hold()]),
-        # Sequence(name="Assist", memory=True, children=[
-        #     IsInteraction(name="IsAssist"), Assist()]),
+        Sequence(name="Assisting", memory=True, children=[
+            IsInteraction(name="Assist?"), Assist()]),
     ])
     
     interaction  = Sequence(name="Interaction", memory=False, children=[
@@ -605,4 +638,8 @@ def create_tree(companion_api: "Companion"):
         interaction
     ])
 
+    # Behaviours reach their companion through the tree's board
+    for behaviour in root.iterate():
+        behaviour.board = board
+
     return root
\ No newline at end of file
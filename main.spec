@@ -1,6 +1,19 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+import sys
+import subprocess
+from pathlib import Path
 
 
+# Compiled sprite metadata ships with the assets, so the build never
+# falls back to scanning sprite sheets at runtime
+subprocess.run(
+    [sys.executable, '-m', 'tools.sprite_compiler', *map(str, Path(SPECPATH, 'companions').iterdir())],
+    cwd=SPECPATH, check=True,
+    # Compiler only converts images, no display is needed
+    env={**os.environ, 'QT_QPA_PLATFORM': 'offscreen'},
+)
+
 a = Analysis(
     ['main.py'],
     pathex=[],
@@ -0,0 +1,2 @@
+from .sprite_sheet import load_sheet, load_compiled, compile_sheet
+from .companion_package import CompanionPackage, open_package, build_package
\ No newline at end of file
@@ -0,0 +1,205 @@
+# Basic
+import json
+import mmap
+import struct
+import marshal
+import zipfile
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+# Application
+from PyQt6.QtGui import QImage
+
+# Custom modules
+from modules.core.path_manager import PathManager
+from .sprite_sheet import compile_sheet
+
+
+
+# Version of `.qpal` layout, bumped on incompatible changes
+PACKAGE_FORMAT = 1
+
+# Pixels are stored ready to be turned into pixmaps
+ATLAS_FORMAT = QImage.Format.Format_ARGB32_Premultiplied
+
+# Alignment of member data inside the archive,
+# QImage requires at least 32-bit aligned scanlines
+MEMBER_ALIGNMENT = 16
+
+# Zip extra field id used for padding (same as Android zipalign)
+PADDING_EXTRA_ID = 0xD935
+
+_LOCAL_HEADER_SIZE = 30
+
+
+
+class CompanionPackage:
+    """
+    Read-only view of a `.qpal` companion package.
+
+    The package is an uncompressed zip archive with:
+        manifest.json       - animations, frame size, atlas layout
+        behavior_tree.pyc   - marshalled code of behavior_tree.py
+        static.raw          - decoded static sprite
+        atlas.raw           - decoded sprite sheet
+
+    The file is mapped into memory once, members are returned
+    as memoryview slices of the mapping, without copying.
+    """
+    def __init__(self, path: Path):
+        self.path = path
+
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        # Member name -> (data offset, size)
+        self._members: dict[str, tuple[int, int]] = {}
+        with zipfile.ZipFile(self._file) as archive:
+            for info in archive.infolist():
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError(f"{path.name}: member {info.filename} is compressed")
+
+                # Data follows the local header, which may
+                # have different extra field than central directory
+                offset = info.header_offset
+                name_len, extra_len = struct.unpack_from("<HH", self._mmap, offset + 26)
+                data_offset = offset + _LOCAL_HEADER_SIZE + name_len + extra_len
+                self._members[info.filename] = (data_offset, info.file_size)
+
+        self.manifest = json.loads(bytes(self.read("manifest.json")))
+        if self.manifest.get("format") != PACKAGE_FORMAT:
+            raise ValueError(f"{path.name}: unsupported package format {self.manifest.get('format')}")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._members
+
+    def members(self) -> dict[str, int]:
+        """Member name -> size in bytes"""
+        return {name: size for name, (_, size) in self._members.items()}
+
+    def read(self, name: str) -> memoryview:
+        offset, size = self._members[name]
+        return self._view[offset:offset + size]
+
+    def image(self, name: str) -> QImage:
+        """
+        Image over the package memory (no copy).
+        Valid only while the package stays open.
+        """
+        layout = self.manifest["images"][name]
+        return QImage(
+            self.read(f"{name}.raw"),
+            layout["width"],
+            layout["height"],
+            layout["bytes_per_line"],
+            ATLAS_FORMAT
+        )
+
+    def load_module(self, module_name: str) -> ModuleType:
+        if self.manifest.get("python_magic") != importlib.util.MAGIC_NUMBER.hex():
+            raise ImportError(f"{self.path.name} was built for another Python version, rebuild it")
+
+        code = marshal.loads(self.read("behavior_tree.pyc"))
+        module = ModuleType(module_name)
+        module.__file__ = str(self.path / "behavior_tree.py")
+        exec(code, module.__dict__)
+        return module
+
+    def close(self) -> None:
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+
+
+# Opened packages, one mapping per package for the whole process
+_packages: dict[str, CompanionPackage] = {}
+
+
+def open_package(companion_name: str) -> CompanionPackage | None:
+    """Package of the companion, or None when it's a loose directory"""
+    if companion_name not in _packages:
+        path = PathManager.get_companion_package_path(companion_name)
+        if not path.exists():
+            return None
+        _packages[companion_name] = CompanionPackage(path)
+    return _packages[companion_name]
+
+
+
+# === Building ===
+def _image_member(image: QImage) -> tuple[dict, bytes]:
+    image = image.convertToFormat(ATLAS_FORMAT)
+    ptr = image.constBits()
+    ptr.setsize(image.sizeInBytes())
+    layout = {
+        "width": image.width(),
+        "height": image.height(),
+        "bytes_per_line": image.bytesPerLine(),
+    }
+    return layout, bytes(ptr)
+
+
+def _write_aligned(archive: zipfile.ZipFile, name: str, data: bytes) -> None:
+    info = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+    info.compress_type = zipfile.ZIP_STORED
+
+    # Pad extra field so member data starts at an aligned offset
+    header_end = archive.fp.tell() + _LOCAL_HEADER_SIZE + len(name.encode()) + 4
+    padding = -header_end % MEMBER_ALIGNMENT
+    info.extra = struct.pack("<HH", PADDING_EXTRA_ID, padding) + bytes(padding)
+
+    archive.writestr(info, data)
+
+
+def build_package(companion_dir: Path, output: Path = None) -> Path:
+    """
+    Build `.qpal` package from a loose companion directory.
+
+    Args:
+        companion_dir (Path): Directory with behavior_tree.py and assets
+        output (Path, optional): Package path.
+            Defaults to the directory path with `.qpal` suffix
+
+    Returns:
+        Path: Path of the written package.
+    """
+    companion_dir = Path(companion_dir)
+    output = Path(output) if output else companion_dir.with_suffix(".qpal")
+    assets_dir = companion_dir / "assets"
+
+    source_path = companion_dir / "behavior_tree.py"
+    code = compile(source_path.read_bytes(), str(source_path), "exec")
+
+    static = QImage(str(assets_dir / "sprite_static.png"))
+    sheet = QImage(str(assets_dir / "sprites_sheet.png"))
+    if static.isNull() or sheet.isNull():
+        raise FileNotFoundError(f"Sprites not found in {assets_dir}")
+
+    # Frame counts and masks are computed once here instead of on every launch
+    compiled, _ = compile_sheet(assets_dir)
+
+    static_layout, static_data = _image_member(static)
+    atlas_layout, atlas_data = _image_member(sheet)
+
+    manifest = {
+        "format": PACKAGE_FORMAT,
+        "name": companion_dir.name,
+        "python_magic": importlib.util.MAGIC_NUMBER.hex(),
+        "frame_size": compiled["frame_size"],
+        "images": {
+            "static": static_layout,
+            "atlas": atlas_layout,
+        },
+        "animations": compiled["animations"],
+    }
+
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_STORED) as archive:
+        _write_aligned(archive, "manifest.json", json.dumps(manifest, separators=(",", ":")).encode())
+        _write_aligned(archive, "behavior_tree.pyc", marshal.dumps(code))
+        _write_aligned(archive, "static.raw", static_data)
+        _write_aligned(archive, "atlas.raw", atlas_data)
+
+    return output
@@ -0,0 +1,313 @@
+# Basic
+import json
+import hashlib
+from pathlib import Path
+from typing import Iterator
+
+# Application
+from PyQt6.QtGui import QImage, QRegion, QTransform
+from PyQt6.QtCore import QRect
+
+
+
+def is_fully_transparent(qimage: QImage) -> bool:
+    """
+    Checks if all pixels in the image are fully transparent
+    (alpha channel = 0)
+
+    Args:
+        qimage (QImage): Image to check
+
+    Returns:
+        bool: True if image is fully transparent, False otherwise
+
+    Notes:
+        - This function could be optimized using NumPy,
+        but is that really necessary for this use case
+        with a few low-resolution frames?
+    """
+    image = qimage.convertToFormat(QImage.Format.Format_RGBA8888)
+    
+    # Get pointer to raw bytes of the image
+    ptr = image.constBits()
+
+    # RGBA = 4 bytes per pixel
+    ptr.setsize(image.width() * image.height() * 4)
+
+    data = memoryview(ptr)
+    # Check if all alpha channels are zero
+    for i in range(3, len(data), 4):
+        if data[i] != 0:
+            return False
+    return True
+
+
+def iter_frames(sheet: QImage, row: int, frame_w: int, frame_h: int,
+                n_frames: int = None) -> Iterator[QImage]:
+    """
+    Yields frames of one animation row of the sprite sheet.
+
+    Args:
+        sheet (QImage): Sprite sheet, one animation per row
+        row (int): Row number, starting from 1
+        frame_w (int): Width of one frame
+        frame_h (int): Height of one frame
+        n_frames (int, optional): Known number of frames.
+            When omitted, the first fully transparent
+            cell is treated like the end of animation
+    """
+    columns = sheet.width() // frame_w if n_frames is None else n_frames
+
+    for col in range(columns):
+        frame = sheet.copy(
+            col * frame_w,
+            (row - 1) * frame_h,
+            frame_w,
+            frame_h
+        )
+
+        if n_frames is None and is_fully_transparent(frame):
+            break
+
+        yield frame
+
+
+def count_frames(sheet: QImage, row: int, frame_w: int, frame_h: int) -> int:
+    return sum(1 for _ in iter_frames(sheet, row, frame_w, frame_h))
+
+
+
+# ==================================================
+#           Compiled sprite metadata
+# ==================================================
+# Written next to the sheet by `tools.sprite_compiler`
+COMPILED_METADATA = "sprites_compiled.json"
+COMPILED_FORMAT = 1
+
+
+def _alpha_rows(image: QImage) -> tuple[list[bytes], bytes]:
+    """Alpha channel of every row and raw RGBA8888 pixels of the image"""
+    image = image.convertToFormat(QImage.Format.Format_RGBA8888)
+    ptr = image.constBits()
+    ptr.setsize(image.sizeInBytes())
+    data = bytes(ptr)
+
+    bpl = image.bytesPerLine()
+    width = image.width()
+    rows = [data[y * bpl + 3:y * bpl + width * 4:4] for y in range(image.height())]
+    pixels = b"".join(data[y * bpl:y * bpl + width * 4] for y in range(image.height()))
+    return rows, pixels
+
+
+def _row_runs(alpha: bytes) -> list[int]:
+    """Opaque runs of one row as flat [x, length, x, length, ...]"""
+    runs = []
+    start = None
+    for x, value in enumerate(alpha):
+        if value and start is None:
+            start = x
+        elif not value and start is not None:
+            runs += [start, x - start]
+            start = None
+    if start is not None:
+        runs += [start, len(alpha) - start]
+    return runs
+
+
+def _bands(rows: list[bytes]) -> list:
+    """Run-length mask of alpha rows, rows with identical runs merged into one band"""
+    mask = []
+    for y, alpha in enumerate(rows):
+        runs = _row_runs(alpha)
+        if not runs:
+            continue
+        if mask and mask[-1][0] + mask[-1][1] == y and mask[-1][2] == runs:
+            mask[-1][1] += 1
+        else:
+            mask.append([y, 1, runs])
+    return mask
+
+
+def frame_mask(frame: QImage) -> list:
+    """
+    Run-length alpha mask of a frame as bands [y, height, [x, length, ...]].
+    Every pixel with non-zero alpha is part of it, compiled and runtime
+    masks use this same rule.
+    """
+    return _bands(_alpha_rows(frame)[0])
+
+
+def compile_frame(frame: QImage) -> dict:
+    """
+    Precomputed data of one frame:
+        rect   - trimmed [x, y, w, h] of non-transparent content
+        anchor - [x, y] bottom center of the content, i.e. feet point
+        hash   - sha1 of RGBA pixels, identical frames share it
+        mask   - run-length alpha mask, see `frame_mask`
+    """
+    rows, pixels = _alpha_rows(frame)
+    mask = _bands(rows)
+
+    if mask:
+        top = mask[0][0]
+        bottom = mask[-1][0] + mask[-1][1]
+        left = min(band[2][0] for band in mask)
+        right = max(band[2][-2] + band[2][-1] for band in mask)
+
+        # Feet stand on the lowest opaque row
+        last_runs = mask[-1][2]
+        feet_left, feet_right = last_runs[0], last_runs[-2] + last_runs[-1]
+        anchor = [(feet_left + feet_right) // 2, bottom - 1]
+        rect = [left, top, right - left, bottom - top]
+    else:
+        rect = [0, 0, 0, 0]
+        anchor = [frame.width() // 2, frame.height() - 1]
+
+    return {
+        "rect": rect,
+        "anchor": anchor,
+        "hash": hashlib.sha1(pixels).hexdigest(),
+        "mask": mask,
+    }
+
+
+def source_hashes(assets_dir: Path) -> dict:
+    return {
+        name: hashlib.sha1((assets_dir / name).read_bytes()).hexdigest()
+        for name in ("sprite_static.png", "sprites_sheet.png", "sprites_metadata.json")
+    }
+
+
+def compile_sheet(assets_dir: Path) -> tuple[dict, list[str]]:
+    """
+    Compile sheet and metadata of a companion into lookup-only metadata.
+
+    Args:
+        assets_dir (Path): Companion assets directory
+
+    Returns:
+        tuple[dict, list[str]]: Compiled metadata and validation warnings.
+
+    Raises:
+        ValueError: When sheet and metadata don't fit together.
+    """
+    static = QImage(str(assets_dir / "sprite_static.png"))
+    sheet = QImage(str(assets_dir / "sprites_sheet.png"))
+    if static.isNull() or sheet.isNull():
+        raise ValueError(f"Sprites not found in {assets_dir}")
+
+    with open(assets_dir / "sprites_metadata.json", "r") as f:
+        metadata = json.load(f)
+
+    frame_w, frame_h = static.width(), static.height()
+    n_rows = sheet.height() // frame_h
+
+    errors = []
+    warnings = []
+    if sheet.width() % frame_w or sheet.height() % frame_h:
+        errors.append(f"sheet {sheet.width()}x{sheet.height()} is not a grid of {frame_w}x{frame_h} frames")
+
+    animations = {}
+    rows_used = {}
+    for key, value in metadata.items():
+        row = value.get("row")
+        duration = value.get("frame_duration")
+
+        if not isinstance(row, int) or not 1 <= row <= n_rows:
+            errors.append(f"{key}: row {row} is outside of the sheet (1..{n_rows})")
+            continue
+        if not isinstance(duration, int) or duration <= 0:
+            errors.append(f"{key}: frame_duration must be a positive number of ms")
+            continue
+        if row in rows_used:
+            warnings.append(f"{key}: shares row {row} with {rows_used[row]}")
+        rows_used.setdefault(row, key)
+
+        frames = [compile_frame(frame) for frame in iter_frames(sheet, row, frame_w, frame_h)]
+        if not frames:
+            errors.append(f"{key}: row {row} has no frames")
+            continue
+
+        animations[key] = {
+            "row": row,
+            "frame_duration": duration,
+            "n_frames": len(frames),
+            "frames": frames,
+        }
+
+    if errors:
+        raise ValueError("Invalid sprites:\n  " + "\n  ".join(errors))
+
+    compiled = {
+        "format": COMPILED_FORMAT,
+        "source": source_hashes(assets_dir),
+        "frame_size": [frame_w, frame_h],
+        "sheet_size": [sheet.width(), sheet.height()],
+        "animations": animations,
+    }
+    return compiled, warnings
+
+
+def load_compiled(assets_dir: Path) -> dict | None:
+    """
+    Compiled metadata of the assets, or None if missing
+    or outdated (sheet or metadata changed since compilation).
+    """
+    path = assets_dir / COMPILED_METADATA
+    if not path.exists():
+        return None
+
+    with open(path, "r") as f:
+        compiled = json.load(f)
+
+    if compiled.get("format") != COMPILED_FORMAT \
+    or compiled.get("source") != source_hashes(assets_dir):
+        print(f"{path} is outdated, rebuild it with tools.sprite_compiler")
+        return None
+    return compiled
+
+
+def load_sheet(assets_dir: Path) -> tuple[QImage, dict]:
+    """
+    Sheet image and animations metadata of loose companion assets.
+    Compiled metadata is preferred, raw `sprites_metadata.json` is
+    the fallback (frame counts and masks are then scanned at runtime).
+    """
+    sheet = QImage(str(assets_dir / "sprites_sheet.png"))
+
+    compiled = load_compiled(assets_dir)
+    if compiled:
+        return sheet, compiled["animations"]
+
+    print(f"No compiled sprite metadata in {assets_dir}, scanning the sheet at runtime")
+    with open(assets_dir / "sprites_metadata.json", "r") as f:
+        return sheet, json.load(f)
+
+
+def mask_region(mask: list, scale: float = 1.0, mirror_width: int = None) -> QRegion:
+    """
+    Build region from run-length mask.
+
+    Args:
+        mask (list): Bands as produced by `compile_frame`
+        scale (float, optional): Scale of the rendered frame
+        mirror_width (int, optional): Width of the unscaled frame,
+            when given region is mirrored horizontally
+    """
+    rects = [
+        QRect(runs[i], y, runs[i + 1], height)
+        for y, height, runs in mask
+        for i in range(0, len(runs), 2)
+    ]
+    region = QRegion()
+    # Bands are already sorted and non-overlapping
+    region.setRects(rects)
+
+    transform = QTransform()
+    if scale != 1:
+        transform.scale(scale, scale)
+    if mirror_width is not None:
+        transform.translate(mirror_width, 0)
+        transform.scale(-1, 1)
+
+    return region if transform.isIdentity() else transform.map(region)
@@ -0,0 +1,91 @@
+# Basic
+import threading
+import traceback
+from typing import Callable
+
+
+
+class BehaviorWorker:
+    """
+    Dedicated thread that runs behavior tree ticks.
+
+    GUI thread requests a tick once per frame, and only when
+    the previous one has finished, so ticks never overlap and
+    a slow tree skips frames instead of piling them up.
+
+    There is never more than one thread per tree: the thread clears
+    its handle itself when it exits, and a thread still finishing
+    a tick after `stop` simply carries on if started again.
+    """
+    def __init__(self, name: str, tick: Callable[[], None]):
+        self._name = name
+        self._tick = tick
+
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread: threading.Thread = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"{self._name}-behavior",
+                daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            thread = self._thread
+        self._wakeup.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def is_idle(self) -> bool:
+        return self._idle.is_set()
+
+    def request_tick(self) -> bool:
+        """
+        Wake worker up for one tick.
+
+        Returns:
+            bool: False if previous tick is still running, True otherwise.
+        """
+        if not self._idle.is_set():
+            return False
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            with self._lock:
+                if not self._running:
+                    self._thread = None
+                    break
+            if self._idle.is_set():
+                # Woken by stop() and started again, no tick requested
+                continue
+
+            try:
+                self._tick()
+            except Exception:
+                # Keep the thread alive, next frame will try again
+                traceback.print_exc()
+            finally:
+                self._idle.set()
+
+        self._idle.set()
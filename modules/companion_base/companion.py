@@ -1,14 +1,21 @@
 # Base
 import math
+import time
+from collections import deque
+from dataclasses import replace
 
 # Application
-from PyQt6.QtCore import QTimer, QObject, pyqtSignal
+from PyQt6.QtCore import QTimer, QObject, QPoint, pyqtSignal
 
 # Custom modules
 from widgets.companion_window import CompanionWindow
+from modules.core import screen_index, startup, metrics
 from modules.settings import companion_settings
-from .companion_state import CompanionState
+from modules.services import CursorService, DialogueService, DialogueReply, GeometryBatch
+from .companion_state import CompanionState, WindowSnapshot
 from .companion_behavior import load_behavior_tree
+from .behavior_worker import BehaviorWorker
+from .spatial_index import SpatialHash, companion_index
 
 
 
@@ -18,20 +25,120 @@ from .companion_behavior import load_behavior_tree
 
 
 
+# === Frame Synchronisation ===
+class SnapshotMixin:
+    """
+    Behavior tree never touches the window directly.
+
+    It reads `_view`, an immutable snapshot of the window taken on
+    the GUI thread, and every change it makes is pushed to `_commands`
+    and applied by the GUI thread on the next frame. Writes also
+    update `_view`, so the tree sees its own changes within a tick.
+    Moves only record the target, the window is moved once per frame
+    however many moves the tick made.
+
+    `collections.deque` append / popleft are atomic, which makes
+    the queue safe between one producer and one consumer thread.
+    """
+    _view: WindowSnapshot
+    _commands: deque
+    _window: CompanionWindow
+    _geometry: GeometryBatch
+
+    def _take_snapshot(self) -> WindowSnapshot:
+        pos = self._window.pos()
+        return WindowSnapshot(
+            x=pos.x(),
+            y=pos.y(),
+            width=self._window.width(),
+            height=self._window.height(),
+            anchor=tuple(self._window.anchor),
+            screens=screen_index.layout,
+            animation=self._window.label.animation,
+            animating=self._window.label.animator.isActive(),
+            direction=self._window.label.direction,
+            cursor=self._cursor.position,
+        )
+
+    def _post(self, command: str, *args, **changes) -> None:
+        self._commands.append((command, args))
+        if changes:
+            self._view = replace(self._view, **changes)
+
+    def _apply_commands(self) -> None:
+        label = self._window.label
+        while self._commands:
+            command, args = self._commands.popleft()
+
+            if command == "move":
+                self._geometry.move(self._window, *args)
+            elif command == "direction":
+                label.direction = args[0]
+            elif command == "animate":
+                label.animation, label.repeats = args
+                label.frame_id = 0
+                label.animator.start(0)
+            elif command == "stop_animation":
+                label.animator.stop()
+            elif command == "warp_cursor":
+                self._cursor.set_position(*args)
+
+        self._geometry.flush()
+
+    def _use_cursor(self, enabled: bool) -> None:
+        """Keep shared cursor sensor sampling while this companion needs it"""
+        if enabled == self._cursor_acquired:
+            return
+        self._cursor_acquired = enabled
+        if enabled:
+            self._cursor.acquire()
+        else:
+            self._cursor.release()
+
+
+
 # === State Attributes ===
 class StateMixin:
+    """
+    State belongs to the thread ticking the tree. Input from the GUI
+    thread (mouse handlers, menu) is queued to `_inputs` and applied
+    right before the next tick, so it never races with a running one.
+    """
     _state: CompanionState
-
+    _inputs: deque
+
+
+    def _apply_inputs(self) -> None:
+        while self._inputs:
+            command, args = self._inputs.popleft()
+
+            if command == "add_interaction":
+                self._state.interactions.append(args[0])
+            elif command == "remove_interaction":
+                self._state.interactions = \
+                    [v for v in self._state.interactions if v != args[0]]
+            elif command == "velocities":
+                self.set_velocities(*args)
+            elif command == "energy":
+                self._state.energy.set(args[0])
+            elif command == "energy_hold":
+                if args[0]:
+                    self._state.energy.hold()
+                else:
+                    self._state.energy.release()
 
     def get_interactions(self) -> list[str]:
         return self._state.interactions
 
     def add_interaction(self, name: str) -> None:
-        self._state.interactions.append(name)
+        self._inputs.append(("add_interaction", (name,)))
 
     def remove_interaction(self, name: str) -> None:
-        self._state.interactions = \
-            [v for v in self._state.interactions if v != name]
+        self._inputs.append(("remove_interaction", (name,)))
+
+    def throw(self, vx: float, vy: float) -> None:
+        """Velocities given by the user on release, applied before the next tick"""
+        self._inputs.append(("velocities", (vx, vy)))
 
     def resolve_interactions(self) -> None:
         if len(self._state.interactions) > 1:
@@ -40,28 +147,34 @@ class StateMixin:
             self._state.interactions = []
     
     def get_energy(self) -> float:
-        return self._state.energy
+        return self._state.energy.value()
     
     def get_energy_level(self) -> float:
-        current_level = self._state.energy / self._state.max_energy
-        return round(current_level, 2)
-
-    def change_energy(self, amount: int) -> None:
-        # Ensuring it stays within the valid range of 0 to max_energy
-        self._state.energy = \
-            max( 0,
-                min(
-                    self._state.max_energy,
-                    self._state.energy + amount)
-            )
+        return round(self._state.energy.level(), 2)
+
+    def change_energy(self, amount: float) -> None:
+        # Stays within the valid range of 0 to max_energy
+        self._state.energy.change(amount)
+
+    def get_energy_rate(self) -> float:
+        return self._state.energy.rate
+
+    def set_energy_rate(self, rate: float) -> None:
+        """Energy gained (or spent, if negative) per second from now on"""
+        self._state.energy.set_rate(rate)
+
+    def get_energy_eta(self, level: float) -> float:
+        """Seconds until the energy level is reached, `math.inf` if never"""
+        return self._state.energy.time_to_level(level)
     
     def refill_energy(self) -> None:
-        self._state.energy = self._state.max_energy
-        self._behavior.stop(self._behavior.status.INVALID)
+        self._inputs.append(("energy", (self._state.max_energy,)))
+        # Tree belongs to the behavior thread, reset it before next tick
+        self._reset_requested = True
 
     def deplete_energy(self) -> None:
-        self._state.energy = 0
-        self._behavior.stop(self._behavior.status.INVALID)
+        self._inputs.append(("energy", (0,)))
+        self._reset_requested = True
 
     def set_velocities(self, vx: float, vy: float) -> None:
         self._state.horizontal_velocity = vx
@@ -80,63 +193,117 @@ class StateMixin:
 # === Position ===
 class PositionMixin:
     _state: CompanionState
-    _window: CompanionWindow
+    _view: WindowSnapshot
+
+    def get_position(self) -> QPoint:
+        return QPoint(self._view.x, self._view.y)
+
+    def get_size(self) -> tuple[int, int]:
+        return (self._view.width, self._view.height)
 
-    def get_position(self) -> tuple:
-        return self._window.pos()
+    def get_anchor(self) -> tuple[int, int]:
+        return self._view.anchor
     
     def get_ground_level(self) -> int:
-        return self._window.user_screen.work_area_height
+        # Ground of the monitor right below the feet
+        return self._view.screens.ground_level(self._view.x + self._view.anchor[0])
     
     def get_feet_pos(self) -> tuple[int, int]:
-        x = self._window.pos().x() + self._window.anchor[0]
-        y = self._window.pos().y() + self._window.anchor[1]
+        x = self._view.x + self._view.anchor[0]
+        y = self._view.y + self._view.anchor[1]
         return (x, y)
     
     def get_centers(self) -> tuple[int, int]:
-        x = self._window.geometry().center().x()
-        y = self._window.geometry().center().y()
+        # Same rounding as QRect.center()
+        x = int((2 * self._view.x + self._view.width - 1) / 2)
+        y = int((2 * self._view.y + self._view.height - 1) / 2)
         return (x, y)
 
     def get_walking_area_x(self) -> tuple[int, int]:
-        low = self._window.anchor[0]
-        high = self._window.user_screen.width - (self._window.size().width() - self._window.anchor[0])
+        # Monitors side by side make one walking area
+        left, right = self._view.screens.span_x()
+        low = left + self._view.anchor[0]
+        high = right - (self._view.width - self._view.anchor[0])
         return (low, high)
 
+    def get_cursor_pos(self) -> tuple[int, int]:
+        return self._view.cursor
+
+    def get_cursor_velocity(self) -> tuple[float, float]:
+        """Recent cursor velocity in px/sec"""
+        return self._cursor.velocity()
+
+    def warp_cursor(self, x: int, y: int) -> None:
+        self._post("warp_cursor", x, y, cursor=(x, y))
+
+
+
+# === Proximity ===
+class ProximityMixin:
+    """
+    Queries against other companions on the screen.
+
+    Positions come from the shared spatial index, which is synced
+    from the GUI thread on every frame the window has moved.
+    """
+    _view: WindowSnapshot
+    spatial_index: SpatialHash
+
+    def _sync_index(self) -> None:
+        geometry = self._window.geometry()
+        self.spatial_index.update(
+            self, geometry.x(), geometry.y(), geometry.width(), geometry.height())
+
+    def get_neighbours(self, radius: float) -> list["Companion"]:
+        """Other companions within `radius` px of the feet, closest first"""
+        x, y = self.get_feet_pos()
+        return self.spatial_index.query_radius(x, y, radius, exclude=self)
+
+    def get_overlapping(self) -> list["Companion"]:
+        return self.spatial_index.query_rect(
+            self._view.x, self._view.y, self._view.width, self._view.height, exclude=self)
+
 
 
 # === Animations ===
 class AnimationMixin:
-    _window: CompanionWindow
+    _view: WindowSnapshot
 
     def start_animation(self, name: str, repeat: int = -1, force_reset: bool = False) -> None:
-        if self._window.label.animation == name \
+        if self._view.animation == name \
         and not force_reset:
             return
         
-        self._window.label.animation = name
-        self._window.label.repeats = repeat
-        self._window.label.frame_id = 0
-        self._window.label.animator.start(0)
+        self._post("animate", name, repeat, animation=name, animating=True)
     
     def stop_animation(self) -> None:
-        self._window.label.animator.stop()
+        self._post("stop_animation", animating=False)
     
     def is_animating(self) -> bool:
-        return self._window.label.animator.isActive()
+        return self._view.animating
+
+    def get_direction(self) -> int:
+        return self._view.direction
+
+    def set_direction(self, direction: int) -> None:
+        if direction != self._view.direction:
+            self._post("direction", direction, direction=direction)
 
     def resolve_gaze(self, look_at_x: int) -> None:
-        if look_at_x > self._window.pos().x():
-            self._window.label.direction = 1
-        elif look_at_x < self._window.pos().x():
-            self._window.label.direction = -1
+        if look_at_x > self._view.x:
+            self.set_direction(1)
+        elif look_at_x < self._view.x:
+            self.set_direction(-1)
 
 
 
 # === Movement ===
 class MovementMixin:
     _state: CompanionState
-    _window: CompanionWindow
+    _view: WindowSnapshot
+
+    def _move(self, x: int, y: int) -> None:
+        self._post("move", x, y, x=x, y=y)
 
     def move_to_goal(self, x: int, y: int = None, speed_multiplier: float = 1.0) -> bool:
         """
@@ -152,22 +319,22 @@ class MovementMixin:
         Returns:
             bool: False if the window is reaching the target position, True if reached.
         """
-        current_x, current_y = self._window.pos().x(), self._window.pos().y()
+        current_x, current_y = self._view.x, self._view.y
 
         if speed_multiplier == 0:
-            self._window.move(x, current_y)
+            self._move(x, current_y)
             return False
 
-        distance_remain_x = x - current_x - self._window.anchor[0]
+        distance_remain_x = x - current_x - self._view.anchor[0]
         move_distance_x = self._state.move_speed * speed_multiplier
 
         if abs(move_distance_x) >= abs(distance_remain_x):
-            self._window.move(x - self._window.anchor[0], current_y)
+            self._move(x - self._view.anchor[0], current_y)
             return False
 
         new_x = current_x + math.copysign(move_distance_x, distance_remain_x)
 
-        self._window.move(int(new_x), current_y)
+        self._move(int(new_x), current_y)
         return True
     
     def fall_to_ground(self, gravity: int = 64, delay: int = 32) -> bool:
@@ -184,9 +351,9 @@ class MovementMixin:
             bool: False if the window is reaching the ground, True if reached.
         """
         if self._state.horizontal_velocity > 0:
-            self._window.label.direction = 1
+            self.set_direction(1)
         elif self._state.horizontal_velocity < 0:
-            self._window.label.direction = -1
+            self.set_direction(-1)
 
         delta_time = delay / 1_000
 
@@ -195,54 +362,351 @@ class MovementMixin:
         # Simulate gravity acceleration
         self._state.vertical_velocity += gravity * delta_time
 
-        x = self._window.pos().x() + int(self._state.horizontal_velocity)
-        y = self._window.pos().y() + int(self._state.vertical_velocity)
+        x = self._view.x + int(self._state.horizontal_velocity)
+        y = self._view.y + int(self._state.vertical_velocity)
 
-        if y + self._window.anchor[1] >= self._window.user_screen.work_area_height \
+        ground_level = self._view.screens.ground_level(x + self._view.anchor[0])
+
+        if y + self._view.anchor[1] >= ground_level \
         and self._state.vertical_velocity >= 0:
             self._state.land_velocity = self._state.vertical_velocity
             self._state.vertical_velocity = 0
             self._state.horizontal_velocity = 0
-            feet_level = self._window.user_screen.work_area_height - self._window.anchor[1] - 1
-            self._window.move(x, feet_level)
+            feet_level = ground_level - self._view.anchor[1] - 1
+            self._move(x, feet_level)
             return False
         
-        self._window.move(x, y)
+        self._move(x, y)
         return True
 
 
 
+# === Dialogue ===
+class DialogueMixin:
+    """
+    Replies are produced by the dialogue service on its own threads.
+
+    The tree only starts, polls and cancels a reply, partial text
+    arrives on the GUI thread and is streamed into the bubble.
+    """
+    _reply: DialogueReply
+    _dialogue: DialogueService
+    _window: CompanionWindow
+
+    def start_reply(self, prompt: str = "") -> None:
+        self.cancel_reply()
+        self._reply = self._dialogue.request(prompt)
+
+    def is_replying(self) -> bool:
+        reply = self._reply
+        return reply is not None and not reply.is_done()
+
+    def cancel_reply(self) -> None:
+        if self._reply is not None:
+            self._reply.cancel()
+
+    def _onReplyPartial(self, reply: DialogueReply, text: str) -> None:
+        if reply is self._reply and not reply.is_cancelled():
+            # Partial text is not worth caching
+            self._window.dialog.showDialog(text, cache=False)
+
+    def _onReplyFinished(self, reply: DialogueReply) -> None:
+        if reply is not self._reply:
+            return
+        if reply.is_cancelled() or not reply.text:
+            self._window.dialog.hide()
+        else:
+            self._window.dialog.showDialog(reply.text)
+
+
+
 class Companion(QObject,
-                StateMixin, PositionMixin, AnimationMixin, MovementMixin):
+                SnapshotMixin, StateMixin, PositionMixin, ProximityMixin,
+                AnimationMixin, MovementMixin, DialogueMixin):
     # Signals
     signalDestroyRequested = pyqtSignal()
     signalQuitAppRequested = pyqtSignal()
 
+    # Frame interval while asleep in low-power mode
+    LOW_POWER_INTERVAL_MS = 1_000
+
     def __init__(self, companion_name: str):
         super().__init__()
         
         self.name = companion_name
 
         self._state = CompanionState()
-        self._window = CompanionWindow(self)
+        with startup.phase(f"companion window: {self.name}"):
+            self._window = CompanionWindow(self)
+
+        self._cursor = CursorService.instance()
+        self._cursor.watch(self._window)
+        self._cursor_acquired = False
+
+        self._geometry = GeometryBatch.instance()
+
+        self._dialogue = DialogueService.instance()
+        self._dialogue.signalPartial.connect(self._onReplyPartial)
+        self._dialogue.signalFinished.connect(self._onReplyFinished)
+        self._reply = None
+
+        self._commands = deque()
+        self._inputs = deque()
+        self._view = self._take_snapshot()
+
+        self.spatial_index = companion_index
+        self._sync_index()
+        self._reset_requested = False
 
-        behavior_module = load_behavior_tree(self.name)
-        self._behavior = behavior_module.create_tree(self)
+        with startup.phase(f"behavior tree: {self.name}"):
+            behavior_module = load_behavior_tree(self.name)
+            self._behavior = behavior_module.create_tree(self)
+
+        self._worker = None
+        if companion_settings.threaded_behavior:
+            self._worker = BehaviorWorker(self.name, self._run_tick)
 
         self._timer = QTimer()
         self._timer.timeout.connect(self._tick_tree)
 
+        self._interval_ms = 32
+        self._last_frame_at: float = None
+
+        # Animation to resume after suspension, if any
+        self._suspended = False
+        self._resume_animation = False
+
+        self._low_power = False
+
+        # Tree asked not to be ticked until then (monotonic seconds)
+        self._wait_until = 0.0
+
+    @property
+    def behavior(self):
+        """Root of the behavior tree"""
+        return self._behavior
+
     def close_window(self):
         self.signalDestroyRequested.emit()
 
     def quit_app(self):
         self.signalQuitAppRequested.emit()
 
-    def _tick_tree(self):
+    def _run_tick(self):
+        started = time.perf_counter()
+        self._apply_inputs()
+        if self._reset_requested:
+            self._reset_requested = False
+            self._behavior.stop(self._behavior.status.INVALID)
         self._behavior.tick_once()
+        metrics.observe("tick_ms", (time.perf_counter() - started) * 1000)
+        metrics.incr("ticks")
+
+    def _record_frame(self):
+        """Frame rate and how late the frame timer fired"""
+        now = time.perf_counter()
+        if self._last_frame_at is not None:
+            late_ms = (now - self._last_frame_at) * 1000 - self._timer.interval()
+            metrics.observe("timer_lateness_ms", max(0.0, late_ms))
+        self._last_frame_at = now
+        metrics.incr("frames")
+
+    def wait(self, delay_s: float) -> None:
+        """
+        Let the tree skip ticks for up to `delay_s` seconds.
+
+        Called by behaviours that only wait for something: an animation
+        to end, energy to reach a level. Frames keep applying commands,
+        but the tree is ticked again only when the time is up, anything
+        it reads besides the cursor changes (position, animation, screens)
+        or an interaction or reset arrives.
+        """
+        self._wait_until = time.monotonic() + delay_s
+
+    def _is_waiting(self, snapshot: WindowSnapshot) -> bool:
+        # Interactions are checked here rather than cancelling the wait,
+        # a tick running meanwhile could request a new one
+        if self._reset_requested or self._inputs or self._state.interactions \
+        or time.monotonic() >= self._wait_until:
+            return False
+        if replace(snapshot, cursor=self._view.cursor) != self._view:
+            self._wait_until = 0.0
+            return False
+        metrics.incr("ticks_waited")
+        return True
+
+    def _tick_tree(self):
+        """
+        Frame step on the GUI thread.
+
+        Applies what the tree produced since the last frame and,
+        if the tree is not busy or waiting, hands it a fresh
+        snapshot to tick on.
+        """
+        self._record_frame()
+
+        if self._low_power:
+            self._low_power_step()
+            return
+
+        if self._worker is None:
+            self._apply_commands()
+            self._sync_index()
+            self._update_culling()
+            snapshot = self._take_snapshot()
+            if self._is_waiting(snapshot):
+                return
+            self._view = snapshot
+            self._run_tick()
+            self._apply_commands()
+            return
+
+        # Checked before draining, so an idle worker
+        # has no commands left behind the snapshot
+        idle = self._worker.is_idle()
+        self._apply_commands()
+        self._sync_index()
+        self._update_culling()
+        if idle:
+            snapshot = self._take_snapshot()
+            if self._is_waiting(snapshot):
+                return
+            self._view = snapshot
+            self._worker.request_tick()
     
+    def _low_power_step(self):
+        """
+        Frame step while nobody is using the computer.
+
+        Cursor is not watched and the tree ticks only to finish
+        a fall or a jump. On the ground the companion sleeps,
+        and frames slow down to `LOW_POWER_INTERVAL_MS`.
+        """
+        idle = self._worker is None or self._worker.is_idle()
+        self._apply_commands()
+        self._sync_index()
+        self._update_culling()
+        if not idle:
+            return
+
+        # Tree may not tick for the whole nap, nothing else would apply them
+        self._apply_inputs()
+        self._view = self._take_snapshot()
+
+        if self.get_feet_pos()[1] + 1 != self.get_ground_level():
+            self._set_interval(self._interval_ms)
+            if self._worker:
+                self._worker.request_tick()
+            else:
+                self._run_tick()
+                self._apply_commands()
+            return
+
+        self._set_interval(self.LOW_POWER_INTERVAL_MS)
+        label = self._window.label
+        if label.animation != "sleep" or not label.animator.isActive():
+            label.animation, label.repeats = "sleep", -1
+            label.frame_id = 0
+            label.animator.start(0)
+
+    def _update_culling(self):
+        """
+        Stop drawing while the companion can't be seen: outside of
+        every screen (e.g. walking in after an offscreen spawn) or
+        not exposed by the window system (fully covered, minimized).
+        Position and animation state keep advancing meanwhile.
+        """
+        geometry = self._window.geometry()
+        visible = screen_index.is_visible(
+            geometry.x(), geometry.y(), geometry.width(), geometry.height())
+
+        # Hidden windows (overlay backend) have no exposure of their own
+        handle = self._window.windowHandle()
+        if visible and self._window.isVisible() and handle is not None:
+            visible = handle.isExposed()
+
+        self._window.label.setCulled(not visible)
+
+    def _set_interval(self, interval_ms: int):
+        if self._timer.interval() != interval_ms:
+            self._timer.setInterval(interval_ms)
+
+    def set_low_power(self, enabled: bool):
+        if enabled == self._low_power:
+            return
+        self._low_power = enabled
+        self._use_cursor(not enabled and self._timer.isActive())
+
+        if not enabled:
+            # Let the tree decide from scratch what to do after the nap
+            self._reset_requested = True
+            self._set_interval(self._interval_ms)
+        self._update_energy_hold()
+
+    def is_low_power(self) -> bool:
+        return self._low_power
+
     def start_activity(self, interval_ms: int = 32):
+        self._interval_ms = interval_ms
+        if self._worker:
+            self._worker.start()
+        self._use_cursor(not self._low_power)
+        self._last_frame_at = None
+        self._wait_until = 0.0
         self._timer.start(interval_ms)
 
     def stop_activity(self):
-        self._timer.stop()
\ No newline at end of file
+        self._timer.stop()
+        self._use_cursor(False)
+        if self._worker:
+            self._worker.stop()
+        self._apply_commands()
+
+    def suspend(self):
+        """Freeze ticks, animation and window updates, keeping all state"""
+        if self._suspended:
+            return
+        self._suspended = True
+
+        self._timer.stop()
+        self._use_cursor(False)
+        if self._worker:
+            self._worker.stop()
+        self._apply_commands()
+
+        self._resume_animation = self._window.label.animator.isActive()
+        self._window.label.animator.stop()
+        self._window.setUpdatesEnabled(False)
+        self._update_energy_hold()
+        # No ticks until resumed, apply the hold now if the worker let go
+        if self._worker is None or self._worker.is_idle():
+            self._apply_inputs()
+
+    def resume(self, interval_ms: int = 32):
+        if not self._suspended:
+            return
+        self._suspended = False
+
+        self._window.setUpdatesEnabled(True)
+        if self._resume_animation:
+            self._window.label.animator.start()
+        self._update_energy_hold()
+        self.start_activity(interval_ms)
+
+    def is_suspended(self) -> bool:
+        return self._suspended
+
+    def _update_energy_hold(self):
+        """
+        Activity doesn't spend energy while low power or suspended.
+        Queued like other input, the tree sets the rate on its own thread.
+        """
+        self._inputs.append(("energy_hold", (self._suspended or self._low_power,)))
+
+    def release(self):
+        self.stop_activity()
+        self.cancel_reply()
+        self._dialogue.signalPartial.disconnect(self._onReplyPartial)
+        self._dialogue.signalFinished.disconnect(self._onReplyFinished)
+        self.spatial_index.remove(self)
+        self._window.closeWindow()
\ No newline at end of file
@@ -3,13 +3,20 @@ import importlib.util
 
 # Custom module
 from modules.core.path_manager import PathManager
+from modules.assets.companion_package import open_package
 
 
 
 def load_behavior_tree(companion_name: str):
+    module_name = f"{companion_name}_behavior_tree"
+
+    # Packaged companion carries precompiled tree
+    package = open_package(companion_name)
+    if package:
+        return package.load_module(module_name)
+
     # Build the full path to the companion's behavior_tree.py
     module_path = PathManager.get_companions_dir() / companion_name / "behavior_tree.py"
-    module_name = f"{companion_name}_behavior_tree"
 
     # Load the module from the file path
     spec = importlib.util.spec_from_file_location(module_name, module_path)
@@ -1,10 +1,10 @@
 # Basic
-import random as r
 from typing import Optional
 from dataclasses import dataclass, field
 
 # Custom modules
-from modules.core import platman
+from modules.core.screen_geometry import ScreenLayout
+from .energy import Energy
 
 
 
@@ -12,7 +12,7 @@ from modules.core import platman
 class CompanionState:
     # Characteristics
     max_energy: float = 100_000
-    energy: float =  max_energy
+    energy: Energy = field(init=False)
     move_speed: int = 6
 
     # Intentions
@@ -26,4 +26,32 @@ class CompanionState:
     land_velocity: float = 0.0
 
     # Holds state for animations
-    interactions: list[str] = field(default_factory=list)
\ No newline at end of file
+    interactions: list[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.energy = Energy(self.max_energy)
+
+
+
+@dataclass(frozen=True)
+class WindowSnapshot:
+    """
+    Immutable copy of window and cursor state, taken on the GUI thread
+    once per frame. Behavior tree reads only from it, so it can tick
+    away from the GUI thread.
+    """
+    x: int
+    y: int
+    width: int
+    height: int
+    anchor: tuple[int, int]
+    # Monitor work areas, replaced as a whole on change
+    screens: ScreenLayout
+
+    # Animation
+    animation: Optional[str]
+    animating: bool
+    direction: int
+
+    # Cursor
+    cursor: tuple[int, int]
@@ -0,0 +1,85 @@
+# Basic
+import math
+import time
+from typing import Callable
+
+
+
+class Energy:
+    """
+    Energy as a continuous function of time.
+
+    Only the last known point is stored: (value, rate per second,
+    timestamp, held rate). The value is evaluated when it's read, clamped to
+    `[0, maximum]`, so nothing has to tick to account for it and the
+    curve doesn't depend on how often the tree ticks. Changing the rate
+    first folds the elapsed time into the value. While held, the rate
+    is 0 and rates set meanwhile only take effect on release.
+
+    The point is replaced as a whole, so readers on other threads
+    always see a consistent one.
+    """
+    def __init__(self, maximum: float, value: float = None, clock: Callable[[], float] = time.monotonic):
+        self.maximum = maximum
+        self._clock = clock
+        self._point = (maximum if value is None else value, 0.0, clock(), None)
+
+    def _clamp(self, value: float) -> float:
+        return max(0.0, min(self.maximum, value))
+
+    def value(self) -> float:
+        value, rate, timestamp, _ = self._point
+        return self._clamp(value + rate * (self._clock() - timestamp))
+
+    def level(self) -> float:
+        """Value as a fraction of the maximum"""
+        return self.value() / self.maximum
+
+    @property
+    def rate(self) -> float:
+        return self._point[1]
+
+    def is_held(self) -> bool:
+        return self._point[3] is not None
+
+    def set(self, value: float) -> None:
+        _, rate, _, held = self._point
+        self._point = (self._clamp(value), rate, self._clock(), held)
+
+    def change(self, amount: float) -> None:
+        """Instant change on top of the running rate"""
+        self.set(self.value() + amount)
+
+    def set_rate(self, rate: float) -> None:
+        """Energy change per second from now on, or from the release if held"""
+        if self.is_held():
+            self._point = (self.value(), 0.0, self._clock(), rate)
+        else:
+            self._point = (self.value(), rate, self._clock(), None)
+
+    def hold(self) -> None:
+        """Stop the running rate until `release`"""
+        if not self.is_held():
+            self._point = (self.value(), 0.0, self._clock(), self.rate)
+
+    def release(self) -> None:
+        """Continue with the rate stopped by `hold` (or set since)"""
+        held = self._point[3]
+        if held is not None:
+            self._point = (self.value(), held, self._clock(), None)
+
+    def time_to_level(self, level: float) -> float:
+        """
+        Seconds until the level is reached at the current rate.
+
+        Returns:
+            float: 0 if the value is already at or past the level in the
+                direction it moves, `math.inf` if it never gets there.
+        """
+        target = self._clamp(level * self.maximum)
+        value, rate, timestamp, _ = self._point
+        value = self._clamp(value + rate * (self._clock() - timestamp))
+
+        if rate == 0:
+            return 0.0 if value == target else math.inf
+        return max(0.0, (target - value) / rate)
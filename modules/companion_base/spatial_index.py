@@ -0,0 +1,144 @@
+# Basic
+import math
+import threading
+from typing import Hashable, Iterable
+
+
+
+Rect = tuple[int, int, int, int]
+
+
+
+class SpatialHash:
+    """
+    Uniform grid index of axis-aligned rectangles.
+
+    Every item is stored in all cells its rectangle touches, so radius
+    and overlap queries only look at a few cells around the query area
+    instead of comparing against every other item.
+
+    Updates come from the GUI thread while behavior trees query from
+    their own threads, so every access is done under one short lock.
+    """
+    def __init__(self, cell_size: int = 128):
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], set[Hashable]] = {}
+        self._rects: dict[Hashable, Rect] = {}
+        self._item_cells: dict[Hashable, tuple[int, int, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._rects
+
+    def _cell_span(self, x: int, y: int, w: int, h: int) -> tuple[int, int, int, int]:
+        size = self._cell_size
+        return (
+            x // size,
+            y // size,
+            (x + max(w, 1) - 1) // size,
+            (y + max(h, 1) - 1) // size,
+        )
+
+    @staticmethod
+    def _iter_cells(span: tuple[int, int, int, int]) -> Iterable[tuple[int, int]]:
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield (cx, cy)
+
+    def update(self, item: Hashable, x: int, y: int, w: int, h: int) -> None:
+        """Insert `item` or move it to a new rectangle"""
+        rect = (x, y, w, h)
+        with self._lock:
+            if self._rects.get(item) == rect:
+                return
+            self._rects[item] = rect
+
+            span = self._cell_span(*rect)
+            old_span = self._item_cells.get(item)
+            # Most moves stay within the same cells
+            if span == old_span:
+                return
+            self._item_cells[item] = span
+
+            old_cells = set(self._iter_cells(old_span)) if old_span else set()
+            new_cells = set(self._iter_cells(span))
+
+            for cell in old_cells - new_cells:
+                bucket = self._cells[cell]
+                bucket.discard(item)
+                if not bucket:
+                    del self._cells[cell]
+            for cell in new_cells - old_cells:
+                self._cells.setdefault(cell, set()).add(item)
+
+    def remove(self, item: Hashable) -> None:
+        with self._lock:
+            if item not in self._rects:
+                return
+            del self._rects[item]
+            for cell in self._iter_cells(self._item_cells.pop(item)):
+                bucket = self._cells[cell]
+                bucket.discard(item)
+                if not bucket:
+                    del self._cells[cell]
+
+    def get_rect(self, item: Hashable) -> Rect | None:
+        return self._rects.get(item)
+
+    def _candidates(self, x: int, y: int, w: int, h: int) -> set[Hashable]:
+        found = set()
+        for cell in self._iter_cells(self._cell_span(x, y, w, h)):
+            bucket = self._cells.get(cell)
+            if bucket:
+                found |= bucket
+        return found
+
+    def query_rect(self, x: int, y: int, w: int, h: int, exclude: Hashable = None) -> list[Hashable]:
+        """Items whose rectangles intersect the given one"""
+        with self._lock:
+            result = []
+            for item in self._candidates(x, y, w, h):
+                if item is exclude:
+                    continue
+                ix, iy, iw, ih = self._rects[item]
+                if ix < x + w and x < ix + iw \
+                and iy < y + h and y < iy + ih:
+                    result.append(item)
+            return result
+
+    def query_radius(self, px: int, py: int, radius: float, exclude: Hashable = None) -> list[Hashable]:
+        """
+        Items whose rectangles come within `radius` of point (px, py),
+        ordered from the closest one.
+        """
+        r = int(math.ceil(radius))
+        with self._lock:
+            result = []
+            for item in self._candidates(px - r, py - r, 2 * r + 1, 2 * r + 1):
+                if item is exclude:
+                    continue
+                ix, iy, iw, ih = self._rects[item]
+                # Distance from the point to the closest point of rectangle
+                dx = max(ix - px, 0, px - (ix + iw - 1))
+                dy = max(iy - py, 0, py - (iy + ih - 1))
+                distance = math.hypot(dx, dy)
+                if distance <= radius:
+                    result.append((distance, item))
+            result.sort(key=lambda pair: pair[0])
+            return [item for _, item in result]
+
+    def overlapping(self, item: Hashable) -> list[Hashable]:
+        """Items whose rectangles intersect the one of `item`"""
+        rect = self._rects.get(item)
+        if rect is None:
+            return []
+        return self.query_rect(*rect, exclude=item)
+
+
+
+# Shared by all companions in the application
+companion_index = SpatialHash()
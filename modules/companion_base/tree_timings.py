@@ -0,0 +1,67 @@
+# Basic
+import time
+from typing import Iterable
+
+# Behavior
+from py_trees.behaviour import Behaviour
+
+
+
+class TreeTimings:
+    """
+    Per-node timings of behavior trees, for profiling captures.
+
+    While attached, `initialise` and `update` of every node are wrapped
+    with instance attributes that shadow the class methods, so nothing
+    changes for the tree and detaching simply deletes the wrappers.
+    Nodes tick on behavior threads; every node only touches its own
+    entry, so no lock is needed.
+    """
+    def __init__(self):
+        # (tree name, node name, node id) -> [calls, total seconds, max seconds]
+        self._stats: dict[tuple[str, str, int], list] = {}
+        self._nodes: list[Behaviour] = []
+
+    def attach(self, tree_name: str, root: Behaviour) -> None:
+        for node in root.iterate():
+            for method in ("initialise", "update"):
+                key = (tree_name, f"{node.name}.{method}", id(node))
+                self._stats[key] = [0, 0.0, 0.0]
+                setattr(node, method, self._timed(getattr(node, method), self._stats[key]))
+            self._nodes.append(node)
+
+    @staticmethod
+    def _timed(method, entry: list):
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                entry[0] += 1
+                entry[1] += elapsed
+                if elapsed > entry[2]:
+                    entry[2] = elapsed
+        return wrapper
+
+    def detach(self) -> None:
+        for node in self._nodes:
+            for method in ("initialise", "update"):
+                node.__dict__.pop(method, None)
+        self._nodes.clear()
+
+    def rows(self) -> Iterable[tuple[str, str, int, float, float]]:
+        """(tree, node, calls, total ms, max ms), most expensive first"""
+        rows = [
+            (tree, node, calls, total * 1000, longest * 1000)
+            for (tree, node, _), (calls, total, longest) in self._stats.items()
+            if calls
+        ]
+        return sorted(rows, key=lambda row: row[3], reverse=True)
+
+    def report(self) -> str:
+        lines = [f"{'tree':<12} {'node':<36} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>8}"]
+        for tree, node, calls, total, longest in self.rows():
+            lines.append(f"{tree:<12} {node:<36} {calls:>7} {total:>10.2f} "
+                         f"{total / calls:>9.3f} {longest:>8.2f}")
+        return "\n".join(lines)
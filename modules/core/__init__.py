@@ -1,3 +1,6 @@
 from .path_manager import PathManager
 from .translation import lang_
-from .platform_manager import platman
\ No newline at end of file
+from .platform_manager import platman
+from .screen_geometry import screen_index
+from .startup import startup
+from .metrics import metrics
\ No newline at end of file
@@ -0,0 +1,67 @@
+# Basic
+import math
+import random
+
+
+
+class GrowingChance:
+    """
+    Random event whose chance grows with the time since it last happened.
+
+    Behaviours used to roll `random()` against a probability once per
+    pass, the probability growing by `growth` x time since the last
+    event on every roll (plus any bonus given on the way). Here the
+    randomness is drawn once per event instead: an exponential budget
+    that every roll spends the hazard of its probability from,
+
+        hazard_k = -log(1 - p_k)
+
+    and the event happens on the roll that runs out of it. The chance it
+    survives k rolls is (1 - p_1) * ... * (1 - p_k), exactly as with the
+    dice. Rolls use the real time since the last event, so that holds
+    however irregular the passes are (idle cycles, walks, jumps).
+
+    No next-event time is scheduled. The dice only fire on passes, and
+    passes end when an activity does, so a time drawn in advance would
+    fire whenever it comes due instead of where a pass would have
+    ended, and no fixed pass length reproduces the dice over walks and
+    jumps. The tree is not woken for rolls either: the time-to checks
+    run once per pass, and between passes `Idle` lets the tree sleep
+    until its animation ends.
+    """
+    def __init__(self, initial: float, growth: float, rng: random.Random = None):
+        self.initial = initial
+        self.growth = growth
+        self._rng = rng or random.Random()
+        self.reset()
+
+    def reset(self) -> None:
+        """Start over after the event"""
+        self.probability = self.initial
+        # 1 - random() is never 0
+        self._budget = -math.log(1.0 - self._rng.random())
+
+    def add_bonus(self, bonus: float) -> None:
+        """Chance added to this and every following roll until the event"""
+        self.probability = min(1.0, self.probability + bonus)
+
+    def roll(self, elapsed_s: float) -> bool:
+        """
+        Roll of one pass.
+
+        Args:
+            elapsed_s (float): Seconds since the last event
+
+        Returns:
+            bool: True if the event happens, the chance then starts over.
+        """
+        self.probability = min(1.0, self.probability + elapsed_s * self.growth)
+
+        if self.probability < 1.0:
+            hazard = -math.log(1.0 - self.probability)
+            if hazard < self._budget:
+                self._budget -= hazard
+                return False
+
+        self.reset()
+        return True
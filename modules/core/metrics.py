@@ -0,0 +1,160 @@
+# Basic
+import os
+import sys
+import time
+import threading
+from bisect import bisect_left
+from typing import Callable
+
+
+
+# Upper bounds (ms) of histogram buckets, the last one catches the rest
+BUCKETS_MS = (0.5, 1, 2, 4, 8, 16, 32, 64, 128, 256, float("inf"))
+
+
+
+class Histogram:
+    """Bucketed durations collected since the last `collect()`"""
+    def __init__(self, bounds: tuple[float, ...] = BUCKETS_MS):
+        self._bounds = bounds
+        self._reset()
+
+    def _reset(self) -> None:
+        self.counts = [0] * len(self._bounds)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def _quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the quantile"""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self._bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def collect(self) -> dict:
+        stats = {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self._quantile(0.5) if self.count else 0.0,
+            "p95": self._quantile(0.95) if self.count else 0.0,
+            "max": self.max,
+            "buckets": dict(zip(map(str, self._bounds), self.counts)),
+        }
+        self._reset()
+        return stats
+
+
+
+def rss_bytes() -> int | None:
+    """Resident memory of the process, None where it can't be read cheaply"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+    return None
+
+
+
+class Metrics:
+    """
+    Process-wide registry of runtime numbers.
+
+    Hot paths only bump counters and record durations under one short
+    lock. `collect()` turns counters into per-second rates over the time
+    since the previous collection, summarises and resets histograms and
+    reads gauges, so it's meant to have a single periodic caller.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._collected_counters: dict[str, int] = {}
+        self._histograms: dict[str, Histogram] = {}
+        self._gauges: dict[str, float] = {}
+        self._gauge_readers: dict[str, Callable[[], float | None]] = {}
+        self._collected_at = time.perf_counter()
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def observe(self, name: str, value_ms: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(value_ms)
+
+    def adjust_gauge(self, name: str, delta: float) -> None:
+        with self._lock:
+            self._gauges[name] = self._gauges.get(name, 0) + delta
+
+    def register_gauge(self, name: str, reader: Callable[[], float | None]) -> None:
+        """Gauge read on every collection"""
+        self._gauge_readers[name] = reader
+
+    def collect(self) -> dict:
+        now = time.perf_counter()
+        with self._lock:
+            elapsed = max(now - self._collected_at, 1e-9)
+            self._collected_at = now
+
+            rates = {
+                name: (count - self._collected_counters.get(name, 0)) / elapsed
+                for name, count in self._counters.items()
+            }
+            self._collected_counters = dict(self._counters)
+
+            histograms = {name: h.collect() for name, h in self._histograms.items()}
+            gauges = dict(self._gauges)
+
+        for name, reader in self._gauge_readers.items():
+            gauges[name] = reader()
+
+        return {
+            "time": time.time(),
+            "interval_s": elapsed,
+            "rates": rates,
+            "histograms": histograms,
+            "gauges": gauges,
+        }
+
+
+
+metrics = Metrics()
+metrics.register_gauge("rss_bytes", rss_bytes)
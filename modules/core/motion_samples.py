@@ -0,0 +1,67 @@
+# Basic
+from collections import deque
+
+
+
+class MotionSamples:
+    """
+    Short ring buffer of timestamped (t, x, y) positions.
+
+    Velocity is the least-squares slope of position over time for the
+    most recent samples, which follows the latest motion and is not
+    thrown off by a single jittery sample the way two-point
+    differences are.
+    """
+    def __init__(self, size: int = 32):
+        self._samples: deque[tuple[float, float, float]] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, t: float, x: float, y: float) -> None:
+        self._samples.append((t, x, y))
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+    def latest(self) -> tuple[float, float, float] | None:
+        return self._samples[-1] if self._samples else None
+
+    def velocity(self, window_s: float = 0.1, now: float = None) -> tuple[float, float]:
+        """
+        Velocity in px/sec over the last `window_s` seconds.
+
+        Args:
+            window_s (float, optional): Length of the window
+            now (float, optional): End of the window, defaults to the
+                newest sample. Pass the current time when samples are
+                recorded only on change, so a position at rest reads
+                as zero velocity instead of the last motion.
+
+        Returns:
+            tuple[float, float]: (vx, vy), zeros if there are not enough samples.
+        """
+        # Copy in one C call, so a writer on another thread can't interfere
+        samples = tuple(self._samples)
+        if len(samples) < 2:
+            return (0.0, 0.0)
+
+        t_last = samples[-1][0] if now is None else now
+        if t_last - samples[-1][0] > window_s:
+            return (0.0, 0.0)
+        recent = [s for s in samples if t_last - s[0] <= window_s]
+        if len(recent) < 2:
+            recent = samples[-2:]
+
+        n = len(recent)
+        mean_t = sum(s[0] for s in recent) / n
+        mean_x = sum(s[1] for s in recent) / n
+        mean_y = sum(s[2] for s in recent) / n
+
+        var_t = sum((s[0] - mean_t) ** 2 for s in recent)
+        if var_t == 0:
+            return (0.0, 0.0)
+
+        vx = sum((s[0] - mean_t) * (s[1] - mean_x) for s in recent) / var_t
+        vy = sum((s[0] - mean_t) * (s[2] - mean_y) for s in recent) / var_t
+        return (vx, vy)
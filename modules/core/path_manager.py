@@ -17,6 +17,10 @@ class PathManager:
     def get_companions_dir():
         return PathManager.MAIN_DIR / 'companions'
 
+    @staticmethod
+    def get_companion_package_path(companion_name: str):
+        return PathManager.get_companions_dir() / f"{companion_name}.qpal"
+
     @staticmethod
     def get_companions_config_path():
         return PathManager.MAIN_DIR / 'resources' / 'configs' / 'companion.toml'
@@ -27,4 +31,17 @@ class PathManager:
 
     @staticmethod
     def get_locales_dir():
-        return PathManager.MAIN_DIR / 'resources' / 'locales'
\ No newline at end of file
+        return PathManager.MAIN_DIR / 'resources' / 'locales'
+
+    @staticmethod
+    def get_profiles_dir():
+        # Written at runtime, so with the logs rather than the bundled resources
+        return PathManager.get_logs_dir() / 'profiles'
+
+    @staticmethod
+    def get_logs_dir():
+        return PathManager.MAIN_DIR / 'logs'
+
+    @staticmethod
+    def get_metrics_export_path():
+        return PathManager.get_logs_dir() / 'metrics.jsonl'
\ No newline at end of file
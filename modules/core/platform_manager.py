@@ -1,11 +1,31 @@
 # Basic
+import os
+import time
+import socket
 import platform
+import threading
+import tomllib
 import ctypes
-# Need to explicitly import this submodule for Windows OS
-from ctypes import wintypes
+from pathlib import Path
 from ctypes.util import find_library
 from abc import ABC, abstractmethod
 
+# Custom modules
+from .screen_geometry import ScreenArea
+
+
+
+# Names of platform state reported as changed
+# by `process_events` to the subscribers
+WORK_AREA_CHANGED = "work_area"
+FULLSCREEN_CHANGED = "fullscreen"
+
+# Forces a provider instead of the one of the running OS,
+# e.g. QUTYPAL_PLATFORM=virtual for headless runs
+PLATFORM_ENV = "QUTYPAL_PLATFORM"
+# Path to a TOML script of the virtual platform
+PLATFORM_SCRIPT_ENV = "QUTYPAL_PLATFORM_SCRIPT"
+
 
 
 class PlatformProvider(ABC):
@@ -21,13 +41,236 @@ class PlatformProvider(ABC):
     def is_fullscreen(self):
         pass
 
+    def get_screen_areas(self) -> tuple[list[ScreenArea], list[ScreenArea]] | None:
+        """Work areas and full geometries of screens, None to take them from Qt"""
+        return None
+
+    # === Platform events ===
+    # Providers without own event source rely on
+    # `PlatformManager.refresh` being called from Qt signals
+    def get_event_fd(self) -> int | None:
+        """File descriptor to watch for platform events"""
+        return None
+
+    def has_pending_events(self) -> bool:
+        """Events already read from the connection but not processed"""
+        return False
+
+    def process_events(self) -> set[str]:
+        """Handle pending events and return names of changed states"""
+        return set()
+
+    def refresh(self) -> None:
+        """Drop cached platform state"""
+        pass
+
+
+
+# === Xlib structures and constants ===
+class XPropertyEvent(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_int),
+                ("serial", ctypes.c_ulong),
+                ("send_event", ctypes.c_int),
+                ("display", ctypes.c_void_p),
+                ("window", ctypes.c_ulong),
+                ("atom", ctypes.c_ulong),
+                ("time", ctypes.c_ulong),
+                ("state", ctypes.c_int)]
+
+
+class XEvent(ctypes.Union):
+    _fields_ = [("type", ctypes.c_int),
+                ("xproperty", XPropertyEvent),
+                ("pad", ctypes.c_long * 24)]
+
+
+class XScreenSaverInfo(ctypes.Structure):
+    _fields_ = [("window", ctypes.c_ulong),
+                ("state", ctypes.c_int),
+                ("kind", ctypes.c_int),
+                ("since", ctypes.c_ulong),
+                ("idle", ctypes.c_ulong),
+                ("event_mask", ctypes.c_ulong)]
+
+
+class XErrorEvent(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_int),
+                ("display", ctypes.c_void_p),
+                ("resourceid", ctypes.c_ulong),
+                ("serial", ctypes.c_ulong),
+                ("error_code", ctypes.c_ubyte),
+                ("request_code", ctypes.c_ubyte),
+                ("minor_code", ctypes.c_ubyte)]
+
+
+BadWindow = 3
+
+XErrorHandler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(XErrorEvent))
+
+# Handler that was installed before ours, gets every other error
+_previous_x_error_handler = None
+
+# Handler is process-wide, so only BadWindow is ignored: the tracked
+# active window may be destroyed before we stop watching it
+@XErrorHandler
+def _ignore_bad_window(display, error):
+    if error.contents.error_code == BadWindow:
+        return 0
+    if _previous_x_error_handler:
+        return _previous_x_error_handler(display, error)
+    return 0
+
+
+PropertyNotify = 28
+NoEventMask = 0
+PropertyChangeMask = 1 << 22
+QueuedAlready = 0
+RRScreenChangeNotify = 0
+RRScreenChangeNotifyMask = 1 << 0
+
 
 
 class LinuxPlatform(PlatformProvider):
+    """
+    X11 platform, backed by one long-lived display connection.
+
+    Libraries are loaded and the display is opened on first use.
+    Screen geometry is cached and refreshed only when the root window
+    reports a `_NET_WORKAREA` change or RandR reports a new screen
+    configuration.
+
+    Fullscreen state is tracked the same way: the root window reports
+    `_NET_ACTIVE_WINDOW` changes, and the active window itself reports
+    its `_NET_WM_STATE` changes.
+    """
+    def __init__(self):
+        self._x11 = None
+        self._xss = None
+        self._xrandr = None
+        self._display = None
+        self._root = None
+
+        self._net_workarea = None
+        self._net_active_window = None
+        self._net_wm_state = None
+        self._net_wm_state_fullscreen = None
+        self._rr_event_base = None
+        self._xss_info = None
+
+        self._resolution = None
+        self._active_window = None
+        self._fullscreen = None
+
+    def _connect(self):
+        if self._display:
+            return
+
+        x11_path = find_library("X11")
+        if not x11_path:
+            raise RuntimeError("libX11 not found")
+        x11 = ctypes.cdll.LoadLibrary(x11_path)
+
+        # Pointers must not be truncated to int on 64-bit systems
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XDefaultRootWindow.restype = ctypes.c_ulong
+        x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        x11.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        x11.XDisplayWidth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XInternAtom.restype = ctypes.c_ulong
+        x11.XInternAtom.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+        x11.XSelectInput.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_long]
+        x11.XGetWindowProperty.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong,
+            ctypes.c_long, ctypes.c_long, ctypes.c_int, ctypes.c_ulong,
+            ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_ulong),
+            ctypes.POINTER(ctypes.POINTER(ctypes.c_ulong))]
+        x11.XFree.argtypes = [ctypes.c_void_p]
+        x11.XFlush.argtypes = [ctypes.c_void_p]
+        x11.XPending.argtypes = [ctypes.c_void_p]
+        x11.XEventsQueued.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XNextEvent.argtypes = [ctypes.c_void_p, ctypes.POINTER(XEvent)]
+        x11.XConnectionNumber.argtypes = [ctypes.c_void_p]
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        x11.XSetErrorHandler.restype = XErrorHandler
+        x11.XSetErrorHandler.argtypes = [XErrorHandler]
+
+        display = x11.XOpenDisplay(None)
+        if not display:
+            raise RuntimeError("Cannot open display")
+
+        self._x11 = x11
+        self._display = display
+        self._root = x11.XDefaultRootWindow(display)
+        self._net_workarea = x11.XInternAtom(display, b'_NET_WORKAREA', False)
+        self._net_active_window = x11.XInternAtom(display, b'_NET_ACTIVE_WINDOW', False)
+        self._net_wm_state = x11.XInternAtom(display, b'_NET_WM_STATE', False)
+        self._net_wm_state_fullscreen = x11.XInternAtom(display, b'_NET_WM_STATE_FULLSCREEN', False)
+
+        global _previous_x_error_handler
+        if _previous_x_error_handler is None:
+            _previous_x_error_handler = x11.XSetErrorHandler(_ignore_bad_window)
+
+        # Get notified when panels change the work area
+        # and when another window takes focus
+        x11.XSelectInput(display, self._root, PropertyChangeMask)
+
+        # And when monitors are added, removed or resized
+        xrandr_path = find_library("Xrandr")
+        if xrandr_path:
+            xrandr = ctypes.cdll.LoadLibrary(xrandr_path)
+            xrandr.XRRQueryExtension.argtypes = [
+                ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)]
+            xrandr.XRRSelectInput.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_int]
+            xrandr.XRRUpdateConfiguration.argtypes = [ctypes.POINTER(XEvent)]
+
+            event_base, error_base = ctypes.c_int(), ctypes.c_int()
+            if xrandr.XRRQueryExtension(display, ctypes.byref(event_base), ctypes.byref(error_base)):
+                xrandr.XRRSelectInput(display, self._root, RRScreenChangeNotifyMask)
+                self._xrandr = xrandr
+                self._rr_event_base = event_base.value
+
+        x11.XFlush(display)
+
+    def close(self):
+        if self._display:
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
+
+    def _get_property(self, window: int, atom: int, length: int) -> list[int]:
+        """Read up to `length` 32-bit items of window property"""
+        actual_type_return = ctypes.c_ulong()
+        actual_format_return = ctypes.c_int()
+        nitems_return = ctypes.c_ulong()
+        bytes_after_return = ctypes.c_ulong()
+        prop_return = ctypes.POINTER(ctypes.c_ulong)()
+
+        status = self._x11.XGetWindowProperty(self._display, window, atom,
+                                              0, length, False, 0,
+                                              ctypes.byref(actual_type_return),
+                                              ctypes.byref(actual_format_return),
+                                              ctypes.byref(nitems_return),
+                                              ctypes.byref(bytes_after_return),
+                                              ctypes.byref(prop_return))
+        if status != 0 or not prop_return:
+            return []
+
+        values = [prop_return[i] for i in range(nitems_return.value)]
+        self._x11.XFree(prop_return)
+        return values
+
     def get_resolution(self):
+        if self._resolution is None:
+            self._resolution = self._query_resolution()
+        return self._resolution
+
+    def _query_resolution(self):
         try:
-            x11 = ctypes.cdll.LoadLibrary(find_library('X11'))
-            display = x11.XOpenDisplay(None)
+            self._connect()
+            x11 = self._x11
+            display = self._display
             screen = x11.XDefaultScreen(display)
             
             # Get the full screen resolution
@@ -36,89 +279,113 @@ class LinuxPlatform(PlatformProvider):
             
             # Get the work area (excluding taskbars/panels)
             # This typically works with window managers like GNOME/KDE that support _NET_WORKAREA
-            root = x11.XRootWindow(display, screen)
-            net_workarea_atom = x11.XInternAtom(display, b'_NET_WORKAREA', True)
-            actual_type_return = ctypes.c_ulong()
-            actual_format_return = ctypes.c_int()
-            nitems_return = ctypes.c_ulong()
-            bytes_after_return = ctypes.c_ulong()
-            prop_return = ctypes.POINTER(ctypes.c_ulong)()
-            
-            x11.XGetWindowProperty(display, root, net_workarea_atom,
-                                   0, 4, False, 0,
-                                   ctypes.byref(actual_type_return),
-                                   ctypes.byref(actual_format_return),
-                                   ctypes.byref(nitems_return),
-                                   ctypes.byref(bytes_after_return),
-                                   ctypes.byref(prop_return))
+            work_area = self._get_property(self._root, self._net_workarea, 4)
             
-            if nitems_return.value == 4:
-                work_area_height = prop_return[3]  # The height of the work area (excluding taskbars)
-                taskbar_height = screen_height - work_area_height
+            if len(work_area) == 4:
+                # Bottom edge of the work area (excluding taskbars)
+                work_area_height = work_area[1] + work_area[3]
             else:
-                taskbar_height = 0  # Fallback in case _NET_WORKAREA is unavailable
+                work_area_height = screen_height  # Fallback in case _NET_WORKAREA is unavailable
             
-            x11.XCloseDisplay(display)
             return screen_width, screen_height, work_area_height
         except Exception as e:
                 raise RuntimeError("Unable to get screen resolution and taskbar height: " + str(e))
 
     def get_idle_time(self):
-        # Load the X11 and XScreenSaver libraries
-        x11_path = find_library("X11")
-        if not x11_path:
-            raise RuntimeError("libX11 not found")
-        xlib = ctypes.cdll.LoadLibrary(x11_path)
-
-        xss_path = find_library("Xss")
-        if not xss_path:
-            raise RuntimeError("libXss not found")
-        xss = ctypes.cdll.LoadLibrary(xss_path)
+        self._connect()
 
-        # xlib = ctypes.cdll.LoadLibrary("libX11.so")
-        # self.xss = ctypes.cdll.LoadLibrary("libXss.so")
+        if self._xss is None:
+            xss_path = find_library("Xss")
+            if not xss_path:
+                raise RuntimeError("libXss not found")
+            xss = ctypes.cdll.LoadLibrary(xss_path)
+            xss.XScreenSaverAllocInfo.restype = ctypes.POINTER(XScreenSaverInfo)
+            xss.XScreenSaverQueryInfo.argtypes = [
+                ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(XScreenSaverInfo)]
 
-        # Open display
-        self.display = xlib.XOpenDisplay(None)
-        if not self.display:
-            raise Exception("Cannot open display")
-        
-        class XScreenSaverInfo(ctypes.Structure):
-            _fields_ = [("window", ctypes.c_ulong),
-                        ("state", ctypes.c_int),
-                        ("kind", ctypes.c_int),
-                        ("since", ctypes.c_ulong),
-                        ("idle", ctypes.c_ulong),
-                        ("event_mask", ctypes.c_ulong)]
-
-        # Create a pointer for XScreenSaverInfo
-        xss_info = XScreenSaverInfo()
-        xss.XScreenSaverAllocInfo.restype = ctypes.POINTER(XScreenSaverInfo)
-        xss_info_ptr = xss.XScreenSaverAllocInfo()
+            self._xss = xss
+            # Allocated once and reused for every query
+            self._xss_info = xss.XScreenSaverAllocInfo()
 
         # Get idle time
-        xss.XScreenSaverQueryInfo(self.display, xlib.XDefaultRootWindow(self.display), xss_info_ptr)
-        idle_time = xss_info_ptr.contents.idle / 1000  # Idle time is in milliseconds
+        self._xss.XScreenSaverQueryInfo(self._display, self._root, self._xss_info)
+        idle_time = self._xss_info.contents.idle / 1000  # Idle time is in milliseconds
         return idle_time
 
     def is_fullscreen(self):
-        from Xlib import display, X
-        import Xlib.error
-
-        d = display.Display()
-        root = d.screen().root
-        NET_ACTIVE_WINDOW = d.intern_atom('_NET_ACTIVE_WINDOW')
-        NET_WM_STATE = d.intern_atom('_NET_WM_STATE')
-        NET_WM_STATE_FULLSCREEN = d.intern_atom('_NET_WM_STATE_FULLSCREEN')
-        try:
-            window_id = root.get_full_property(NET_ACTIVE_WINDOW, X.AnyPropertyType).value[0]
-            window = d.create_resource_object('window', window_id)
-            wm_state = window.get_full_property(NET_WM_STATE, X.AnyPropertyType)
-            if wm_state and NET_WM_STATE_FULLSCREEN in wm_state.value:
-                return True
-        except Xlib.error.XError:
-            pass
-        return False
+        if self._fullscreen is None:
+            self._connect()
+            self._track_active_window()
+            self._fullscreen = self._query_fullscreen()
+        return self._fullscreen
+
+    def _track_active_window(self):
+        """Follow `_NET_WM_STATE` changes of the currently active window"""
+        active = self._get_property(self._root, self._net_active_window, 1)
+        active_window = active[0] if active else None
+        if active_window == self._active_window:
+            return
+
+        if self._active_window:
+            self._x11.XSelectInput(self._display, self._active_window, NoEventMask)
+        if active_window:
+            self._x11.XSelectInput(self._display, active_window, PropertyChangeMask)
+        self._active_window = active_window
+
+    def _query_fullscreen(self):
+        if not self._active_window:
+            return False
+        # Window can hold a few states at once
+        wm_state = self._get_property(self._active_window, self._net_wm_state, 32)
+        return self._net_wm_state_fullscreen in wm_state
+
+    # === Platform events ===
+    def get_event_fd(self):
+        self._connect()
+        return self._x11.XConnectionNumber(self._display)
+
+    def has_pending_events(self):
+        # Only checks the local queue, never touches the socket
+        if not self._display:
+            return False
+        return self._x11.XEventsQueued(self._display, QueuedAlready) > 0
+
+    def process_events(self):
+        changed = set()
+        if not self._display:
+            return changed
+
+        event = XEvent()
+        while self._x11.XPending(self._display):
+            self._x11.XNextEvent(self._display, ctypes.byref(event))
+
+            if event.type == PropertyNotify:
+                atom = event.xproperty.atom
+                if atom == self._net_workarea:
+                    changed.add(WORK_AREA_CHANGED)
+                elif atom == self._net_active_window \
+                or (atom == self._net_wm_state and event.xproperty.window == self._active_window):
+                    changed.add(FULLSCREEN_CHANGED)
+            elif self._rr_event_base is not None \
+            and event.type == self._rr_event_base + RRScreenChangeNotify:
+                # Let Xlib know about new screen size
+                self._xrandr.XRRUpdateConfiguration(ctypes.byref(event))
+                changed.add(WORK_AREA_CHANGED)
+
+        if WORK_AREA_CHANGED in changed:
+            self.refresh()
+
+        # Report only actual switches, not every focus change
+        if FULLSCREEN_CHANGED in changed:
+            was_fullscreen = self._fullscreen
+            self._track_active_window()
+            self._fullscreen = self._query_fullscreen()
+            if was_fullscreen == self._fullscreen:
+                changed.discard(FULLSCREEN_CHANGED)
+        return changed
+
+    def refresh(self):
+        self._resolution = None
 
 
 
@@ -128,8 +395,11 @@ class WindowsPlatform(PlatformProvider):
         screen_width = ctypes.windll.user32.GetSystemMetrics(0)  # 0 represents the screen width (SM_CYSCREEN)
         screen_height = ctypes.windll.user32.GetSystemMetrics(1)  # 1 represents the screen height (SM_CYSCREEN)
         
+        # Need to explicitly import this submodule for Windows OS
+        from ctypes import wintypes
+
         # Get screen working area excluding the taskbar    
-        work_area = ctypes.wintypes.RECT()
+        work_area = wintypes.RECT()
         ctypes.windll.user32.SystemParametersInfoW(48, 0, ctypes.byref(work_area), 0) # (SPI_GETWORKAREA) first value
         work_area_height = work_area.bottom
 
@@ -155,20 +425,196 @@ class WindowsPlatform(PlatformProvider):
 
 
 
+class VirtualPlatform(PlatformProvider):
+    """
+    Scripted platform for headless runs, never touches a display server.
+
+    State starts from the top-level values of the script and changes
+    at the times of its steps, in seconds since the provider was created
+    (`time_scale` runs the script and idle time faster):
+
+        width = 1920
+        height = 1080
+        work_area_bottom = 1040
+        time_scale = 1.0
+
+        [[step]]
+        at = 5
+        work_area_bottom = 1000     # Panel got taller
+        [[step]]
+        at = 10
+        idle = 400                  # Nobody touched anything for 400 s
+        [[step]]
+        at = 20
+        fullscreen = true
+        [[step]]
+        at = 30
+        active = true               # User is back
+
+    While the user is not active, idle time keeps growing. Steps are
+    applied by a daemon thread, which wakes the event loop through
+    a socket pair, so changes reach subscribers the same way X11 events
+    do. `apply` changes the state right away, for scripts in code.
+    """
+    STATE_KEYS = ("width", "height", "work_area_bottom", "idle", "active", "fullscreen")
+
+    def __init__(self, script: dict = None):
+        script = dict(script or {})
+        steps = sorted(script.pop("step", []), key=lambda step: step["at"])
+        self._time_scale = float(script.pop("time_scale", 1.0))
+        self._started = time.monotonic()
+
+        self._lock = threading.Lock()
+        self._width = 1920
+        self._height = 1080
+        self._work_area_bottom = 1040
+        self._active = True
+        self._idle_since = 0.0
+        self._fullscreen = False
+        self._apply(script)
+        for step in steps:
+            self._validate({key: value for key, value in step.items() if key != "at"})
+
+        # Changes not yet reported by `process_events`
+        self._changed: set[str] = set()
+
+        # Socket pairs work with Qt socket notifiers on every OS
+        self._wake_read, self._wake_write = socket.socketpair()
+        self._wake_read.setblocking(False)
+
+        self._stop = threading.Event()
+        self._thread = None
+        if steps:
+            self._thread = threading.Thread(target=self._run, args=(steps,),
+                                            name="virtual-platform", daemon=True)
+            self._thread.start()
+
+    @classmethod
+    def from_file(cls, path: str | Path | None) -> "VirtualPlatform":
+        """Provider with the script at `path`, defaults without one"""
+        if not path:
+            return cls()
+        with Path(path).open("rb") as f:
+            return cls(tomllib.load(f))
+
+    def close(self):
+        self._stop.set()
+        self._wake_read.close()
+        self._wake_write.close()
+
+    def _now(self) -> float:
+        """Script time in seconds"""
+        return (time.monotonic() - self._started) * self._time_scale
+
+    def _validate(self, changes: dict) -> None:
+        unknown = set(changes) - set(self.STATE_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown virtual platform state: {', '.join(sorted(unknown))}")
+
+    def _apply(self, changes: dict) -> set[str]:
+        self._validate(changes)
+        changed = set()
+        with self._lock:
+            resolution = (self._width, self._height, self._work_area_bottom)
+            self._width = int(changes.get("width", self._width))
+            self._height = int(changes.get("height", self._height))
+            self._work_area_bottom = int(changes.get("work_area_bottom", self._work_area_bottom))
+            if resolution != (self._width, self._height, self._work_area_bottom):
+                changed.add(WORK_AREA_CHANGED)
+
+            if "idle" in changes:
+                self._active = False
+                self._idle_since = self._now() - float(changes["idle"])
+            if "active" in changes:
+                self._active = bool(changes["active"])
+                self._idle_since = self._now()
+
+            fullscreen = bool(changes.get("fullscreen", self._fullscreen))
+            if fullscreen != self._fullscreen:
+                self._fullscreen = fullscreen
+                changed.add(FULLSCREEN_CHANGED)
+        return changed
+
+    def apply(self, **changes) -> None:
+        """Change the state now, subscribers are notified from the event loop"""
+        changed = self._apply(changes)
+        if not changed:
+            return
+        with self._lock:
+            self._changed |= changed
+        try:
+            self._wake_write.send(b"\0")
+        except OSError:
+            # Closed, nobody listens anymore
+            pass
+
+    def _run(self, steps: list[dict]) -> None:
+        for step in steps:
+            delay = (step["at"] - self._now()) / self._time_scale
+            if self._stop.wait(max(0.0, delay)):
+                return
+            self.apply(**{key: value for key, value in step.items() if key != "at"})
+
+    def get_resolution(self):
+        with self._lock:
+            return self._width, self._height, self._work_area_bottom
+
+    def get_idle_time(self):
+        with self._lock:
+            if self._active:
+                return 0
+            return self._now() - self._idle_since
+
+    def is_fullscreen(self):
+        return self._fullscreen
+
+    def get_screen_areas(self):
+        width, height, work_area_bottom = self.get_resolution()
+        return [ScreenArea(0, 0, width, work_area_bottom)], [ScreenArea(0, 0, width, height)]
+
+    # === Platform events ===
+    def get_event_fd(self):
+        return self._wake_read.fileno()
+
+    def has_pending_events(self):
+        return bool(self._changed)
+
+    def process_events(self):
+        try:
+            while self._wake_read.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+        with self._lock:
+            changed, self._changed = self._changed, set()
+        return changed
+
+
+
 class PlatformManager(PlatformProvider):
     def __init__(self):
         providers = {
-            'Linux': LinuxPlatform(),
-            'Windows': WindowsPlatform()
+            'Linux': LinuxPlatform,
+            'Windows': WindowsPlatform
         }
 
-        os_type = platform.system()
-        provider = providers.get(os_type)
-        
-        if provider:
-            self.provider = provider
+        forced = os.environ.get(PLATFORM_ENV)
+        if forced == "virtual":
+            self.provider = VirtualPlatform.from_file(os.environ.get(PLATFORM_SCRIPT_ENV))
+        elif forced:
+            raise NotImplementedError(f"Unknown platform provider: {forced}")
         else:
-            raise NotImplementedError(f"Unsupported platform: {os_type}")
+            os_type = platform.system()
+            provider = providers.get(os_type)
+
+            if provider:
+                self.provider = provider()
+            else:
+                raise NotImplementedError(f"Unsupported platform: {os_type}")
+
+        # Callbacks receiving set of changed state names
+        self._subscribers = []
 
     # It's better, but IDE don't see methods to autocomplete
     # def __getattr__(self, name):
@@ -183,6 +629,39 @@ class PlatformManager(PlatformProvider):
     def is_fullscreen(self):
         return self.provider.is_fullscreen()
 
+    def get_screen_areas(self):
+        return self.provider.get_screen_areas()
+
+    # === Platform events ===
+    def subscribe(self, callback) -> None:
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def get_event_fd(self):
+        return self.provider.get_event_fd()
+
+    def has_pending_events(self):
+        return self.provider.has_pending_events()
+
+    def process_events(self):
+        changed = self.provider.process_events()
+        self._notify(changed)
+        return changed
+
+    def refresh(self):
+        self.provider.refresh()
+        self._notify({WORK_AREA_CHANGED})
+
+    def _notify(self, changed: set[str]) -> None:
+        if not changed:
+            return
+        for callback in list(self._subscribers):
+            callback(changed)
+
 
 
 platman = PlatformManager()
\ No newline at end of file
@@ -0,0 +1,120 @@
+# Basic
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Iterable
+
+
+
+@dataclass(frozen=True)
+class ScreenArea:
+    """Work area of one monitor (excluding taskbars/panels)"""
+    x: int
+    y: int
+    width: int
+    height: int
+
+    @property
+    def right(self) -> int:
+        return self.x + self.width
+
+    @property
+    def bottom(self) -> int:
+        return self.y + self.height
+
+    @classmethod
+    def from_rect(cls, rect) -> "ScreenArea":
+        """Build from anything with QRect-like getters"""
+        return cls(rect.x(), rect.y(), rect.width(), rect.height())
+
+
+
+class ScreenLayout:
+    """
+    Immutable index of monitor work areas along the x axis.
+
+    Desktop is cut into x segments, each one mapped to the monitor
+    with the lowest bottom edge above it, i.e. the "floor" a companion
+    standing at that x would land on. Segments are sorted, so lookup
+    is a binary search.
+    """
+    def __init__(self, areas: Iterable[ScreenArea]):
+        self.areas = tuple(area for area in areas if area.width > 0 and area.height > 0)
+
+        edges = sorted({area.x for area in self.areas} | {area.right for area in self.areas})
+
+        segments = []
+        for start, end in zip(edges, edges[1:]):
+            covering = [area for area in self.areas if area.x <= start and end <= area.right]
+            if not covering:
+                continue
+            floor = max(covering, key=lambda area: area.bottom)
+
+            # Merge with previous segment of the same monitor
+            if segments and segments[-1][1] == start and segments[-1][2] is floor:
+                segments[-1] = (segments[-1][0], end, floor)
+            else:
+                segments.append((start, end, floor))
+
+        self._segments = tuple(segments)
+        self._starts = tuple(segment[0] for segment in segments)
+
+    def __bool__(self) -> bool:
+        return bool(self._segments)
+
+    def area_at(self, x: int) -> ScreenArea:
+        """
+        Monitor below the x coordinate.
+        Coordinates outside of any monitor snap to the nearest one.
+        """
+        i = bisect_right(self._starts, x) - 1
+        if i < 0:
+            return self._segments[0][2]
+
+        start, end, area = self._segments[i]
+        if x < end or i + 1 == len(self._segments):
+            return area
+
+        # In a gap between monitors
+        next_start, _, next_area = self._segments[i + 1]
+        return area if x - end < next_start - x else next_area
+
+    def ground_level(self, x: int) -> int:
+        return self.area_at(x).bottom
+
+    def span_x(self) -> tuple[int, int]:
+        """Leftmost and rightmost (exclusive) x of the desktop"""
+        return (self._segments[0][0], self._segments[-1][1])
+
+
+
+class ScreenIndex:
+    """
+    Holder of the current layout, shared by all companions.
+    Layout is replaced as a whole, so readers on other
+    threads always see a consistent one.
+
+    Full screen rects (including panels) are kept
+    as well, to tell if anything at all can be seen.
+    """
+    def __init__(self):
+        self.layout = ScreenLayout(())
+        self.screens: tuple[ScreenArea, ...] = ()
+
+    def rebuild(self, areas: Iterable[ScreenArea], screens: Iterable[ScreenArea] = ()) -> None:
+        self.layout = ScreenLayout(areas)
+        self.screens = tuple(screens)
+
+    def is_empty(self) -> bool:
+        return not self.layout
+
+    def is_visible(self, x: int, y: int, width: int, height: int) -> bool:
+        """If the rect overlaps any screen"""
+        for screen in self.screens or self.layout.areas:
+            if x < screen.right and screen.x < x + width \
+            and y < screen.bottom and screen.y < y + height:
+                return True
+        return False
+
+
+
+screen_index = ScreenIndex()
@@ -0,0 +1,58 @@
+# Basic
+import time
+from contextlib import contextmanager
+
+
+
+class StartupTimer:
+    """
+    Timing breakdown of application launch.
+
+    Phases may nest (e.g. config loading inside companion creation),
+    each one is reported with its start offset and duration. The clock
+    starts at `begin()`, called as early as possible by the entry point.
+    """
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.phases: list[tuple[str, float, float]] = []
+        self.first_frame: float | None = None
+
+        # Called with the report once the first frame is shown
+        self._on_first_frame = []
+
+    def begin(self, origin: float = None) -> None:
+        self.origin = time.perf_counter() if origin is None else origin
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start - self.origin, time.perf_counter() - start))
+
+    def on_first_frame(self, callback) -> None:
+        self._on_first_frame.append(callback)
+
+    def mark_first_frame(self) -> None:
+        if self.first_frame is not None:
+            return
+        self.first_frame = time.perf_counter() - self.origin
+
+        for callback in self._on_first_frame:
+            callback(self)
+
+    def total_ms(self) -> float | None:
+        return None if self.first_frame is None else self.first_frame * 1000
+
+    def report(self) -> str:
+        lines = ["Startup timings:"]
+        for name, start, duration in sorted(self.phases, key=lambda phase: phase[1]):
+            lines.append(f"  {start * 1000:>8.1f} ms  +{duration * 1000:>7.1f} ms  {name}")
+        if self.first_frame is not None:
+            lines.append(f"  {self.first_frame * 1000:>8.1f} ms  first companion frame")
+        return "\n".join(lines)
+
+
+
+startup = StartupTimer()
@@ -6,18 +6,30 @@ import gettext
 
 # Custom modules
 from modules.core import PathManager
+from modules.core.startup import startup
 from modules.settings import app_settings
 
 
 
-try:
-    translator = gettext.translation(
-        domain='messages',
-        localedir=PathManager.get_locales_dir(),
-        languages=[app_settings.language]
-    )
-    lang_ = translator.gettext
-    # translator.install()
-except FileNotFoundError as e:
-    print(f"Translation file not found for {app_settings.language}: {e}")
-    sys.exit(1)
\ No newline at end of file
+_translator: gettext.NullTranslations = None
+
+
+def _load_translator() -> gettext.NullTranslations:
+    try:
+        with startup.phase("translation"):
+            return gettext.translation(
+                domain='messages',
+                localedir=PathManager.get_locales_dir(),
+                languages=[app_settings.language]
+            )
+    except FileNotFoundError as e:
+        print(f"Translation file not found for {app_settings.language}: {e}")
+        sys.exit(1)
+
+
+def lang_(message: str) -> str:
+    # Catalog is loaded with the first translated string
+    global _translator
+    if _translator is None:
+        _translator = _load_translator()
+    return _translator.gettext(message)
\ No newline at end of file
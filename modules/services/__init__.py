@@ -0,0 +1,7 @@
+from .platform_watcher import PlatformWatcher
+from .fullscreen_watcher import FullscreenWatcher
+from .activity_governor import ActivityGovernor
+from .cursor_service import CursorService
+from .geometry_batch import GeometryBatch
+from .metrics_sampler import MetricsSampler
+from .dialogue_service import DialogueService, DialogueReply, TextSource, LocalTextSource
\ No newline at end of file
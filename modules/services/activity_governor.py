@@ -0,0 +1,78 @@
+# Application
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+# Custom modules
+from modules.core import platman
+
+
+
+class ActivityGovernor(QObject):
+    """
+    Tells when nobody has touched mouse or keyboard for a while.
+
+    Idle time is sampled with a single-shot timer. While the user is
+    active, the next sample is scheduled for the moment the threshold
+    could be reached at the earliest (but not sooner than
+    `coarse_interval_ms`). While idle, it is sampled often enough
+    to notice the first input quickly.
+
+    A failed sample is retried at the coarse interval, low-power mode
+    is given up only after `MAX_FAILURES` failures in a row.
+    """
+    # Signals
+    signalIdleChanged = pyqtSignal(bool)
+
+    MAX_FAILURES = 5
+
+    def __init__(self, threshold_s: float, coarse_interval_ms: int = 5_000, wake_interval_ms: int = 500):
+        super().__init__()
+
+        self._threshold_s = threshold_s
+        self._coarse_interval_ms = coarse_interval_ms
+        self._wake_interval_ms = wake_interval_ms
+        self._idle = False
+        self._failures = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._sample)
+
+        # Zero threshold disables low-power mode
+        if threshold_s > 0:
+            self._timer.start(coarse_interval_ms)
+
+    def isIdle(self) -> bool:
+        return self._idle
+
+    def _sample(self) -> None:
+        try:
+            idle_time = platman.get_idle_time()
+        except RuntimeError as e:
+            # Keep full speed while idle time is unavailable
+            if self._idle:
+                self._setIdle(False)
+
+            self._failures += 1
+            if self._failures >= self.MAX_FAILURES:
+                print(f"Idle time unavailable, low-power mode disabled: {e}")
+                return
+            print(f"Idle time unavailable, retrying: {e}")
+            self._timer.start(self._coarse_interval_ms)
+            return
+        self._failures = 0
+
+        if self._idle:
+            if idle_time < self._threshold_s:
+                self._setIdle(False)
+        elif idle_time >= self._threshold_s:
+            self._setIdle(True)
+
+        if self._idle:
+            self._timer.start(self._wake_interval_ms)
+        else:
+            remaining_ms = int((self._threshold_s - idle_time) * 1000)
+            self._timer.start(max(self._coarse_interval_ms, remaining_ms))
+
+    def _setIdle(self, idle: bool) -> None:
+        self._idle = idle
+        self.signalIdleChanged.emit(idle)
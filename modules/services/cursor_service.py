@@ -0,0 +1,101 @@
+# Basic
+import time
+
+# Application
+from PyQt6.QtCore import QObject, QTimer, QEvent
+from PyQt6.QtGui import QCursor
+from PyQt6.QtWidgets import QWidget
+
+# Custom modules
+from modules.core.motion_samples import MotionSamples
+
+
+
+class CursorService(QObject):
+    """
+    One cursor sensor shared by all companions.
+
+    Position is sampled at a bounded rate, and also taken from mouse
+    events delivered to the windows companions `watch`. Reads are O(1)
+    from the cached position, so any number of companions (on any
+    thread) can read it every tick without touching the platform.
+
+    Sampling runs only while somebody holds the service (`acquire` /
+    `release`), so sleeping companions don't poll the mouse at all.
+    """
+    _instance: "CursorService" = None
+
+    @classmethod
+    def instance(cls) -> "CursorService":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, rate_hz: int = 60, history: int = 32):
+        super().__init__()
+
+        self._samples = MotionSamples(history)
+        self._position = self._read()
+        self._users = 0
+
+        # pynput is imported on first write only
+        self._controller = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(1000 // rate_hz)
+        self._timer.timeout.connect(self._sample)
+
+    @staticmethod
+    def _read() -> tuple[int, int]:
+        pos = QCursor.pos()
+        return (pos.x(), pos.y())
+
+    @property
+    def position(self) -> tuple[int, int]:
+        return self._position
+
+    def velocity(self, window_s: float = 0.1) -> tuple[float, float]:
+        # Samples are recorded on change only, none while the cursor rests
+        return self._samples.velocity(window_s, now=time.monotonic())
+
+    def set_position(self, x: int, y: int) -> None:
+        if self._controller is None:
+            from pynput.mouse import Controller
+            self._controller = Controller()
+        self._controller.position = (x, y)
+        self._record((x, y))
+
+    def watch(self, window: QWidget) -> None:
+        """
+        Take samples from mouse events of `window` too. Filtering every
+        event of the application would add a Python call to each of them.
+        """
+        window.installEventFilter(self)
+
+    def acquire(self) -> None:
+        self._users += 1
+        if not self._timer.isActive():
+            self._sample()
+            self._timer.start()
+
+    def release(self) -> None:
+        self._users = max(0, self._users - 1)
+        if self._users == 0:
+            self._timer.stop()
+
+    def _record(self, position: tuple[int, int]) -> None:
+        self._position = position
+        self._samples.add(time.monotonic(), *position)
+
+    def _sample(self) -> None:
+        position = self._read()
+        if position != self._position:
+            self._record(position)
+
+    def eventFilter(self, obj, event):
+        # Free, precise samples while cursor is over our own windows
+        if self._users and event.type() == QEvent.Type.MouseMove:
+            pos = event.globalPosition().toPoint()
+            if (pos.x(), pos.y()) != self._position:
+                self._record((pos.x(), pos.y()))
+        return False
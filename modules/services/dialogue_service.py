@@ -0,0 +1,143 @@
+# Basic
+import random as r
+import threading
+import traceback
+from typing import Iterator
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+# Application
+from PyQt6.QtCore import QObject, pyqtSignal
+
+# Custom modules
+from modules.core import lang_
+
+
+
+class TextSource(ABC):
+    """
+    Producer of reply text.
+
+    `stream` runs on a pool thread and yields the reply in chunks
+    as soon as they are available. Long waits inside it should use
+    `cancelled.wait(...)`, so a cancelled reply frees the thread quickly.
+    """
+    @abstractmethod
+    def stream(self, prompt: str, cancelled: threading.Event) -> Iterator[str]:
+        pass
+
+
+
+class LocalTextSource(TextSource):
+    """
+    Stand-in generator, no network or speech packages needed.
+    Picks a phrase and "types" it word by word after a short pause.
+    """
+    def __init__(self, phrases: list[str] = None, think_s: float = 0.6, word_s: float = 0.08):
+        self._phrases = phrases
+        self._think_s = think_s
+        self._word_s = word_s
+
+    def _default_phrases(self) -> list[str]:
+        return [
+            # TRANSLATORS: Reply of companion Sebastian when asked to listen
+            lang_("companion_assist_reply"),
+            lang_("companion_say_hello"),
+        ]
+
+    def stream(self, prompt: str, cancelled: threading.Event) -> Iterator[str]:
+        if cancelled.wait(self._think_s):
+            return
+
+        phrase = r.choice(self._phrases or self._default_phrases())
+        for i, word in enumerate(phrase.split(" ")):
+            if i and cancelled.wait(self._word_s):
+                return
+            yield word if i == 0 else " " + word
+
+
+
+class DialogueReply:
+    """Handle of one reply in progress, safe to poll from any thread"""
+    def __init__(self, prompt: str):
+        self.prompt = prompt
+        self.text = ""
+        self.error: Exception = None
+
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def is_done(self) -> bool:
+        return self._done.is_set()
+
+
+
+class DialogueService(QObject):
+    """
+    Produces companion replies off the GUI and behavior threads.
+
+    Replies run on a small thread pool. Every new chunk is reported
+    with `signalPartial` and completion with `signalFinished`, both
+    emitted from the pool thread and delivered queued to receivers
+    on the GUI thread, so bubbles are updated as text arrives.
+    """
+    # Reply and the whole text produced so far
+    signalPartial = pyqtSignal(object, str)
+    signalFinished = pyqtSignal(object)
+
+    _instance: "DialogueService" = None
+
+    @classmethod
+    def instance(cls) -> "DialogueService":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, source: TextSource = None, max_workers: int = 2):
+        super().__init__()
+
+        self._source = source or LocalTextSource()
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="dialogue")
+
+        self._active: set[DialogueReply] = set()
+        self._lock = threading.Lock()
+
+    def set_source(self, source: TextSource) -> None:
+        """Used by replies requested from now on"""
+        self._source = source
+
+    def request(self, prompt: str = "") -> DialogueReply:
+        reply = DialogueReply(prompt)
+        with self._lock:
+            self._active.add(reply)
+        self._pool.submit(self._produce, reply, self._source)
+        return reply
+
+    def _produce(self, reply: DialogueReply, source: TextSource) -> None:
+        try:
+            for chunk in source.stream(reply.prompt, reply._cancelled):
+                if reply.is_cancelled():
+                    break
+                reply.text += chunk
+                self.signalPartial.emit(reply, reply.text)
+        except Exception as e:
+            reply.error = e
+            traceback.print_exc()
+        finally:
+            with self._lock:
+                self._active.discard(reply)
+            reply._done.set()
+            self.signalFinished.emit(reply)
+
+    def shutdown(self) -> None:
+        """Cancel replies in progress and drop queued ones"""
+        with self._lock:
+            for reply in self._active:
+                reply.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,43 @@
+# Application
+from PyQt6.QtCore import QObject, pyqtSignal
+
+# Custom modules
+from modules.core import platman
+from modules.core.platform_manager import FULLSCREEN_CHANGED
+
+
+
+class FullscreenWatcher(QObject):
+    """
+    Reports when a fullscreen window (game, video) takes or loses focus.
+
+    Relies on platform events pumped by `PlatformWatcher`,
+    so nothing is polled while the state stays the same.
+    Stays inactive when the platform can't tell (no X display).
+    """
+    # Signals
+    signalFullscreenChanged = pyqtSignal(bool)
+
+    def __init__(self):
+        super().__init__()
+
+        self._active = False
+        try:
+            # Also starts following the active window
+            self._active = platman.is_fullscreen()
+        except RuntimeError as e:
+            print(f"Fullscreen state unavailable, fullscreen detection disabled: {e}")
+            return
+        platman.subscribe(self._onPlatformChanged)
+
+    def isActive(self) -> bool:
+        return self._active
+
+    def _onPlatformChanged(self, changed: set[str]):
+        if FULLSCREEN_CHANGED not in changed:
+            return
+
+        active = platman.is_fullscreen()
+        if active != self._active:
+            self._active = active
+            self.signalFullscreenChanged.emit(active)
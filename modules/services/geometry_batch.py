@@ -0,0 +1,59 @@
+# Application
+from PyQt6.QtCore import QObject, QTimer, QPoint
+from PyQt6.QtWidgets import QWidget
+
+# Custom modules
+from modules.core.metrics import metrics
+
+
+
+class GeometryBatch(QObject):
+    """
+    Latest desired positions of top-level windows, applied once per frame.
+
+    Behavior ticks, drags and attached dialogs only record where a
+    window should be. The position is applied with one native move
+    when the companion frame drains its commands, or after one frame
+    interval for requests made between frames (e.g. mouse drags).
+    Windows moved during a flush (dialogs following their companion)
+    are applied within the same flush.
+    """
+    _instance: "GeometryBatch" = None
+
+    @classmethod
+    def instance(cls) -> "GeometryBatch":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, interval_ms: int = 16):
+        super().__init__()
+
+        self._pending: dict[QWidget, QPoint] = {}
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def move(self, window: QWidget, x: int, y: int) -> None:
+        self._pending[window] = QPoint(int(x), int(y))
+        # Compared with "window_moves" shows how much is coalesced
+        metrics.incr("window_moves_requested")
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def position(self, window: QWidget) -> QPoint:
+        """Position the window will have after the next flush"""
+        return self._pending.get(window, window.pos())
+
+    def discard(self, window: QWidget) -> None:
+        self._pending.pop(window, None)
+
+    def flush(self) -> None:
+        self._timer.stop()
+        while self._pending:
+            window, pos = self._pending.popitem()
+            if window.pos() != pos:
+                window.move(pos)
+                metrics.incr("window_moves")
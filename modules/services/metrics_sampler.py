@@ -0,0 +1,78 @@
+# Basic
+import json
+from pathlib import Path
+
+# Application
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+# Custom modules
+from modules.core.metrics import metrics
+
+
+
+class MetricsSampler(QObject):
+    """
+    Periodic reader of the metrics registry.
+
+    Samples are taken only while somebody needs them: a visible
+    metrics panel (`acquire` / `release`) or an active JSON lines
+    export, where every sample is appended as one line.
+    """
+    signalSampled = pyqtSignal(dict)
+
+    _instance: "MetricsSampler" = None
+
+    @classmethod
+    def instance(cls) -> "MetricsSampler":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, interval_ms: int = 1_000):
+        super().__init__()
+
+        self.latest: dict = None
+        self._users = 0
+        self._export = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._sample)
+
+    def acquire(self) -> None:
+        self._users += 1
+        self._updateTimer()
+
+    def release(self) -> None:
+        self._users = max(0, self._users - 1)
+        self._updateTimer()
+
+    def start_export(self, path: Path) -> None:
+        self.stop_export()
+        self._export = open(path, "a", encoding="utf-8")
+        self._updateTimer()
+
+    def stop_export(self) -> None:
+        if self._export:
+            self._export.close()
+            self._export = None
+        self._updateTimer()
+
+    def is_exporting(self) -> bool:
+        return self._export is not None
+
+    def _updateTimer(self) -> None:
+        needed = self._users > 0 or self._export is not None
+        if needed and not self._timer.isActive():
+            # Start a fresh interval instead of averaging over the idle time
+            metrics.collect()
+            self._timer.start()
+        elif not needed:
+            self._timer.stop()
+
+    def _sample(self) -> None:
+        self.latest = metrics.collect()
+        if self._export:
+            self._export.write(json.dumps(self.latest) + "\n")
+            self._export.flush()
+        self.signalSampled.emit(self.latest)
@@ -0,0 +1,90 @@
+# Application
+from PyQt6.QtCore import QObject, QTimer, QSocketNotifier, QAbstractEventDispatcher
+from PyQt6.QtGui import QGuiApplication
+
+# Custom modules
+from modules.core import platman, screen_index
+from modules.core.platform_manager import WORK_AREA_CHANGED
+from modules.core.screen_geometry import ScreenArea
+
+
+
+def rebuild_screen_index() -> None:
+    """Rebuild shared screen index from work areas of all monitors"""
+    # Virtual platforms describe their own screens
+    areas = platman.get_screen_areas()
+    if areas is not None:
+        screen_index.rebuild(*areas)
+        return
+
+    screens = QGuiApplication.screens()
+    screen_index.rebuild(
+        (ScreenArea.from_rect(screen.availableGeometry()) for screen in screens),
+        (ScreenArea.from_rect(screen.geometry()) for screen in screens)
+    )
+
+
+
+class PlatformWatcher(QObject):
+    """
+    Feeds platform events into the Qt event loop.
+
+    When the platform has its own connection (X11 on Linux), its socket
+    is watched and events are processed as soon as they arrive. Xlib may
+    also read events into its queue while answering other requests, so
+    the queue is checked (without any I/O) before the loop goes idle.
+
+    Other platforms, and Linux without an X display or libX11,
+    are refreshed from Qt screen signals instead.
+
+    Either way, the shared screen index is rebuilt
+    only when screens or their work areas change.
+    """
+    def __init__(self):
+        super().__init__()
+
+        self._notifier = None
+
+        try:
+            fd = platman.get_event_fd()
+        except RuntimeError as e:
+            print(f"Platform events unavailable, following Qt screen signals: {e}")
+            fd = None
+        if fd is not None:
+            self._notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+            self._notifier.activated.connect(self._processEvents)
+            QAbstractEventDispatcher.instance().aboutToBlock.connect(self._processQueued)
+
+        platman.subscribe(self._onPlatformChanged)
+
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self._watchScreen)
+        app.screenRemoved.connect(self._onScreensChanged)
+        for screen in app.screens():
+            self._watchScreen(screen)
+
+        rebuild_screen_index()
+
+    def _processEvents(self, *_):
+        platman.process_events()
+
+    def _processQueued(self):
+        if platman.has_pending_events():
+            platman.process_events()
+
+    def _watchScreen(self, screen):
+        screen.geometryChanged.connect(self._onScreensChanged)
+        screen.availableGeometryChanged.connect(self._onScreensChanged)
+        self._onScreensChanged()
+
+    def _onScreensChanged(self, *_):
+        if self._notifier is None:
+            # No own event source, platform learns about changes from Qt
+            platman.refresh()
+        else:
+            rebuild_screen_index()
+
+    def _onPlatformChanged(self, changed: set[str]):
+        if WORK_AREA_CHANGED in changed:
+            # Let Qt handle the same X events and update its screens first
+            QTimer.singleShot(0, rebuild_screen_index)
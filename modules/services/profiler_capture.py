@@ -0,0 +1,117 @@
+# Basic
+import io
+import json
+import time
+import pstats
+import cProfile
+import tracemalloc
+from pathlib import Path
+
+# Application
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+# Custom modules
+from modules.core import PathManager, metrics
+from modules.companion_base.tree_timings import TreeTimings
+
+
+
+class ProfilerCapture(QObject):
+    """
+    Time-bounded profile of the running application.
+
+    Combines cProfile of the GUI thread, a tracemalloc snapshot diff
+    and per-node timings of the behavior trees (which tick on their own
+    threads). Works the same in frozen builds, results are plain files
+    in a timestamped directory that can be attached to a bug report:
+
+        profile.pstats  - raw cProfile stats (snakeviz, pstats)
+        profile.txt     - top functions by cumulative time
+        memory.txt      - allocation growth during the capture
+        tree.txt        - per-node behavior tree timings
+        metrics.json    - runtime metrics over the capture
+    """
+    # Directory with the results
+    signalFinished = pyqtSignal(Path)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._profile: cProfile.Profile = None
+        self._timings: TreeTimings = None
+        self._snapshot: tracemalloc.Snapshot = None
+        self._started_tracing = False
+        self._output: Path = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.stop)
+
+    def is_running(self) -> bool:
+        return self._profile is not None
+
+    def start(self, trees: dict, duration_s: float = 10.0, output_dir: Path = None) -> None:
+        """
+        Args:
+            trees (dict): Name -> root behaviour of every tree to time
+            duration_s (float, optional): Length of the capture
+            output_dir (Path, optional): Defaults to a new directory in profiles dir
+        """
+        if self.is_running():
+            return
+
+        self._output = output_dir or PathManager.get_profiles_dir() / time.strftime("%Y%m%d-%H%M%S")
+
+        self._timings = TreeTimings()
+        for name, root in trees.items():
+            self._timings.attach(name, root)
+
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self._snapshot = tracemalloc.take_snapshot()
+
+        # Rates over exactly the capture
+        metrics.collect()
+
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        self._timer.start(int(duration_s * 1000))
+
+    def stop(self) -> None:
+        if not self.is_running():
+            return
+        self._timer.stop()
+
+        self._profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        if self._started_tracing:
+            tracemalloc.stop()
+        self._timings.detach()
+
+        output = self._output
+        output.mkdir(parents=True, exist_ok=True)
+
+        self._profile.dump_stats(output / "profile.pstats")
+        text = io.StringIO()
+        pstats.Stats(self._profile, stream=text).sort_stats("cumulative").print_stats(60)
+        (output / "profile.txt").write_text(text.getvalue(), encoding="utf-8")
+
+        # Allocations made by the profiler itself are not interesting
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+        ]
+        growth = snapshot.filter_traces(filters).compare_to(
+            self._snapshot.filter_traces(filters), "lineno")
+        (output / "memory.txt").write_text(
+            "\n".join(str(stat) for stat in growth[:40]), encoding="utf-8")
+
+        (output / "tree.txt").write_text(self._timings.report(), encoding="utf-8")
+        (output / "metrics.json").write_text(json.dumps(metrics.collect(), indent=4), encoding="utf-8")
+
+        self._profile = None
+        self._timings = None
+        self._snapshot = None
+
+        self.signalFinished.emit(output)
@@ -2,7 +2,7 @@
 from dataclasses import dataclass
 
 # Custom modules
-from .config_loader import load_config
+from .config_loader import LazyConfig
 from modules.core import PathManager
 
 
@@ -11,10 +11,13 @@ from modules.core import PathManager
 class AppSettings:
     companion_run_on_launch: bool = True
     language: str = "en"
+    render_backend: str = "window"
+    idle_threshold: int = 300
 
 
 
-app_settings = load_config(
+# Loaded on first access
+app_settings = LazyConfig(
     AppSettings,
-    PathManager.get_app_settings_path()
+    PathManager.get_app_settings_path
 )
\ No newline at end of file
@@ -2,7 +2,7 @@
 from dataclasses import dataclass
 
 # Custom modules
-from .config_loader import load_config
+from .config_loader import LazyConfig
 from modules.core import PathManager
 
 
@@ -12,10 +12,12 @@ class CompanionSettings:
     model_scale: float = 1.4
     horizontal_anchor: float = 0.50
     vertical_anchor: float = 0.80
+    threaded_behavior: bool = True
 
 
 
-companion_settings = load_config(
+# Loaded on first access
+companion_settings = LazyConfig(
     CompanionSettings,
-    PathManager.get_companions_config_path()
+    PathManager.get_companions_config_path
 )
\ No newline at end of file
@@ -1,7 +1,10 @@
 from pathlib import Path
 from dataclasses import dataclass, fields
+from typing import Callable
 import tomllib
 
+from modules.core.startup import startup
+
 
 
 def load_config(cls: dataclass, path: Path) -> dataclass:
@@ -19,4 +22,34 @@ def load_config(cls: dataclass, path: Path) -> dataclass:
         key = field.name
         kwargs[key] = data.get(key, getattr(defaults, key))
 
-    return cls(**kwargs)
\ No newline at end of file
+    return cls(**kwargs)
+
+
+
+class LazyConfig:
+    """
+    Stand-in for a config dataclass, loaded from disk on first access.
+
+    Path is resolved at load time too, so importing settings
+    has no side effects and entry points can still relocate
+    `PathManager.MAIN_DIR` before anything is read.
+    """
+    def __init__(self, cls: dataclass, path: Callable[[], Path]):
+        object.__setattr__(self, "_cls", cls)
+        object.__setattr__(self, "_path", path)
+        object.__setattr__(self, "_config", None)
+
+    def _load(self) -> dataclass:
+        config = object.__getattribute__(self, "_config")
+        if config is None:
+            cls = object.__getattribute__(self, "_cls")
+            with startup.phase(f"config: {cls.__name__}"):
+                config = load_config(cls, object.__getattribute__(self, "_path")())
+            object.__setattr__(self, "_config", config)
+        return config
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
@@ -0,0 +1,11 @@
+# Developer tools, run from the repository root
+# as modules, e.g. `python -m tools.benchmarks.render_backends`
+#
+# PathManager resolves resources relative to the entry point
+# script, which for `python -m` is the tool itself.
+# Point it back to the repository root.
+from pathlib import Path
+
+from modules.core.path_manager import PathManager
+
+PathManager.MAIN_DIR = Path(__file__).resolve().parent.parent
@@ -0,0 +1,267 @@
+"""
+Scaling load test: steady-state cost of hosting N companions.
+
+Every count runs in a fresh offscreen process with the virtual
+platform and a scripted cursor sweeping over the screen, so companions
+that chase or look at the cursor do real work:
+
+    python -m tools.benchmarks.load_test --counts 1 5 10 25 50 --plot bench/scaling.png
+
+For every count it records CPU seconds per wall second, RSS, frame
+timer lateness and dropped frames (frames the timers should have
+fired at their interval but didn't). Every companion's own tree has
+to be running, i.e. its energy changes during the measurement,
+otherwise the run exits with code 1. The curve is drawn with Qt
+itself, no plotting library is needed. `--platform-script` replays
+a virtual platform script (work area, idle, fullscreen changes)
+during every run.
+"""
+# Basic
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import subprocess
+from pathlib import Path
+
+
+
+DEFAULT_COUNTS = (1, 5, 10, 25, 50)
+
+# (result key, chart title, unit)
+CURVES = (
+    ("cpu_percent", "CPU", "% of one core"),
+    ("rss_mb", "RSS", "MB"),
+    ("lateness_p95_ms", "Timer lateness p95", "ms"),
+    ("dropped_percent", "Dropped frames", "%"),
+)
+
+
+
+def cursor_path(t: float, width: int, height: int) -> tuple[int, int]:
+    """Lissajous sweep over the whole screen, one loop every ~20 s"""
+    x = (0.5 + 0.45 * math.sin(t * 0.31)) * width
+    y = (0.5 + 0.45 * math.sin(t * 0.47 + 1.0)) * height
+    return int(x), int(y)
+
+
+def run_single(count: int, seconds: float, warmup: float, companion_name: str,
+               platform_script: Path = None) -> dict:
+    """Spawn `count` companions in this process and measure steady-state load"""
+    from tools.benchmarks.suite import prepare
+    prepare(platform_script)
+
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtGui import QCursor
+
+    from modules.core import platman
+    from modules.services import PlatformWatcher
+    from modules.core.metrics import metrics, rss_bytes
+    from modules.settings import companion_settings
+    from modules.companion_base import Companion
+
+    # Same threading as the application, unlike the tick benchmarks
+    companion_settings.threaded_behavior = True
+
+    app = QApplication(sys.argv[:1])
+    app.setQuitOnLastWindowClosed(False)
+
+    # Scripted platform changes reach the companions as in the application
+    watcher = PlatformWatcher()
+
+    width, height, _ = platman.get_resolution()
+    started = time.perf_counter()
+
+    def move_cursor():
+        QCursor.setPos(*cursor_path(time.perf_counter() - started, width, height))
+
+    cursor = QTimer()
+    cursor.timeout.connect(move_cursor)
+    cursor.start(16)
+
+    companions = [Companion(companion_name=companion_name) for _ in range(count)]
+    for companion in companions:
+        companion.start_activity()
+
+    result = {"count": count, "seconds": seconds}
+    marks = {}
+
+    def begin():
+        marks["wall"] = time.perf_counter()
+        marks["cpu"] = time.process_time()
+        marks["energy"] = [companion.get_energy() for companion in companions]
+        # Rates and histograms over the measurement only
+        metrics.collect()
+
+    def finish():
+        sample = metrics.collect()
+        wall = time.perf_counter() - marks["wall"]
+        result["cpu_percent"] = 100 * (time.process_time() - marks["cpu"]) / wall
+
+        rss = rss_bytes()
+        result["rss_mb"] = rss / 2**20 if rss is not None else None
+
+        lateness = sample["histograms"].get("timer_lateness_ms", {})
+        result["lateness_p50_ms"] = lateness.get("p50", 0.0)
+        result["lateness_p95_ms"] = lateness.get("p95", 0.0)
+        result["lateness_max_ms"] = lateness.get("max", 0.0)
+
+        tick = sample["histograms"].get("tick_ms", {})
+        result["tick_p95_ms"] = tick.get("p95", 0.0)
+
+        # Every companion timer should fire once per its interval
+        expected = sum(1000 / companion._timer.interval() for companion in companions)
+        frames = sample["rates"].get("frames", 0.0)
+        result["frames_per_s"] = frames
+        result["dropped_percent"] = max(0.0, 100 * (1 - frames / expected)) if expected else 0.0
+
+        # Activities spend energy, a companion whose tree drives nothing keeps it
+        result["active"] = sum(
+            companion.get_energy() != energy
+            for companion, energy in zip(companions, marks["energy"])
+        )
+
+        cursor.stop()
+        for companion in companions:
+            companion.release()
+        app.quit()
+
+    QTimer.singleShot(int(warmup * 1000), begin)
+    QTimer.singleShot(int((warmup + seconds) * 1000), finish)
+    app.exec()
+
+    return result
+
+
+# ==================================================
+#           Plot
+# ==================================================
+def plot_curves(results: list[dict], path: Path, panel_size: tuple[int, int] = (420, 280)) -> None:
+    """One chart per measured value against the companion count, saved as an image"""
+    from PyQt6.QtCore import Qt, QPointF, QRectF
+    from PyQt6.QtGui import QImage, QPainter, QPen, QColor, QPolygonF
+
+    panel_w, panel_h = panel_size
+    columns = 2
+    rows = math.ceil(len(CURVES) / columns)
+
+    image = QImage(panel_w * columns, panel_h * rows, QImage.Format.Format_ARGB32)
+    image.fill(QColor("white"))
+
+    counts = [result["count"] for result in results]
+    max_count = max(counts)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    for index, (key, title, unit) in enumerate(CURVES):
+        points = [(result["count"], result[key]) for result in results if result.get(key) is not None]
+        left = (index % columns) * panel_w
+        top = (index // columns) * panel_h
+        plot = QRectF(left + 60, top + 36, panel_w - 80, panel_h - 76)
+
+        painter.setPen(QColor("black"))
+        painter.drawText(QRectF(left, top + 8, panel_w, 20),
+                         Qt.AlignmentFlag.AlignHCenter, f"{title}, {unit}")
+        painter.drawRect(plot)
+        if not points:
+            continue
+
+        max_value = max(value for _, value in points) * 1.1 or 1.0
+
+        def to_pixel(count, value):
+            return QPointF(plot.left() + plot.width() * count / max_count,
+                           plot.bottom() - plot.height() * value / max_value)
+
+        # Axis labels: every measured count, zero and top of the value range
+        for count in counts:
+            x = to_pixel(count, 0).x()
+            painter.drawText(QRectF(x - 20, plot.bottom() + 4, 40, 16),
+                             Qt.AlignmentFlag.AlignHCenter, str(count))
+        painter.drawText(QRectF(left, plot.top() - 8, 56, 16),
+                         Qt.AlignmentFlag.AlignRight, f"{max_value:.3g}")
+        painter.drawText(QRectF(left, plot.bottom() - 8, 56, 16),
+                         Qt.AlignmentFlag.AlignRight, "0")
+        painter.drawText(QRectF(plot.left(), plot.bottom() + 20, plot.width(), 16),
+                         Qt.AlignmentFlag.AlignHCenter, "companions")
+
+        painter.setPen(QPen(QColor("#1f77b4"), 2))
+        painter.drawPolyline(QPolygonF([to_pixel(count, value) for count, value in points]))
+        for count, value in points:
+            painter.drawEllipse(to_pixel(count, value), 3, 3)
+
+    painter.end()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    image.save(str(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=list(DEFAULT_COUNTS))
+    parser.add_argument("--companion", default="Sebastian")
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--plot", type=Path, help="Save the scaling curve as an image (png)")
+    parser.add_argument("--platform-script", type=Path, help="Virtual platform script (TOML)")
+    # Internal: measure one count in this process
+    parser.add_argument("--single", type=int, metavar="COUNT", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single is not None:
+        # Companion code prints every tick, result must stay the last line
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                result = run_single(args.single, args.seconds, args.warmup,
+                                    args.companion, args.platform_script)
+            finally:
+                sys.stdout = stdout
+        print(json.dumps(result))
+        return
+
+    results = []
+    for count in args.counts:
+        command = [sys.executable, "-m", "tools.benchmarks.load_test",
+                   "--single", str(count), "--companion", args.companion,
+                   "--seconds", str(args.seconds), "--warmup", str(args.warmup)]
+        if args.platform_script:
+            command += ["--platform-script", str(args.platform_script)]
+        completed = subprocess.run(
+            command,
+            capture_output=True, text=True, check=True
+        )
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    print(f"{'count':>5} {'active':>6} {'CPU %':>7} {'RSS MB':>8} {'late p95 ms':>12} "
+          f"{'dropped %':>10} {'tick p95 ms':>12}")
+    for result in results:
+        rss = "n/a" if result["rss_mb"] is None else f"{result['rss_mb']:.1f}"
+        print(f"{result['count']:>5} {result['active']:>6} {result['cpu_percent']:>7.1f} {rss:>8} "
+              f"{result['lateness_p95_ms']:>12.2f} {result['dropped_percent']:>10.1f} "
+              f"{result['tick_p95_ms']:>12.2f}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=4))
+
+    if args.plot:
+        # Offscreen is enough to paint into an image
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtGui import QGuiApplication
+        app = QGuiApplication(sys.argv[:1])
+        plot_curves(results, args.plot)
+        print(f"Plot saved to {args.plot}")
+
+    inactive = [result["count"] for result in results if result["active"] < result["count"]]
+    if inactive:
+        sys.exit(f"Some companions didn't run their own tree with {inactive} companions")
+
+
+
+if __name__ == "__main__":
+    main()
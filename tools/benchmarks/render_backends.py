@@ -0,0 +1,142 @@
+"""
+Compare CPU and compositor load of the render backends.
+
+Every (backend, count) pair runs in a fresh process, so that
+settings and Qt state never leak between measurements:
+
+    python -m tools.benchmarks.render_backends --counts 1 10 50 --seconds 20
+
+The application CPU is taken from the process itself, compositor CPU
+is read from /proc for known compositor / X server process names
+(Linux only, reported as null elsewhere).
+"""
+# Basic
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from pathlib import Path
+
+
+
+BACKENDS = ("window", "overlay")
+
+COMPOSITORS = (
+    "Xorg", "Xwayland", "picom", "compton", "kwin_x11", "kwin_wayland",
+    "mutter", "gnome-shell", "cinnamon", "muffin", "xfwm4", "marco", "compiz",
+)
+
+
+
+def compositor_cpu_seconds(names: tuple[str, ...] = COMPOSITORS) -> float | None:
+    """Summed user + system CPU time of all running compositor processes"""
+    proc = Path("/proc")
+    if not proc.exists():
+        return None
+
+    ticks = os.sysconf("SC_CLK_TCK")
+    total = 0
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            if (entry / "comm").read_text().strip() not in names:
+                continue
+            # Process name may contain spaces, fields are counted after it
+            fields = (entry / "stat").read_text().rsplit(")", 1)[1].split()
+            total += int(fields[11]) + int(fields[12])
+        except (OSError, IndexError, ValueError):
+            continue
+    return total / ticks
+
+
+def run_single(backend: str, count: int, seconds: float, warmup: float) -> dict:
+    """Spawn `count` companions with `backend` and measure steady-state load"""
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QTimer
+
+    from modules.settings import app_settings
+    from modules.companion_base import Companion
+
+    app_settings.render_backend = backend
+
+    app = QApplication(sys.argv)
+    app.setQuitOnLastWindowClosed(False)
+
+    companions = [Companion(companion_name="Sebastian") for _ in range(count)]
+    for companion in companions:
+        companion.start_activity()
+
+    result = {"backend": backend, "count": count, "seconds": seconds}
+    marks = {}
+
+    def begin():
+        marks["wall"] = time.perf_counter()
+        marks["cpu"] = time.process_time()
+        marks["compositor"] = compositor_cpu_seconds()
+
+    def finish():
+        wall = time.perf_counter() - marks["wall"]
+        result["app_cpu_percent"] = 100 * (time.process_time() - marks["cpu"]) / wall
+
+        compositor = compositor_cpu_seconds()
+        if compositor is None or marks["compositor"] is None:
+            result["compositor_cpu_percent"] = None
+        else:
+            result["compositor_cpu_percent"] = 100 * (compositor - marks["compositor"]) / wall
+
+        for companion in companions:
+            companion.stop_activity()
+        app.quit()
+
+    QTimer.singleShot(int(warmup * 1000), begin)
+    QTimer.singleShot(int((warmup + seconds) * 1000), finish)
+    app.exec()
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--seconds", type=float, default=15.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    # Internal: measure one configuration in this process
+    parser.add_argument("--single", nargs=2, metavar=("BACKEND", "COUNT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        backend, count = args.single
+        print(json.dumps(run_single(backend, int(count), args.seconds, args.warmup)))
+        return
+
+    results = []
+    for count in args.counts:
+        for backend in args.backends:
+            completed = subprocess.run(
+                [sys.executable, "-m", "tools.benchmarks.render_backends",
+                 "--single", backend, str(count),
+                 "--seconds", str(args.seconds), "--warmup", str(args.warmup)],
+                capture_output=True, text=True, check=True
+            )
+            # Companion code prints to stdout, result is the last line
+            results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    print(f"{'backend':<10} {'count':>5} {'app CPU %':>10} {'compositor CPU %':>17}")
+    for result in results:
+        compositor = result["compositor_cpu_percent"]
+        compositor = "n/a" if compositor is None else f"{compositor:.1f}"
+        print(f"{result['backend']:<10} {result['count']:>5} "
+              f"{result['app_cpu_percent']:>10.1f} {compositor:>17}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=4))
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Compare per-frame cost of the sprite surface against a plain QLabel.
+
+    python -m tools.benchmarks.sprite_paint --frames 2000
+
+Both widgets cycle through the same animation frames inside a
+translucent top-level window. A frame is counted from the pixmap
+swap until the resulting paint has been flushed. Works with
+QT_QPA_PLATFORM=offscreen as well.
+"""
+# Basic
+import sys
+import json
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+
+
+def measure(set_frame, n_cycle: int, n_frames: int) -> list[float]:
+    """Per-frame times in microseconds"""
+    from PyQt6.QtWidgets import QApplication
+
+    times = []
+    for i in range(n_frames):
+        started = time.perf_counter()
+        set_frame(i % n_cycle)
+        # Paint events are delivered from the event loop
+        QApplication.processEvents()
+        times.append((time.perf_counter() - started) * 1e6)
+    return times
+
+
+def run(companion_name: str, animation: str, n_frames: int) -> dict:
+    from PyQt6.QtWidgets import QApplication, QWidget, QLabel
+    from PyQt6.QtCore import Qt
+
+    from widgets.sprite_label import SpriteLabel
+
+    app = QApplication(sys.argv[:1])
+
+    def make_host() -> QWidget:
+        host = QWidget()
+        host.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Tool)
+        host.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        return host
+
+    # === Sprite surface ===
+    host = make_host()
+    surface = SpriteLabel(host, companion_name)
+    host.setFixedSize(surface.size())
+    host.show()
+
+    frames = surface.animations[animation]["frames"][1]
+    alphas = surface.animations[animation]["alphas"][1]
+    # Surface is deleted along with its host, keep what comes after needs
+    size = surface.size()
+
+    results = {}
+    results["surface"] = measure(
+        lambda i: surface.setSprite(animation, i), len(frames), n_frames)
+    host.close()
+
+    # === QLabel with setPixmap, as before ===
+    host = make_host()
+    label = QLabel(host)
+    label.setFixedSize(size)
+    host.setFixedSize(size)
+    host.show()
+
+    def set_label_frame(i):
+        label.setPixmap(frames[i])
+        host.setMask(alphas[i])
+
+    results["qlabel"] = measure(set_label_frame, len(frames), n_frames)
+    host.close()
+
+    app.quit()
+
+    summary = {}
+    for name, times in results.items():
+        times.sort()
+        summary[name] = {
+            "mean_us": statistics.fmean(times),
+            "median_us": statistics.median(times),
+            "p95_us": times[int(len(times) * 0.95)],
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--companion", default="Sebastian")
+    parser.add_argument("--animation", default="walk")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    summary = run(args.companion, args.animation, args.frames)
+
+    print(f"{'widget':<10} {'mean µs':>9} {'median µs':>10} {'p95 µs':>8}")
+    for name, stats in summary.items():
+        print(f"{name:<10} {stats['mean_us']:>9.1f} {stats['median_us']:>10.1f} {stats['p95_us']:>8.1f}")
+    speedup = summary["qlabel"]["mean_us"] / summary["surface"]["mean_us"]
+    print(f"surface is {speedup:.2f}x the speed of QLabel")
+
+    if args.output:
+        args.output.write_text(json.dumps(summary, indent=4))
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+Headless benchmark suite for sprites, behavior trees, physics and dialogs.
+
+    python -m tools.benchmarks.suite --output bench/base.json
+    python -m tools.benchmarks.suite --output bench/new.json
+    python -m tools.benchmarks.suite --compare bench/base.json bench/new.json
+
+Runs under Qt's `offscreen` platform with the virtual platform provider,
+so results don't depend on the desktop it runs on. Comparison flags
+every metric that got worse by more than `--threshold` and exits
+with code 1 if there is any.
+"""
+# Basic
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import contextlib
+from pathlib import Path
+from typing import Callable
+
+
+
+# Metrics where a bigger number is better, all others are costs
+HIGHER_IS_BETTER = ("_per_s",)
+
+
+
+def timed(fn: Callable[[], None], iterations: int, setup: Callable[[], None] = None,
+          warmup: int = None) -> dict:
+    """
+    Per-call statistics of `fn` in microseconds.
+    First `warmup` calls (a tenth by default) only warm caches up and aren't counted.
+    """
+    if warmup is None:
+        warmup = iterations // 10
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fn()
+
+    times = []
+    for _ in range(iterations):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - started) * 1e6)
+    times.sort()
+    return {
+        "median_us": statistics.median(times),
+        "mean_us": statistics.fmean(times),
+        "p95_us": times[int(len(times) * 0.95)],
+    }
+
+
+def prepare(platform_script: Path = None) -> None:
+    """Headless Qt and platform, must run before the application modules are used"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from modules.core import platman
+    from modules.core.platform_manager import VirtualPlatform
+    from modules.settings import app_settings, companion_settings
+
+    # Without a script: one 1920x1080 screen, always active user, no fullscreen
+    platman.provider = VirtualPlatform.from_file(platform_script)
+    app_settings.render_backend = "window"
+    # Ticks are measured directly on this thread
+    companion_settings.threaded_behavior = False
+
+
+# ==================================================
+#           Benchmarks
+# ==================================================
+def bench_sprites(companion_name: str, warm_runs: int) -> dict:
+    from PyQt6.QtWidgets import QWidget
+    from modules.core.metrics import rss_bytes
+    from widgets.sprite_label import SpriteLabel
+
+    host = QWidget()
+
+    rss_before = rss_bytes()
+    started = time.perf_counter()
+    labels = [SpriteLabel(host, companion_name)]
+    cold_ms = (time.perf_counter() - started) * 1000
+
+    warm = []
+    for _ in range(warm_runs):
+        started = time.perf_counter()
+        labels.append(SpriteLabel(host, companion_name))
+        warm.append((time.perf_counter() - started) * 1000)
+    rss_after = rss_bytes()
+
+    result = {
+        "cold_ms": cold_ms,
+        "warm_median_ms": statistics.median(warm),
+        "store_bytes": labels[0].store_bytes,
+    }
+    if rss_before is not None and rss_after is not None:
+        result["rss_per_companion_bytes"] = (rss_after - rss_before) / len(labels)
+
+    host.deleteLater()
+    return result
+
+
+def bench_tree(companion, ticks: int) -> dict:
+    def tick():
+        companion._view = companion._take_snapshot()
+        companion.behavior.tick_once()
+
+    # Commands are applied between ticks, outside of the measurement
+    stats = timed(tick, ticks, setup=companion._apply_commands)
+    stats["ticks_per_s"] = 1e6 / stats["mean_us"]
+    return stats
+
+
+def bench_physics(companion, steps: int) -> dict:
+    from dataclasses import replace
+
+    ground = companion.get_ground_level()
+    air_view = replace(companion._take_snapshot(), y=ground - 600)
+
+    def reset_fall():
+        companion._commands.clear()
+        # Falling from high above, so every step is mid-air
+        companion._view = air_view
+        companion.set_velocities(8.0, -10.0)
+
+    def reset_walk():
+        companion._commands.clear()
+        companion._view = air_view
+
+    return {
+        "fall_to_ground": timed(companion.fall_to_ground, steps, setup=reset_fall),
+        "move_to_goal": timed(lambda: companion.move_to_goal(air_view.x + 5000), steps, setup=reset_walk),
+    }
+
+
+def bench_set_sprite(companion, frames: int) -> dict:
+    label = companion._window.label
+    label.setCulled(False)
+    name = "walk" if "walk" in label.animations else next(iter(label.animations))
+    n_frames = label.animations[name]["n_frames"]
+
+    counter = iter(range(frames * 2))
+    return timed(lambda: label.setSprite(name, next(counter) % n_frames), frames)
+
+
+def bench_dialog(companion, runs: int) -> dict:
+    from widgets.dialogue_window import DialogWindow, bubble_cache
+
+    window = companion._window
+    created = []
+
+    def create():
+        created.append(DialogWindow(window))
+
+    creation = timed(create, runs)
+
+    dialog = created[-1]
+
+    def clear_cache():
+        bubble_cache.clear()
+
+    cold = timed(lambda: dialog.showDialog("Benchmark phrase, rendered from scratch"), runs, setup=clear_cache)
+    cached = timed(lambda: dialog.showDialog("Benchmark phrase, rendered from scratch"), runs)
+
+    for dialog in created:
+        dialog.hide()
+        dialog.deleteLater()
+
+    return {"create": creation, "show_uncached": cold, "show_cached": cached}
+
+
+def run_suite(args) -> dict:
+    prepare()
+
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QT_VERSION_STR
+
+    app = QApplication(sys.argv[:1])
+    app.setQuitOnLastWindowClosed(False)
+
+    from modules.companion_base import Companion
+
+    results = {}
+    # Companion code prints every tick and frame
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results["sprites_load"] = bench_sprites(args.companion, args.warm_runs)
+
+        companion = Companion(companion_name=args.companion)
+        results["tree_tick"] = bench_tree(companion, args.ticks)
+        results["physics"] = bench_physics(companion, args.steps)
+        results["set_sprite"] = bench_set_sprite(companion, args.frames)
+        results["dialog"] = bench_dialog(companion, args.dialogs)
+        companion.release()
+
+    app.processEvents()
+
+    return {
+        "meta": {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "machine": platform.platform(),
+            "companion": args.companion,
+        },
+        "results": results,
+    }
+
+
+# ==================================================
+#           Comparison
+# ==================================================
+def flatten(results: dict, prefix: str = "") -> dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)):
+            flat[name] = float(value)
+    return flat
+
+
+def compare(base: dict, new: dict, threshold: float) -> list[str]:
+    """Print metric changes and return names of regressed ones"""
+    base_flat = flatten(base["results"])
+    new_flat = flatten(new["results"])
+
+    regressions = []
+    print(f"{'metric':<40} {'base':>12} {'new':>12} {'change':>8}")
+    for name in sorted(base_flat.keys() & new_flat.keys()):
+        old, current = base_flat[name], new_flat[name]
+        if old == 0:
+            continue
+        change = (current - old) / old
+        worse = -change if name.endswith(HIGHER_IS_BETTER) else change
+
+        flag = ""
+        if worse > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<40} {old:>12.2f} {current:>12.2f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--companion", default="Sebastian")
+    parser.add_argument("--warm-runs", type=int, default=5)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--steps", type=int, default=5000)
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--dialogs", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, nargs=2, metavar=("BASE", "NEW"),
+                        help="Compare two result files instead of running")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative change counted as regression (default 0.10)")
+    args = parser.parse_args()
+
+    if args.compare:
+        base, new = (json.loads(path.read_text()) for path in args.compare)
+        regressions = compare(base, new, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+        sys.exit(1 if regressions else 0)
+
+    report = run_suite(args)
+    text = json.dumps(report, indent=4)
+    print(text)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text)
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Check that the tree decides to move and jump as often as the old dice did.
+
+    python -m tools.hazard_check
+    python -m tools.hazard_check --samples 50000 --seed 7
+
+Simulates passes through the activity selector at the companion's real
+cadence: idle animations picked from the tree's `IDLES`, walks across
+the screen after a move, jumps. On every pass the tree's own
+`IsTimeToMove` and `IsTimeToJump` are run against a stand-in companion
+and a simulated clock, with the cursor placed where it earns their
+bonus in the cursor scenarios. The reference is the per-pass dice the
+behaviours used before `GrowingChance`, with its original constants.
+Seconds between events are compared with a two-sample Kolmogorov-Smirnov
+test, any scenario that differs fails the run with exit code 1, so it
+runs as a test. The seed is fixed by default, results are reproducible.
+
+Imports the behavior tree, so py_trees is required. Qt and a display
+are not.
+"""
+# Basic
+import sys
+import math
+import random
+import argparse
+import statistics
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+# Behavior
+from py_trees.common import Status
+
+# Custom modules
+from modules.core.hazard import GrowingChance
+
+
+
+TREE_PATH = Path(__file__).resolve().parents[1] / "companions" / "Sebastian" / "behavior_tree.py"
+
+# Seconds per animation cycle, frames x frame_duration of the sprite sheet
+CYCLE_S = {
+    "idle": 5 * 0.200,
+    "idle_look_back": 14 * 0.200,
+}
+# jump_start, then about a second of flight
+JUMP_S = 3 * 0.120 + 1.0
+# Walk speed, px per tick (default of `CompanionState.move_speed`)
+MOVE_SPEED = 6
+
+# Dice as the behaviours rolled them: (initial, growth, cursor bonus)
+MOVE_DICE = (0.01, 0.001, 0.35)
+JUMP_DICE = (0.01, 0.001 / 2, 0.65)
+
+# A check that hasn't fired for that long has stopped, the dice
+# reach certainty within minutes
+MAX_GAP_S = 3600
+
+# (name, check getting the cursor bonus, pass since its last event the cursor shows up on)
+SCENARIOS = (
+    ("no cursor", None, None),
+    ("cursor in sight", "move", 3),
+    ("cursor nearby", "jump", 2),
+)
+
+# Stand-in companion, feet on the ground in the middle of the screen
+GROUND = 1000
+FEET_X = 960
+SIZE = (100, 100)
+ANCHOR = (50, 99)
+CURSOR_AWAY = (FEET_X, 0)
+# Ground level and out of reach: in sight for a move
+CURSOR_IN_SIGHT = (FEET_X + 600, GROUND - 1)
+# Ground level and within reach: nearby for a jump
+CURSOR_NEARBY = (FEET_X + 50, GROUND - 1)
+
+
+
+def load_tree():
+    spec = importlib.util.spec_from_file_location("Sebastian_behavior_tree", TREE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class DiceCheck:
+    """Time-to check as it was before `GrowingChance`"""
+    def __init__(self, dice: tuple, rng: random.Random, bonus_pass: int = None):
+        self.initial, self.growth, self.bonus = dice
+        self.probability = self.initial
+        self.bonus_pass = bonus_pass
+        self._rng = rng
+        self.timer = 0.0
+        self.passes = 0
+        self.intervals = []
+
+    def roll(self, t: float) -> bool:
+        self.passes += 1
+        self.probability = min(1, self.probability + (t - self.timer) * self.growth)
+        if self.passes == self.bonus_pass:
+            self.probability = min(1, self.probability + self.bonus)
+
+        if self._rng.random() <= self.probability:
+            self.intervals.append(t - self.timer)
+            self.probability = self.initial
+            self.timer = t
+            self.passes = 0
+            return True
+        return False
+
+
+class TreeCheck:
+    """Time-to behaviour of the tree, run as the selector runs it"""
+    def __init__(self, behaviour, world: SimpleNamespace, rng: random.Random,
+                 bonus_pass: int = None, cursor: tuple[int, int] = None):
+        self.behaviour = behaviour
+        # Seeded, same chances as the tree set up
+        chance = behaviour.chance
+        behaviour.chance = GrowingChance(chance.initial, chance.growth, rng)
+        self.world = world
+        self.bonus_pass = bonus_pass
+        self.cursor = cursor
+        self.timer = world.now
+        self.passes = 0
+        self.intervals = []
+
+    def roll(self, t: float) -> bool:
+        self.passes += 1
+        self.world.now = t
+        self.world.cursor = self.cursor if self.passes == self.bonus_pass else CURSOR_AWAY
+
+        self.behaviour.initialise()
+        if self.behaviour.update() == Status.SUCCESS:
+            self.intervals.append(t - self.timer)
+            self.timer = t
+            self.passes = 0
+            return True
+        return False
+
+
+def tree_checks(tree, rng: random.Random, bonus_check: str, bonus_pass: int):
+    """Tree's time-to behaviours wired to a stand-in companion and a simulated clock"""
+    world = SimpleNamespace(now=0.0, cursor=CURSOR_AWAY)
+    companion = SimpleNamespace(
+        get_feet_pos=lambda: (FEET_X, GROUND - 1),
+        get_walking_area_x=lambda: (0, 2 * FEET_X),
+        get_cursor_pos=lambda: world.cursor,
+        get_ground_level=lambda: GROUND,
+        get_size=lambda: SIZE,
+        get_anchor=lambda: ANCHOR,
+        get_centers=lambda: (FEET_X, GROUND - SIZE[1] // 2),
+    )
+    board = SimpleNamespace(companion=companion)
+    tree.monotonic = lambda: world.now
+
+    checks = []
+    for name, behaviour, cursor in (("move", tree.IsTimeToMove(), CURSOR_IN_SIGHT),
+                                    ("jump", tree.IsTimeToJump(), CURSOR_NEARBY)):
+        behaviour.board = board
+        checks.append(TreeCheck(behaviour, world, rng,
+                                bonus_pass if name == bonus_check else None, cursor))
+    return checks
+
+
+def simulate(tree, rng: random.Random, move, jump, samples: int,
+             screen_width: float, walk_speed: float) -> bool:
+    """
+    Run passes until both checks have `samples` intervals between events.
+    False if one of them stopped firing (e.g. moves on every pass, so
+    jumps are never rolled).
+    """
+    weights = [weight for _, weight, _ in tree.IDLES]
+    t = 0.0
+    x = rng.uniform(0, screen_width)
+
+    while len(move.intervals) < samples or len(jump.intervals) < samples:
+        if t - min(move.timer, jump.timer) > MAX_GAP_S:
+            return False
+        # Sleeping is left out, it only delays both checks alike
+        if move.roll(t):
+            target = rng.uniform(0, screen_width)
+            t += abs(target - x) / walk_speed
+            x = target
+        elif jump.roll(t):
+            t += JUMP_S
+        else:
+            idle, _, cycles = rng.choices(tree.IDLES, weights=weights)[0]
+            t += rng.randint(*cycles) * CYCLE_S[idle]
+
+    del move.intervals[samples:]
+    del jump.intervals[samples:]
+    return True
+
+
+def ks_statistic(a: list[float], b: list[float]) -> float:
+    """Largest distance between the empirical CDFs"""
+    a, b = sorted(a), sorted(b)
+    i = j = 0
+    distance = 0.0
+    while i < len(a) and j < len(b):
+        value = min(a[i], b[j])
+        while i < len(a) and a[i] == value:
+            i += 1
+        while j < len(b) and b[j] == value:
+            j += 1
+        distance = max(distance, abs(i / len(a) - j / len(b)))
+    return distance
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=20_000)
+    parser.add_argument("--screen-width", type=float, default=1920,
+                        help="Width companions walk across, px (default 1920)")
+    parser.add_argument("--alpha", type=float, default=0.001)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tree = load_tree()
+    walk_speed = MOVE_SPEED * tree.TICKS_PER_S
+
+    rng = random.Random(args.seed)
+    n = args.samples
+    # Two-sample KS critical value for equal sample sizes
+    critical = math.sqrt(-math.log(args.alpha / 2) / 2) * math.sqrt(2 / n)
+
+    failed = False
+    print(f"{'scenario':<24} {'dice mean s':>12} {'tree mean s':>12} {'KS':>8} {'critical':>9}")
+    for name, bonus_check, bonus_pass in SCENARIOS:
+        dice_move = DiceCheck(MOVE_DICE, rng, bonus_pass if bonus_check == "move" else None)
+        dice_jump = DiceCheck(JUMP_DICE, rng, bonus_pass if bonus_check == "jump" else None)
+        simulate(tree, rng, dice_move, dice_jump, n, args.screen_width, walk_speed)
+
+        tree_move, tree_jump = tree_checks(tree, rng, bonus_check, bonus_pass)
+        if not simulate(tree, rng, tree_move, tree_jump, n, args.screen_width, walk_speed):
+            print(f"{name:<24} tree stopped moving or jumping  DIFFERENT")
+            failed = True
+            continue
+
+        for event, dice, sampled in (("move", dice_move, tree_move), ("jump", dice_jump, tree_jump)):
+            distance = ks_statistic(dice.intervals, sampled.intervals)
+            flag = ""
+            if distance > critical:
+                flag = "  DIFFERENT"
+                failed = True
+            print(f"{event + ', ' + name:<24} {statistics.fmean(dice.intervals):>12.1f} "
+                  f"{statistics.fmean(sampled.intervals):>12.1f} {distance:>8.4f} {critical:>9.4f}{flag}")
+
+    sys.exit(1 if failed else 0)
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Build and inspect `.qpal` companion packages.
+
+    python -m tools.qpal build companions/Sebastian
+    python -m tools.qpal info companions/Sebastian.qpal
+"""
+# Basic
+import sys
+import argparse
+from pathlib import Path
+
+# Custom modules
+from modules.assets.companion_package import CompanionPackage, build_package
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Pack a companion directory")
+    build.add_argument("companion_dir", type=Path)
+    build.add_argument("-o", "--output", type=Path, help="Defaults to <companion_dir>.qpal")
+
+    info = commands.add_parser("info", help="Show package manifest and members")
+    info.add_argument("package", type=Path)
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        if not (args.companion_dir / "behavior_tree.py").exists():
+            sys.exit(f"{args.companion_dir} is not a companion directory")
+        output = build_package(args.companion_dir, args.output)
+        print(f"Built {output} ({output.stat().st_size / 1024:.0f} KiB)")
+
+    elif args.command == "info":
+        package = CompanionPackage(args.package)
+        manifest = package.manifest
+        print(f"{manifest['name']} (format {manifest['format']}, frame {manifest['frame_size']})")
+        for name, animation in manifest["animations"].items():
+            print(f"  {name:<16} row {animation['row']:>2}  {animation['n_frames']:>2} frames"
+                  f"  {animation['frame_duration']} ms")
+
+        print("Members:")
+        for name, size in package.members().items():
+            print(f"  {name:<20} {size / 1024:>8.0f} KiB")
+
+        # Package is only useful if the application can load it
+        for name in manifest["images"]:
+            if package.image(name).isNull():
+                sys.exit(f"Image {name} can't be loaded")
+        package.load_module(f"{manifest['name']}_behavior_tree")
+        print("Images and behavior tree load")
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compile companion sprite sheets into lookup-only metadata.
+
+    python -m tools.sprite_compiler companions/Sebastian
+    python -m tools.sprite_compiler companions/* --check
+
+Writes `assets/sprites_compiled.json` with per-animation frame counts
+and per-frame trimmed rects, feet anchors, content hashes and
+run-length alpha masks, so the runtime never scans the sheet.
+"""
+# Basic
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# Application
+from PyQt6.QtGui import QGuiApplication
+
+# Custom modules
+from modules.assets.sprite_sheet import COMPILED_METADATA, compile_sheet, load_compiled
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("companion_dirs", type=Path, nargs="+")
+    parser.add_argument("--check", action="store_true",
+                        help="Only verify that compiled metadata is up to date")
+    args = parser.parse_args()
+
+    # QImage conversions need an application instance
+    app = QGuiApplication(sys.argv[:1])
+
+    failed = False
+    for companion_dir in args.companion_dirs:
+        assets_dir = companion_dir / "assets"
+        if not (assets_dir / "sprites_metadata.json").exists():
+            continue
+
+        if args.check:
+            if load_compiled(assets_dir) is None:
+                print(f"{companion_dir.name}: missing or outdated")
+                failed = True
+            else:
+                print(f"{companion_dir.name}: up to date")
+            continue
+
+        try:
+            compiled, warnings = compile_sheet(assets_dir)
+        except ValueError as e:
+            print(f"{companion_dir.name}: {e}")
+            failed = True
+            continue
+
+        for warning in warnings:
+            print(f"{companion_dir.name}: warning: {warning}")
+
+        (assets_dir / COMPILED_METADATA).write_text(json.dumps(compiled, separators=(",", ":")))
+
+        n_frames = sum(animation["n_frames"] for animation in compiled["animations"].values())
+        n_unique = len({
+            frame["hash"]
+            for animation in compiled["animations"].values()
+            for frame in animation["frames"]
+        })
+        print(f"{companion_dir.name}: {len(compiled['animations'])} animations, "
+              f"{n_frames} frames ({n_unique} unique)")
+
+    sys.exit(1 if failed else 0)
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Convert legacy GIF and numbered PNG frames into a companion sprite sheet.
+
+    python -m tools.sprite_converter extras/assets_old/gifs -o companions/Fox/assets
+    python -m tools.sprite_converter extras/assets_old/animation_list --columns 14 -o out/
+
+Every GIF becomes one animation named after the file. Numbered PNGs
+(`name_1.png`, `name_2.png`, ...) form a sequence that is cut into
+animations at fully transparent frames, and additionally every
+`--columns` frames when the sequence is a flattened sheet.
+
+Files are decoded in a process pool, identical files are decoded once,
+identical animations share one sheet row. Output is the layout read by
+`SpriteLabel`: sprites_sheet.png, sprites_metadata.json, sprite_static.png.
+"""
+# Basic
+import re
+import sys
+import json
+import time
+import hashlib
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+
+
+SEQUENCE_PATTERN = re.compile(r"^(?P<prefix>.*?)(?P<number>\d+)$")
+
+# Used when frames don't carry their own delay
+DEFAULT_DURATION = 100
+
+
+# Decoded frame: width, height, RGBA8888 pixels, delay in ms
+Frame = tuple[int, int, bytes, int]
+
+
+
+def decode_file(path: str) -> list[Frame]:
+    """Decode all frames of an image file (runs in a worker process)"""
+    from PyQt6.QtGui import QImage, QImageReader
+
+    reader = QImageReader(path)
+    frames = []
+    while reader.canRead():
+        image = reader.read()
+        if image.isNull():
+            break
+        delay = reader.nextImageDelay()
+
+        image = image.convertToFormat(QImage.Format.Format_RGBA8888)
+        ptr = image.constBits()
+        ptr.setsize(image.sizeInBytes())
+        frames.append((image.width(), image.height(), bytes(ptr), delay))
+
+        # Single image formats keep reporting canRead()
+        if reader.imageCount() <= 1:
+            break
+
+    if not frames:
+        raise ValueError(f"{path}: {reader.errorString()}")
+    return frames
+
+
+
+def _is_blank(frame: Frame) -> bool:
+    return not any(frame[2][3::4])
+
+
+def _frame_key(frame: Frame) -> str:
+    return hashlib.sha1(b"%dx%d" % frame[:2] + frame[2]).hexdigest()
+
+
+def collect_sources(inputs: list[Path]) -> tuple[list[Path], dict[str, list[Path]]]:
+    """
+    Split input files into GIFs and numbered PNG sequences.
+
+    Returns:
+        tuple: GIF paths and sequences as prefix -> paths ordered by number.
+    """
+    files = []
+    for path in inputs:
+        files += sorted(path.iterdir()) if path.is_dir() else [path]
+
+    gifs = [f for f in files if f.suffix.lower() == ".gif"]
+
+    numbered = {}
+    for f in files:
+        if f.suffix.lower() != ".png":
+            continue
+        match = SEQUENCE_PATTERN.match(f.stem)
+        if match:
+            prefix = match["prefix"].rstrip("_- ") or "sequence"
+            numbered.setdefault(prefix, []).append((int(match["number"]), f))
+
+    sequences = {
+        prefix: [f for _, f in sorted(entries)]
+        for prefix, entries in numbered.items()
+    }
+    return gifs, sequences
+
+
+def split_sequence(frames: list[Frame], columns: int = None) -> list[list[Frame]]:
+    """Cut sequence into animations at blank frames and row boundaries"""
+    chunks = [frames[i:i + columns] for i in range(0, len(frames), columns)] if columns else [frames]
+
+    animations = []
+    for chunk in chunks:
+        current = []
+        for frame in chunk:
+            if _is_blank(frame):
+                if current:
+                    animations.append(current)
+                current = []
+            else:
+                current.append(frame)
+        if current:
+            animations.append(current)
+    return animations
+
+
+def pack_sheet(animations: dict[str, list[Frame]]) -> tuple[tuple, dict, list[list[Frame]]]:
+    """
+    Lay animations out one per row.
+
+    Returns:
+        tuple: frame size, metadata and frames of every row.
+    """
+    frame_w = max(frame[0] for frames in animations.values() for frame in frames)
+    frame_h = max(frame[1] for frames in animations.values() for frame in frames)
+
+    metadata = {}
+    rows = []
+    row_of = {}
+    for name, frames in animations.items():
+        delays = sorted(frame[3] for frame in frames if frame[3] > 0)
+        duration = delays[len(delays) // 2] if delays else DEFAULT_DURATION
+
+        # Identical animations share one row
+        key = tuple(_frame_key(frame) for frame in frames)
+        if key not in row_of:
+            rows.append(frames)
+            row_of[key] = len(rows)
+
+        metadata[name] = {
+            "row": row_of[key],
+            "frame_duration": duration,
+            "n_frames": len(frames),
+        }
+
+    return (frame_w, frame_h), metadata, rows
+
+
+def render_sheet(frame_size: tuple[int, int], rows: list[list[Frame]]) -> bytearray:
+    """
+    RGBA8888 pixels of the sheet. Frames smaller than the cell
+    are centered horizontally and stand on the bottom edge.
+    """
+    frame_w, frame_h = frame_size
+    columns = max(len(frames) for frames in rows)
+    stride = columns * frame_w * 4
+
+    pixels = bytearray(stride * len(rows) * frame_h)
+    for row, frames in enumerate(rows):
+        for column, (w, h, data, _) in enumerate(frames):
+            left = column * frame_w + (frame_w - w) // 2
+            top = row * frame_h + frame_h - h
+            for y in range(h):
+                offset = (top + y) * stride + left * 4
+                pixels[offset:offset + w * 4] = data[y * w * 4:(y + 1) * w * 4]
+    return pixels
+
+
+def convert(inputs: list[Path], output: Path, columns: int = None,
+            duration: int = DEFAULT_DURATION, workers: int = None) -> dict:
+    """
+    Convert inputs into sprite sheet layout in `output`.
+
+    Returns:
+        dict: Conversion statistics.
+    """
+    from PyQt6.QtGui import QImage
+
+    started = time.perf_counter()
+    gifs, sequences = collect_sources(inputs)
+    files = gifs + [f for paths in sequences.values() for f in paths]
+    if not files:
+        raise ValueError("No GIF or numbered PNG files found")
+
+    # Identical files are decoded once
+    file_keys = {f: hashlib.sha1(f.read_bytes()).hexdigest() for f in files}
+    unique = {}
+    for f in files:
+        unique.setdefault(file_keys[f], f)
+    input_bytes = sum(f.stat().st_size for f in unique.values())
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        decoded = dict(zip(unique, pool.map(decode_file, map(str, unique.values()))))
+    decoded_at = time.perf_counter()
+
+    animations = {}
+    for f in gifs:
+        animations[f.stem] = decoded[file_keys[f]]
+
+    for prefix, paths in sequences.items():
+        frames = [
+            (w, h, data, delay or duration)
+            for f in paths
+            for w, h, data, delay in decoded[file_keys[f]]
+        ]
+        for i, frames in enumerate(split_sequence(frames, columns), 1):
+            animations[f"{prefix}_{i}"] = frames
+
+    if not animations:
+        raise ValueError("All frames are transparent")
+
+    frame_size, metadata, rows = pack_sheet(animations)
+    pixels = render_sheet(frame_size, rows)
+    n_columns = max(len(frames) for frames in rows)
+
+    output.mkdir(parents=True, exist_ok=True)
+    sheet = QImage(pixels, n_columns * frame_size[0], len(rows) * frame_size[1],
+                   QImage.Format.Format_RGBA8888)
+    sheet.save(str(output / "sprites_sheet.png"))
+
+    # Static sprite defines the frame size, first frame of `idle` when present
+    static_name = "idle" if "idle" in animations else next(iter(animations))
+    static = sheet.copy(0, (metadata[static_name]["row"] - 1) * frame_size[1], *frame_size)
+    static.save(str(output / "sprite_static.png"))
+
+    (output / "sprites_metadata.json").write_text(json.dumps(metadata, indent=4))
+
+    n_frames = sum(len(frames) for frames in animations.values())
+    elapsed = time.perf_counter() - started
+    return {
+        "files": len(files),
+        "decoded_files": len(unique),
+        "animations": len(animations),
+        "rows": len(rows),
+        "frames": n_frames,
+        "unique_frames": len({_frame_key(f) for frames in rows for f in frames}),
+        "decode_seconds": decoded_at - started,
+        "total_seconds": elapsed,
+        "frames_per_second": n_frames / elapsed,
+        "megabytes_per_second": input_bytes / elapsed / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("inputs", type=Path, nargs="+", help="GIF/PNG files or directories")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="Assets directory to write")
+    parser.add_argument("--columns", type=int, help="Frames per row of a flattened PNG sequence")
+    parser.add_argument("--duration", type=int, default=DEFAULT_DURATION,
+                        help="Frame duration (ms) of PNG sequences")
+    parser.add_argument("--workers", type=int, help="Decoding processes, defaults to CPU count")
+    args = parser.parse_args()
+
+    try:
+        stats = convert(args.inputs, args.output, args.columns, args.duration, args.workers)
+    except ValueError as e:
+        sys.exit(str(e))
+
+    metadata = json.loads((args.output / "sprites_metadata.json").read_text())
+    for name, animation in metadata.items():
+        print(f"  {name:<20} row {animation['row']:>2}  {animation['n_frames']:>2} frames"
+              f"  {animation['frame_duration']} ms")
+
+    print(f"{stats['files']} files ({stats['decoded_files']} decoded), "
+          f"{stats['frames']} frames in {stats['animations']} animations "
+          f"-> {stats['rows']} rows, {stats['unique_frames']} unique frames")
+    print(f"{stats['total_seconds']:.2f} s (decoding {stats['decode_seconds']:.2f} s), "
+          f"{stats['frames_per_second']:.0f} frames/s, {stats['megabytes_per_second']:.2f} MiB/s")
+
+
+
+if __name__ == "__main__":
+    main()
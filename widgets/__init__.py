@@ -1,2 +1 @@
-from .tray_application import TrayApplication
 from .companion_window import CompanionWindow
\ No newline at end of file
@@ -1,18 +1,22 @@
 # Basic
 import random as r
 import math
-from dataclasses import dataclass
 
 # Application
 from PyQt6.QtWidgets import QWidget, QMenu
 from PyQt6.QtGui import QAction
+from PyQt6.QtGui import QGuiApplication
 from PyQt6.QtCore import Qt
 
 # Custom modules
-from modules.core import lang_, platman
-from modules.settings import companion_settings
+from modules.core import lang_, screen_index, metrics
+from modules.core.motion_samples import MotionSamples
+from modules.services.platform_watcher import rebuild_screen_index
+from modules.services.geometry_batch import GeometryBatch
+from modules.settings import app_settings, companion_settings
 from .dialogue_window import DialogWindow
 from .sprite_label import SpriteLabel
+from .overlay_window import OverlayRenderer
 
 
 
@@ -22,25 +26,21 @@ if TYPE_CHECKING:
 
 
 
-@dataclass
-class Screen:
-    width: int
-    height: int
-    work_area_height: int
-
-
-
 class CompanionWindow(QWidget):
+    # Throw follows the pointer motion of the last moments before release
+    THROW_WINDOW_S = 0.08
+    # Flick speed (px/sec) is turned into a drag vector covering this time
+    THROW_SCALE_S = 0.25
+
     def __init__(self, companion: "Companion"):
         super().__init__()
         
         self._companion = companion
 
-        # Holds state for platform attributes
-        self.user_screen = Screen(*platman.get_resolution())
-
-        self._start_pos = None
         self._drag_pos = None
+        # Timestamped pointer positions of the current drag,
+        # sized for 1000 Hz mice over the throw window
+        self._drag_samples = MotionSamples(128)
 
         self.setWindowFlags(
             Qt.WindowType.FramelessWindowHint |
@@ -83,30 +83,44 @@ class CompanionWindow(QWidget):
         
         self.setStartingPosition("random_offscreen")
 
-        self.show()
+        # With overlay backend the window itself stays hidden,
+        # it only holds geometry, pixmap and mask for the renderer
+        if app_settings.render_backend == "overlay":
+            OverlayRenderer.instance().attach(self)
+        else:
+            self.show()
 
     def setStartingPosition(self, spawn_type: str = "center") -> None:
-        x = 0
+        # Normally built by platform watcher on application start
+        if screen_index.is_empty():
+            rebuild_screen_index()
+        screens = screen_index.layout
+        left, right = screens.span_x()
+
+        x = left
         if spawn_type == "center":
-            x = self.user_screen.width / 2
+            primary = QGuiApplication.primaryScreen().availableGeometry()
+            x = primary.x() + primary.width() / 2
         elif spawn_type == "random_offscreen":
             x = r.choice([
-                0 - self.size().width() * 1.2,
-                self.user_screen.width + self.size().width() * 1.2
+                left - self.size().width() * 1.2,
+                right + self.size().width() * 1.2
             ])
         
-        y = self.user_screen.work_area_height - self.anchor[1] - 1
+        y = screens.ground_level(int(x) + self.anchor[0]) - self.anchor[1] - 1
         
         self.move(int(x), y)
 
     def _buildContextMenu(self):
         menu = QMenu(self)
 
-        # listenAction = QAction("Слухай!", self)
-        # listenAction.triggered.connect(
-        #     lambda: self.companion_state.interactions.append("Assist")
-        # )
-        # menu.addAction(listenAction)
+        # TRANSLATORS: This is a context menu item for the companion window
+        # When clicked, the companion stops and replies something
+        listenAction = QAction(lang_("companion_command_listen"), self)
+        listenAction.triggered.connect(
+            lambda: self._companion.add_interaction("Assist")
+        )
+        menu.addAction(listenAction)
 
         # TRANSLATORS: This is a context menu item for the companion window
         # When clicked, the companion repeat the last phrase spoken
@@ -165,17 +179,39 @@ class CompanionWindow(QWidget):
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             self._companion.add_interaction("Hold")
-            self._start_pos = event.globalPosition()
-            self._drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            self._drag_samples.clear()
+            self._addDragSample(event)
+            # Position may still be waiting for the next frame
+            self._drag_pos = event.globalPosition().toPoint() - GeometryBatch.instance().position(self)
             event.accept()
         elif event.button() == Qt.MouseButton.MiddleButton:
             self._companion.add_interaction("Disturb")
 
     def mouseMoveEvent(self, event):
         if self._drag_pos:
-            self.move(event.globalPosition().toPoint() - self._drag_pos)
+            self._addDragSample(event)
+            # Many mouse events per frame end up as one move
+            pos = event.globalPosition().toPoint() - self._drag_pos
+            GeometryBatch.instance().move(self, pos.x(), pos.y())
             event.accept()
 
+    def _addDragSample(self, event) -> None:
+        # Event timestamps keep the real spacing of
+        # high-rate mice, even when events arrive in bursts
+        pos = event.globalPosition()
+        self._drag_samples.add(event.timestamp() / 1000, pos.x(), pos.y())
+
+    def throwVelocity(self, release_s: float) -> tuple[float, float]:
+        """
+        Pointer velocity (px/sec) at the moment of release, from
+        a regression over the last `THROW_WINDOW_S` of the drag.
+        Pointer held still before release throws nothing.
+        """
+        latest = self._drag_samples.latest()
+        if latest is None or release_s - latest[0] > self.THROW_WINDOW_S:
+            return (0.0, 0.0)
+        return self._drag_samples.velocity(self.THROW_WINDOW_S)
+
     @staticmethod
     def apply_sqrt(dx, dy) -> tuple[float, float]:
         """
@@ -203,14 +239,15 @@ class CompanionWindow(QWidget):
         return (vx, vy)
 
     def mouseReleaseEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            vector = event.globalPosition() - self._start_pos
-            self._companion.set_velocities(*self.apply_sqrt(vector.x(), vector.y()))
+        if event.button() == Qt.MouseButton.LeftButton and self._drag_pos:
+            vx, vy = self.throwVelocity(event.timestamp() / 1000)
+            self._companion.throw(
+                *self.apply_sqrt(vx * self.THROW_SCALE_S, vy * self.THROW_SCALE_S))
 
         self._companion.remove_interaction("Hold")
 
-        self._start_pos = None
         self._drag_pos = None
+        self._drag_samples.clear()
         event.accept()
 
     # DoubleClick event also triger click and drag events.
@@ -221,13 +258,18 @@ class CompanionWindow(QWidget):
 
     def moveEvent(self, event):
         super().moveEvent(event)
+        self.placeDialog()
+
+    def placeDialog(self):
         # Bind dialog window to companion movement
         if self.dialog and self.dialog.isVisible():
-            parent_rect = self.geometry()
-            x = parent_rect.center().x() - self.dialog.width() // 2
-            y = parent_rect.top() - 60
-            self.dialog.move(x, y)
+            self.dialog.placeAbove(self.geometry())
 
     def closeWindow(self):
+        metrics.adjust_gauge("sprite_store_bytes", -self.label.store_bytes)
+        GeometryBatch.instance().discard(self)
+        GeometryBatch.instance().discard(self.dialog)
+        if app_settings.render_backend == "overlay":
+            OverlayRenderer.instance().detach(self)
         self.close()
         self.deleteLater()
\ No newline at end of file
@@ -1,10 +1,100 @@
+# Basic
+from collections import OrderedDict
+
 # Application
-from PyQt6.QtWidgets import QDialog, QLabel
-from PyQt6.QtGui import QPixmap
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QDialog, QLabel, QWidget
+from PyQt6.QtGui import QPixmap, QPainter, QRegion, QTransform
+from PyQt6.QtCore import Qt, QTimer, QPoint, QRect
 
 # Custom modules
 from modules.core import lang_
+from modules.services.geometry_batch import GeometryBatch
+
+
+
+BUBBLE_STYLE = """
+    QLabel {
+        background-color: white;
+        border-radius: 15px;
+        padding: 20px;
+        color: black;
+        font-size: 16px;
+        border: 1px solid #ccc;
+    }
+"""
+
+# Longer phrases are wrapped into several lines
+BUBBLE_MAX_WIDTH = 320
+
+
+
+class BubbleCache:
+    """
+    LRU of rendered speech bubbles, shared by all dialogs.
+
+    Bubble is laid out by an offscreen QLabel, rendered into a pixmap
+    and its mask is built once. Entries are keyed by text, style and
+    scale (device pixel ratio), so repeated phrases skip layout,
+    rendering and mask building completely.
+    """
+    def __init__(self, capacity: int = 64):
+        self._capacity = capacity
+        self._items: OrderedDict[tuple, tuple[QPixmap, QRegion]] = OrderedDict()
+        self._label: QLabel = None
+
+    def get(self, text: str, style: str, scale: float, cache: bool = True) -> tuple[QPixmap, QRegion]:
+        """
+        Rendered bubble and its mask. With `cache` off a missing bubble
+        is rendered without being stored, e.g. for partial streamed text.
+        """
+        key = (text, style, scale)
+        bubble = self._items.get(key)
+        if bubble:
+            self._items.move_to_end(key)
+            return bubble
+
+        bubble = self._render(text, style, scale)
+        if not cache:
+            return bubble
+        self._items[key] = bubble
+        if len(self._items) > self._capacity:
+            self._items.popitem(last=False)
+        return bubble
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def _render(self, text: str, style: str, scale: float) -> tuple[QPixmap, QRegion]:
+        if self._label is None:
+            self._label = QLabel()
+            self._label.setWordWrap(True)
+            self._label.setMaximumWidth(BUBBLE_MAX_WIDTH)
+
+        label = self._label
+        label.setStyleSheet(style)
+        label.setText(text)
+        label.adjustSize()
+
+        size = label.size()
+        pixmap = QPixmap(int(size.width() * scale), int(size.height() * scale))
+        pixmap.setDevicePixelRatio(scale)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        # Only the label itself, without window background
+        painter = QPainter(pixmap)
+        label.render(painter, QPoint(), QRegion(), QWidget.RenderFlag.DrawChildren)
+        painter.end()
+
+        mask = QRegion(pixmap.createMaskFromColor(Qt.GlobalColor.transparent))
+        if scale != 1:
+            mask = QTransform.fromScale(1 / scale, 1 / scale).map(mask)
+
+        return pixmap, mask
+
+
+
+bubble_cache = BubbleCache()
+
 
 
 class DialogWindow(QDialog):
@@ -21,34 +111,51 @@ class DialogWindow(QDialog):
         self.setStyleSheet("background: transparent;")
 
         # TRANSLATORS: Hello phrase of companion Sebastian
-        self.label = QLabel(parent=self, text=lang_("companion_say_hello"))
-        self.label.setStyleSheet("""
-            QLabel {
-                background-color: white;
-                border-radius: 15px;
-                padding: 20px;
-                color: black;
-                font-size: 16px;
-                border: 1px solid #ccc;
-            }
-        """)
-        self.label.adjustSize()
-
-        # === Create a mask dynimically from a rendered QLabel ===
-        pixmap = QPixmap(self.label.size())
-        pixmap.fill(Qt.GlobalColor.transparent)
-        self.render(pixmap)
-        self.setMask(pixmap.createMaskFromColor(Qt.GlobalColor.transparent))
+        self._text = lang_("companion_say_hello")
+        self._bubble = QPixmap()
 
         self.messageTimer = QTimer(self)
         self.messageTimer.setSingleShot(True)
         self.messageTimer.timeout.connect(self.hide)
 
-    def showDialog(self):
-        parent_rect = self.parentWidget().geometry()
-        x = parent_rect.center().x() - self.width() // 2
-        y = parent_rect.top() - 60
-        self.move(x, y)
+    def text(self) -> str:
+        return self._text
+
+    def setText(self, text: str) -> None:
+        self._text = text
+        if self.isVisible():
+            self._updateBubble()
+
+    def _updateBubble(self, cache: bool = True) -> None:
+        pixmap, mask = bubble_cache.get(self._text, BUBBLE_STYLE, self.devicePixelRatioF(), cache)
+        if pixmap.cacheKey() == self._bubble.cacheKey():
+            return
+
+        self._bubble = pixmap
+        self.setFixedSize(pixmap.deviceIndependentSize().toSize())
+        self.setMask(mask)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bubble)
+        painter.end()
+
+    def _positionAbove(self, rect: QRect) -> QPoint:
+        return QPoint(rect.center().x() - self.width() // 2, rect.top() - 60)
+
+    def placeAbove(self, rect: QRect) -> None:
+        """Follow companion `rect`, applied once per frame however often called"""
+        pos = self._positionAbove(rect)
+        GeometryBatch.instance().move(self, pos.x(), pos.y())
+
+    def showDialog(self, text: str = None, cache: bool = True):
+        if text is not None:
+            self._text = text
+        self._updateBubble(cache)
+
+        GeometryBatch.instance().discard(self)
+        self.move(self._positionAbove(self.parentWidget().geometry()))
         self.show()
-        offset = max(2000, len(self.label.text()) * 125)
+        offset = max(2000, len(self._text) * 125)
         self.messageTimer.start(offset)
\ No newline at end of file
@@ -0,0 +1,88 @@
+# Application
+from PyQt6.QtWidgets import QWidget, QLabel, QCheckBox, QVBoxLayout
+from PyQt6.QtGui import QFontDatabase
+
+# Custom modules
+from modules.core import PathManager, lang_
+from modules.services.metrics_sampler import MetricsSampler
+
+
+
+class MetricsPanel(QWidget):
+    """
+    Live view of the runtime metrics.
+
+    Samples are requested only while the panel is visible,
+    export to JSON lines keeps going after it's hidden.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._sampler = MetricsSampler.instance()
+
+        self.text = QLabel(parent=self)
+        self.text.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.text.setText("…")
+
+        # TRANSLATORS: Checkbox in settings to write performance metrics to a file
+        self.exportBox = QCheckBox(lang_("metrics_export"), parent=self)
+        self.exportBox.setChecked(self._sampler.is_exporting())
+        self.exportBox.toggled.connect(self._onExportToggled)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.text)
+        layout.addWidget(self.exportBox)
+        layout.addStretch()
+
+        self._sampler.signalSampled.connect(self._onSampled)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._sampler.acquire()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._sampler.release()
+
+    def _onExportToggled(self, checked: bool):
+        if checked:
+            path = PathManager.get_metrics_export_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._sampler.start_export(path)
+        else:
+            self._sampler.stop_export()
+
+    def _onSampled(self, sample: dict):
+        if self.isVisible():
+            self.text.setText(self.format(sample))
+
+    @staticmethod
+    def format(sample: dict) -> str:
+        rates = sample["rates"]
+        histograms = sample["histograms"]
+        gauges = sample["gauges"]
+
+        def rate(name):
+            return rates.get(name, 0.0)
+
+        def hist(name):
+            h = histograms.get(name)
+            if not h or not h["count"]:
+                return "-"
+            return f"p50 {h['p50']:.1f}  p95 {h['p95']:.1f}  max {h['max']:.1f} ms"
+
+        def mib(value):
+            return "n/a" if value is None else f"{value / 2**20:.1f} MiB"
+
+        lines = [
+            f"{'Frames':<14} {rate('frames'):>6.1f} /s   late {hist('timer_lateness_ms')}",
+            f"{'Tree ticks':<14} {rate('ticks'):>6.1f} /s   {hist('tick_ms')}",
+            f"{'Animation':<14} {rate('animation_frames'):>6.1f} /s   "
+            f"drawn {rate('sprite_frames_drawn'):.1f} /s  culled {rate('sprite_frames_culled'):.1f} /s",
+            f"{'Mask updates':<14} {rate('mask_updates'):>6.1f} /s",
+            f"{'Window moves':<14} {rate('window_moves'):>6.1f} /s   "
+            f"requested {rate('window_moves_requested'):.1f} /s",
+            f"{'Memory':<14} RSS {mib(gauges.get('rss_bytes'))}   "
+            f"sprites {mib(gauges.get('sprite_store_bytes', 0))}",
+        ]
+        return "\n".join(lines)
@@ -0,0 +1,244 @@
+# Application
+from PyQt6.QtWidgets import QWidget, QApplication
+from PyQt6.QtGui import QPainter, QRegion, QColor
+from PyQt6.QtCore import Qt, QObject, QTimer, QRect
+
+# Custom modules
+from modules.core import startup
+from modules.services.cursor_service import CursorService
+
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .companion_window import CompanionWindow
+
+
+
+class OverlayWindow(QWidget):
+    """
+    Full-screen transparent surface covering a single screen.
+
+    Companions attached to the overlay renderer are never shown as
+    windows of their own. Their geometry, current pixmap and alpha
+    mask are read from the (hidden) `CompanionWindow` and painted here.
+    The window mask is the union of the companion alpha masks, so the
+    rest of the screen stays click-through.
+    """
+    def __init__(self, renderer: "OverlayRenderer", screen):
+        super().__init__()
+
+        self._renderer = renderer
+        # Companion that received the mouse press,
+        # it keeps receiving events until release
+        self._grabber: "CompanionWindow" = None
+        # Input mask currently set, in local coordinates
+        self._mask = QRegion()
+
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint |
+            Qt.WindowType.WindowStaysOnTopHint |
+            Qt.WindowType.BypassWindowManagerHint |
+            Qt.WindowType.Tool
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        self.setCursor(Qt.CursorShape.OpenHandCursor)
+
+        self.setGeometry(screen.geometry())
+
+        # Mouse events reach companions through here
+        CursorService.instance().watch(self)
+
+    def invalidate(self, region: QRegion) -> None:
+        """Schedule repaint of the part of global `region` on this screen"""
+        local = region.translated(-self.pos()).intersected(self.rect())
+        if not local.isEmpty():
+            self.update(local)
+
+    def updateInputMask(self, dirty: QRegion = None) -> None:
+        """
+        Restrict input and drawing to the visible companion pixels.
+
+        Only the part of the mask within global `dirty` (whole screen
+        if omitted) is rebuilt, and the window mask is set only if that
+        changed it. A full-screen mask is costly to apply every frame.
+        """
+        area = QRegion(self.rect())
+        if dirty is not None:
+            area = dirty.translated(-self.pos()).intersected(area)
+            if area.isEmpty():
+                return
+
+        region = self._mask.subtracted(area)
+        for window in self._renderer.sprites():
+            top_left = window.pos() - self.pos()
+            if not area.intersects(QRect(top_left, window.size())):
+                continue
+            mask = window.mask()
+            if mask.isEmpty():
+                mask = QRegion(window.rect())
+            region += mask.translated(top_left).intersected(area)
+
+        if region == self._mask:
+            return
+        self._mask = region
+
+        # Empty mask means "no mask" for Qt, so
+        # hide overlay instead of catching every click
+        if region.isEmpty():
+            self.hide()
+            return
+
+        self.setMask(region)
+        if not self.isVisible():
+            self.show()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setClipRegion(event.region())
+
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(event.rect(), QColor(0, 0, 0, 0))
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+
+        drawn = False
+        for window in self._renderer.sprites():
+            top_left = window.pos() - self.pos()
+            if not event.region().intersects(QRect(top_left, window.size())):
+                continue
+            painter.drawPixmap(top_left, window.label.pixmap())
+            drawn = True
+
+        painter.end()
+        # Companion windows are hidden here, startup ends with this frame
+        if drawn:
+            startup.mark_first_frame()
+
+    # === Input routing ===
+    def mousePressEvent(self, event):
+        self._grabber = self._renderer.spriteAt(event.globalPosition().toPoint())
+        if self._grabber:
+            self._grabber.mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self._grabber:
+            self._grabber.mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        if self._grabber:
+            self._grabber.mouseReleaseEvent(event)
+        self._grabber = None
+
+    def contextMenuEvent(self, event):
+        target = self._renderer.spriteAt(event.globalPos())
+        if target:
+            target.contextMenuEvent(event)
+
+
+
+class OverlayRenderer(QObject):
+    """
+    Render backend drawing every companion into one overlay per screen.
+
+    Once per frame the renderer compares each companion's geometry and
+    pixmap with what was painted last time. Only changed companions
+    produce dirty rects (old and new position) and a new input mask.
+    """
+    _instance: "OverlayRenderer" = None
+
+    @classmethod
+    def instance(cls) -> "OverlayRenderer":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, interval_ms: int = 16):
+        super().__init__()
+
+        self._sprites: list["CompanionWindow"] = []
+        # Window -> (position and pixmap key, painted global rect)
+        self._painted: dict["CompanionWindow", tuple[tuple, QRect]] = {}
+
+        self._overlays: list[OverlayWindow] = []
+        self._buildOverlays()
+
+        app = QApplication.instance()
+        app.screenAdded.connect(self._buildOverlays)
+        app.screenRemoved.connect(self._buildOverlays)
+
+        self._timer = QTimer()
+        self._timer.timeout.connect(self._renderFrame)
+        self._interval_ms = interval_ms
+
+    def _buildOverlays(self, *_) -> None:
+        for overlay in self._overlays:
+            overlay.close()
+            overlay.deleteLater()
+
+        self._overlays = [OverlayWindow(self, screen) for screen in QApplication.screens()]
+        self._painted.clear()
+
+    def sprites(self) -> list["CompanionWindow"]:
+        return self._sprites
+
+    def attach(self, window: "CompanionWindow") -> None:
+        if window in self._sprites:
+            return
+        self._sprites.append(window)
+        if not self._timer.isActive():
+            self._timer.start(self._interval_ms)
+
+    def detach(self, window: "CompanionWindow") -> None:
+        if window not in self._sprites:
+            return
+        self._sprites.remove(window)
+
+        painted = self._painted.pop(window, None)
+        if painted:
+            self._invalidate(QRegion(painted[1]))
+            for overlay in self._overlays:
+                overlay.updateInputMask(QRegion(painted[1]))
+
+        if not self._sprites:
+            self._timer.stop()
+
+    def spriteAt(self, global_pos) -> "CompanionWindow":
+        """Topmost companion whose alpha mask contains `global_pos`"""
+        for window in reversed(self._sprites):
+            local = global_pos - window.pos()
+            if not window.rect().contains(local):
+                continue
+            mask = window.mask()
+            if mask.isEmpty() or mask.contains(local):
+                return window
+        return None
+
+    def _invalidate(self, region: QRegion) -> None:
+        for overlay in self._overlays:
+            overlay.invalidate(region)
+
+    def _renderFrame(self) -> None:
+        mask_dirty = QRegion()
+
+        for window in self._sprites:
+            rect = window.geometry()
+            key = (rect.x(), rect.y(), window.label.pixmap().cacheKey())
+
+            painted = self._painted.get(window)
+            if painted and painted[0] == key:
+                continue
+
+            dirty = QRegion(rect)
+            if painted:
+                dirty += QRegion(painted[1])
+            self._painted[window] = (key, rect)
+            self._invalidate(dirty)
+
+            # Hidden windows get no move events, so
+            # attached dialog is placed from here
+            window.placeDialog()
+            mask_dirty += dirty
+
+        if not mask_dirty.isEmpty():
+            for overlay in self._overlays:
+                overlay.updateInputMask(mask_dirty)
@@ -1,22 +1,43 @@
-# Basic
-import json
-
 # Application
-from PyQt6.QtWidgets import QLabel
-from PyQt6.QtGui import QImage, QPixmap, QBitmap, QTransform
-from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtGui import QImage, QPixmap, QTransform, QPainter
+from PyQt6.QtCore import Qt, QTimer, QRect
 
 # Custom modules
-from modules.core import PathManager
+from modules.core import PathManager, startup, metrics
 from modules.settings import companion_settings
+from modules.assets.sprite_sheet import iter_frames, load_sheet, frame_mask, mask_region
+from modules.assets.companion_package import open_package
+
+
+
+# Format the raster engine blends without conversion
+FRAME_FORMAT = QImage.Format.Format_ARGB32_Premultiplied
 
 
 
-class SpriteLabel(QLabel):
+class SpriteLabel(QWidget):
+    """
+    Sprite surface of a companion.
+
+    Current frame is painted directly in `paintEvent`, without QLabel
+    layout and size hint logic. Every frame knows the bounding rect
+    of its visible pixels, so a frame change repaints only the union
+    of the old and new bounds instead of the whole widget.
+    """
     def __init__(self, parent, companion_name: str):
         super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+
+        self._pixmap = QPixmap()
+        self._bounds = QRect()
+
+        # Nobody can see the sprite, frames advance without drawing
+        self._culled = False
+        self._current: tuple[str, int] = None
 
-        self.animations = self._loadSprites(companion_name)
+        with startup.phase(f"sprites: {companion_name}"):
+            self.animations = self._loadSprites(companion_name)
 
         # Animation control
         self.animation: str = None
@@ -28,53 +49,32 @@ class SpriteLabel(QLabel):
         self.animator = QTimer()
         self.animator.timeout.connect(self._playAnimation)
 
-    @staticmethod
-    def _is_fully_transparent(qimage: QImage) -> bool:
-        """
-        Checks if all pixels in the image are fully transparent
-        (alpha channel = 0)
-
-        Args:
-            qimage (QImage): Image to check
-
-        Returns:
-            bool: True if image is fully transparent, False otherwise
-
-        Notes:
-            - This function could be optimized using NumPy,
-            but is that really necessary for this use case
-            with a few low-resolution frames?
-        """
-        image = qimage.convertToFormat(QImage.Format.Format_RGBA8888)
-        
-        # Get pointer to raw bytes of the image
-        ptr = image.constBits()
-
-        # RGBA = 4 bytes per pixel
-        ptr.setsize(image.width() * image.height() * 4)
-
-        data = memoryview(ptr)
-        # Check if all alpha channels are zero
-        for i in range(3, len(data), 4):
-            if data[i] != 0:
-                return False
-        return True
-    
     def _loadSprites(self, companion_name: str) -> dict:
         """
-        Loads all sprites from .png file
+        Loads all sprites from .qpal package or .png file
 
         Args:
-            companion_name (str): Name of companion folder
+            companion_name (str): Name of companion package or folder
         
         Returns:
             dict: Dictionary with frames, alpha masks and corresponding mirrored frames
         """
-        assets_dir = PathManager.get_companions_dir() / companion_name / "assets"
-        static = QPixmap(str(assets_dir / "sprite_static.png"))
+        package = open_package(companion_name)
+
+        if package:
+            static = QPixmap.fromImage(package.image("static"))
+            sheet = package.image("atlas")
+            # Compiled metadata, no need to scan the sheet
+            metadata = package.manifest["animations"]
+        else:
+            assets_dir = PathManager.get_companions_dir() / companion_name / "assets"
+            static = QPixmap(str(assets_dir / "sprite_static.png"))
+            # Compiled metadata when it's up to date, raw one otherwise
+            sheet, metadata = load_sheet(assets_dir)
 
         # Size of sprite frame
         frame_w, frame_h = static.size().width(), static.size().height()
+        scale = companion_settings.model_scale
 
         if companion_settings.model_scale != 1:
             static = static.scaled(
@@ -84,36 +84,25 @@ class SpriteLabel(QLabel):
 
         self.setFixedSize(static.width(), static.height())
         self.setPixmap(static)
+        self._bounds = self.rect()
 
         sprites = {}
+        # Identical frames (by content hash) share pixmaps
+        shared_pixmaps = {}
 
-        with open(assets_dir / "sprites_metadata.json", "r") as f:
-            metadata = json.load(f)
-
-        sheet = QImage(str(assets_dir / "sprites_sheet.png"))
         for key, value in metadata.items():
             # === Collecting frames for animation ===
             frames = []
-            for col in range(sheet.width() // frame_w):
-                frame = sheet.copy(
-                    col * frame_w,
-                    (value["row"] - 1) * frame_h,
-                    frame_w,
-                    frame_h
-                )
-                
-                # Check if frame is fully transparent
-                # and treat it like it's the last frame
-                if self._is_fully_transparent(frame):
-                    break
-
+            # Without known frame count, first fully
+            # transparent frame is treated like the last one
+            for frame in iter_frames(sheet, value["row"], frame_w, frame_h, value.get("n_frames")):
                 if companion_settings.model_scale != 1:
                     frame = frame.scaled(
                         int(frame.width() * companion_settings.model_scale),
                         int(frame.height() * companion_settings.model_scale)
                     )
                 
-                frames.append(frame)
+                frames.append(frame.convertToFormat(FRAME_FORMAT))
             
             # === Creating title for animation ===
             sprites[key] = {}
@@ -123,24 +112,97 @@ class SpriteLabel(QLabel):
             sprites[key]["frames"] = {1: [], -1: []}
             # Alpha masks to determine interactive area of a sprite
             sprites[key]["alphas"] = {1: [], -1: []}
+            # Bounding rects of visible pixels, to repaint only what changes
+            sprites[key]["bounds"] = {1: [], -1: []}
 
             # === Creating two directions and alpha masks for animation ===
-            for frame in frames:
+            compiled_frames = value.get("frames")
+            for frame_id, frame in enumerate(frames):
+                if compiled_frames:
+                    compiled = compiled_frames[frame_id]
+                    if compiled["hash"] not in shared_pixmaps:
+                        shared_pixmaps[compiled["hash"]] = (
+                            QPixmap.fromImage(frame),
+                            QPixmap.fromImage(frame.transformed(QTransform().scale(-1, 1)))
+                        )
+                    pixmap, mirrored_pixmap = shared_pixmaps[compiled["hash"]]
+
+                    # Masks are precomputed, only scaled here
+                    sprites[key]["frames"][1].append(pixmap)
+                    sprites[key]["alphas"][1].append(mask_region(compiled["mask"], scale))
+                    sprites[key]["frames"][-1].append(mirrored_pixmap)
+                    sprites[key]["alphas"][-1].append(mask_region(compiled["mask"], scale, frame_w))
+                    continue
+
+                # Same mask rule as compiled metadata, frame is already scaled
+                mask = frame_mask(frame)
                 sprites[key]["frames"][1].append(QPixmap.fromImage(frame))
-                sprites[key]["alphas"][1].append(QBitmap.fromImage(frame.createAlphaMask()))
+                sprites[key]["alphas"][1].append(mask_region(mask))
                 
                 mirrored_frame = frame.transformed(QTransform().scale(-1, 1))
                 sprites[key]["frames"][-1].append(QPixmap.fromImage(mirrored_frame))
-                sprites[key]["alphas"][-1].append(QBitmap.fromImage(mirrored_frame.createAlphaMask()))
+                sprites[key]["alphas"][-1].append(mask_region(mask, mirror_width=frame.width()))
+
+            for direction in (1, -1):
+                sprites[key]["bounds"][direction] = [
+                    alpha.boundingRect() for alpha in sprites[key]["alphas"][direction]
+                ]
+
+        # Memory held by decoded frames, shared pixmaps counted once
+        unique = {static.cacheKey(): static}
+        for sprite in sprites.values():
+            for pixmaps in sprite["frames"].values():
+                unique.update((pixmap.cacheKey(), pixmap) for pixmap in pixmaps)
+        self.store_bytes = sum(p.width() * p.height() * p.depth() // 8 for p in unique.values())
+        metrics.adjust_gauge("sprite_store_bytes", self.store_bytes)
         
         return sprites
 
-    def setSprite(self, animation: str, frame_id: int) -> None:
-        frame = self.animations[animation]["frames"][self.direction][frame_id]
-        alpha = self.animations[animation]["alphas"][self.direction][frame_id]
+    def pixmap(self) -> QPixmap:
+        return self._pixmap
+
+    def setPixmap(self, pixmap: QPixmap) -> None:
+        self._pixmap = pixmap
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = event.rect()
+        painter.drawPixmap(rect, self._pixmap, rect)
+        painter.end()
+        # Startup ends with the first frame actually on screen
+        startup.mark_first_frame()
 
-        self.setPixmap(frame)
-        self.parentWidget().setMask(alpha)
+    def isCulled(self) -> bool:
+        return self._culled
+
+    def setCulled(self, culled: bool) -> None:
+        if culled == self._culled:
+            return
+        self._culled = culled
+        # Catch up with the frame animation has reached meanwhile
+        if not culled and self._current:
+            self.setSprite(*self._current)
+
+    def setSprite(self, animation: str, frame_id: int) -> None:
+        self._current = (animation, frame_id)
+        if self._culled:
+            metrics.incr("sprite_frames_culled")
+            return
+
+        sprite = self.animations[animation]
+        frame = sprite["frames"][self.direction][frame_id]
+        alpha = sprite["alphas"][self.direction][frame_id]
+        bounds = sprite["bounds"][self.direction][frame_id]
+
+        if frame.cacheKey() != self._pixmap.cacheKey():
+            self._pixmap = frame
+            # Old pixels have to be cleared, new ones drawn
+            self.update(self._bounds.united(bounds))
+            self._bounds = bounds
+            self.parentWidget().setMask(alpha)
+            metrics.incr("sprite_frames_drawn")
+            metrics.incr("mask_updates")
     
     def _playAnimation(self) -> None:
         """
@@ -162,6 +224,7 @@ class SpriteLabel(QLabel):
 
         curr_frame_id = self.frame_id % (animation["n_frames"])
         self.setSprite(self.animation, curr_frame_id)
+        metrics.incr("animation_frames")
 
         # Set duration for current frame
         self.animator.setInterval(animation["duration"])
@@ -7,35 +7,55 @@ from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QMessageBox
 from PyQt6.QtGui import QIcon, QAction
 
 # Custom modules
-from modules.core import PathManager, lang_
+from modules.core import PathManager, lang_, startup
 from modules.settings import app_settings
 from modules.companion_base import Companion
-from .settings_window import SettingsWindow
+from modules.services import PlatformWatcher, FullscreenWatcher, ActivityGovernor, DialogueService
+from modules.services.profiler_capture import ProfilerCapture
 
 
 
 class TrayApplication(QApplication):
     def __init__(self, argv):
-        super().__init__(argv)
+        with startup.phase("qt application"):
+            super().__init__(argv)
 
         # Prevent QApplication from quitting when no window is visible
         self.setQuitOnLastWindowClosed(False)
         
         # Initialize tray
-        self.tray = QSystemTrayIcon()
+        with startup.phase("tray"):
+            self.tray = QSystemTrayIcon()
 
-        self.tray.setIcon(QIcon(str(PathManager.get_icon_path())))
-        self.tray.setVisible(True)
+            self.tray.setIcon(QIcon(str(PathManager.get_icon_path())))
+            self.tray.setVisible(True)
 
-        self.tray.setContextMenu(self._buildTrayContextMenu())
+            self.tray.setContextMenu(self._buildTrayContextMenu())
 
-        # Initialize settings window
-        self.settings_window = SettingsWindow()
+        with startup.phase("platform services"):
+            # Push screen and work area changes to companions
+            self.platform_watcher = PlatformWatcher()
+
+            # Step aside while games and videos are fullscreen
+            self.fullscreen_watcher = FullscreenWatcher()
+            self.fullscreen_watcher.signalFullscreenChanged.connect(self._onFullscreenChanged)
+
+            # Slow down while nobody is at the computer
+            self.activity_governor = ActivityGovernor(app_settings.idle_threshold)
+            self.activity_governor.signalIdleChanged.connect(self._onIdleChanged)
+
+        # Settings window is built when first opened
+        self.settings_window = None
+
+        # Profile capture for bug reports, works in frozen builds too
+        self.profiler = ProfilerCapture(self)
+        self.profiler.signalFinished.connect(self._onProfileFinished)
 
         # Initialize companion window
         self.companion = None
         if app_settings.companion_run_on_launch:
-            self.recallCompanion()
+            with startup.phase("companion"):
+                self.recallCompanion()
 
     def _buildTrayContextMenu(self):
         tray_menu = QMenu()
@@ -54,6 +74,14 @@ class TrayApplication(QApplication):
 
         tray_menu.addSeparator()
 
+        # TRANSLATORS: Text in tray menu to record a performance profile
+        # for a bug report, the capture takes 10 seconds
+        self.profileAction = QAction(lang_("capture_profile"), self.tray)
+        self.profileAction.triggered.connect(self.captureProfile)
+        tray_menu.addAction(self.profileAction)
+
+        tray_menu.addSeparator()
+
         # TRANSLATORS: Text in tray menu to quit from app
         exitAction = QAction(lang_("quit"), self.tray)
         exitAction.triggered.connect(self.quitApp)
@@ -62,10 +90,28 @@ class TrayApplication(QApplication):
         return tray_menu
 
     def showSettings(self):
+        if self.settings_window is None:
+            # Imported on demand, it's not needed for startup
+            from .settings_window import SettingsWindow
+            self.settings_window = SettingsWindow()
+
         self.settings_window.show()             # Makes window visible
         self.settings_window.raise_()           # Brings window to top
         self.settings_window.activateWindow()   # Requests focus for window
 
+    def captureProfile(self):
+        trees = {}
+        if self.companion:
+            trees[self.companion.name] = self.companion.behavior
+        self.profileAction.setEnabled(False)
+        self.profiler.start(trees, duration_s=10)
+
+    def _onProfileFinished(self, output):
+        self.profileAction.setEnabled(True)
+        # TRANSLATORS: Tray notification after a performance profile is written,
+        # {path} is the directory with the results
+        self.tray.showMessage("QutyPal", lang_("profile_saved").format(path=output))
+
     def recallCompanion(self):
         # Temporary stupid error handling, just to have something working
         # TODO: Rewrite error handling
@@ -77,6 +123,9 @@ class TrayApplication(QApplication):
                 self.companion.signalDestroyRequested.connect(self.releaseCompanion)
                 self.companion.signalQuitAppRequested.connect(self.quitApp)
                 self.companion.start_activity()
+                if self.fullscreen_watcher.isActive():
+                    self.companion.suspend()
+                self.companion.set_low_power(self.activity_governor.isIdle())
         except Exception:
             # Console output
             self.show_companion_error(
@@ -84,6 +133,18 @@ class TrayApplication(QApplication):
                 "".join(traceback.format_exception(*sys.exc_info())),
             )
 
+    def _onFullscreenChanged(self, active: bool):
+        if not self.companion:
+            return
+        if active:
+            self.companion.suspend()
+        else:
+            self.companion.resume()
+
+    def _onIdleChanged(self, idle: bool):
+        if self.companion:
+            self.companion.set_low_power(idle)
+
     @staticmethod
     def show_companion_error(title: str, text: str):
         # For console output
@@ -98,17 +159,21 @@ class TrayApplication(QApplication):
 
     def releaseCompanion(self):
         print("Releasing companion")
-        self.companion.stop_activity()
-        self.companion._window.closeWindow()
+        self.companion.release()
         self.companion.signalDestroyRequested.disconnect(self.releaseCompanion)
         self.companion.signalQuitAppRequested.disconnect(self.quitApp)
         self.companion = None
 
     def quitApp(self):        
+        # Write what was captured so far
+        self.profiler.stop()
         # Close explicitly in case of cleanup logic
         if self.companion:
             self.releaseCompanion()
-        self.settings_window.close()
+        if self.settings_window:
+            self.settings_window.close()
+        # Don't wait for replies in progress
+        DialogueService.instance().shutdown()
         
         print("Quitting")
         